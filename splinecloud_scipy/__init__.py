@@ -1,4 +1,8 @@
-from .api_client import load_spline, load_subset, load_spline_surface, SPLINECLOUD_API_URL, SplineSurface
+from .api_client import load_spline, load_subset, load_spline_surface, SPLINECLOUD_API_URL, SplineCurve, SplineSurface, SplineCloudClient, SubsetLoadError
+from .api_client import load_spline_async, load_subset_async, load_spline_surface_async, AsyncSplineCloudClient
+from .api_client import load_splines, load_spline_surfaces, BulkLoadResult
+from .http_cache import ResponseCache, CacheMissError
+from .subset_table import SubsetTable
 from .parametric_spline import ParametricUnivariateSpline
 from .parametric_spline_surface import ParametricBivariateSpline
-from .piecewise_polynomial import PPolyInvertible
\ No newline at end of file
+from .piecewise_polynomial import PPolyInvertible, IntervalIndex
\ No newline at end of file
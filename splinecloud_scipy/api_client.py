@@ -1,12 +1,143 @@
 # -*- coding: utf-8 -*-
+import asyncio
+import threading
 import requests, json
 import numpy as np
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .parametric_spline import ParametricUnivariateSpline
 from .parametric_spline_surface import ParametricBivariateSpline
+from .http_cache import ResponseCache, CacheMissError
+from .subset_table import SubsetTable
+from .subset_stream import read_subset_table, CHUNK_SIZE
 
 
 SPLINECLOUD_API_URL = "https://splinecloud.com/api"
+DEFAULT_TIMEOUT = (5.0, 30.0)   # (connect, read) seconds
+DEFAULT_MAX_WORKERS = 8         # concurrent requests when loading several items
+DEFAULT_POOL_MAXSIZE = 64       # pooled connections per host, also the asyncio concurrency
+
+
+class SubsetLoadError(Exception):
+    """
+    Raised when one or more subsets of a surface could not be loaded.
+
+    Attributes
+    ----------
+    errors : dict
+        Exception raised for each failed subset uid.
+    results : list
+        Loaded (columns, table) tuples in `subset_uids` order, with None
+        in place of the failed subsets.
+    """
+    def __init__(self, errors, results):
+        self.errors = errors
+        self.results = results
+        details = "; ".join("{}: {!r}".format(uid, exc) for uid, exc in errors.items())
+        super().__init__("Failed to load {} of {} subsets ({})".format(
+            len(errors), len(results), details))
+
+
+class BulkLoadResult(Mapping):
+    """
+    Read-only mapping of ids (or URLs) to the objects loaded by a bulk
+    loader such as SplineCloudClient.load_splines.
+
+    Ids that failed to load are absent from the mapping and listed in
+    `errors`. With lazy construction the fetched responses are kept and
+    each object is built on first access; construction errors are then
+    raised by that access.
+
+    Attributes
+    ----------
+    errors : dict
+        Exception raised for each failed id.
+    """
+    def __init__(self, items, errors):
+        self._items = items
+        self.errors = errors
+
+    def __getitem__(self, key):
+        item = self._items[key]
+        if isinstance(item, _Deferred):
+            return item.get()
+
+        return item
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __repr__(self):
+        return "<{} loaded={} failed={}>".format(
+            type(self).__name__, len(self._items), len(self.errors))
+
+
+class _Deferred:
+    """Build an object from a fetched payload once, on first request."""
+
+    def __init__(self, build, payload):
+        self._build = build
+        self._payload = payload
+        self._value = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        with self._lock:
+            if self._build is not None:
+                self._value = self._build(self._payload)
+                self._build = self._payload = None
+
+        return self._value
+
+
+class SplineCurve(ParametricUnivariateSpline):
+    """
+    An extension of ParametricUnivariateSpline that keeps the SplineCloud
+    identifiers of a curve and loads the data subset it was fitted to.
+    """
+    def __init__(self, data, client=None):
+        curve_params = data['spline']
+        t = np.array(curve_params['t'])
+        c = np.array(curve_params['c'])
+        tcck = t, c[:, 0], c[:, 1], curve_params['k']
+
+        log_x = data['scale_x'] == "Logarithmic"
+        log_y = data['scale_y'] == "Logarithmic"
+
+        super().__init__(tcck, log_x=log_x, log_y=log_y)
+
+        self._set_metadata(data)
+        self.client = client
+
+    def _get_metadata(self):
+        return {"uid": self.uid, "name": self.name, "subset_uid": self.subset_uid}
+
+    def _set_metadata(self, data):
+        self.uid = data.get("uid")
+        self.name = data.get("name")
+        self.subset_uid = data.get("subset_uid")
+        self.client = None
+
+    def load_data(self):
+        """
+        Load the data subset the curve was fitted to.
+
+        Returns
+        -------
+        columns : list of str
+        table : ndarray
+        """
+        if self.subset_uid is None:
+            raise ValueError("Curve {} has no associated data subset".format(self.uid))
+
+        loader = self.client.load_subset if self.client is not None else load_subset
+        return loader(self.subset_uid)
 
 
 class SplineSurface(ParametricBivariateSpline):
@@ -14,7 +145,7 @@ class SplineSurface(ParametricBivariateSpline):
     An extension of ParametricBivariateSpline that handles metadata
     specific to the SplineCloud API.
     """
-    def __init__(self, data):
+    def __init__(self, data, client=None):
         sp = data["spline"]
         cp = np.array(sp["cp"], dtype=float)   # (nu, nv, 3)
         w  = np.array(sp["w"],  dtype=float)   # (nu, nv)
@@ -32,6 +163,24 @@ class SplineSurface(ParametricBivariateSpline):
             log_x1=log_x1, log_x2=log_x2, log_y=log_y,
         )
 
+        self._set_metadata(data)
+        self.client = client
+
+    def _get_metadata(self):
+        return {
+            "uid": self.uid,
+            "name": self.name,
+            "description": self.description,
+            "surface_type": self.surface_type,
+            "subset_uids": self.subset_uids,
+            "x2_values": self.x2_values,
+            "curve_uids": self.curve_uids,
+            "relation_uid": self.relation_uid,
+            "relation_name": self.relation_name,
+            "labels": {"x1": self.x1_label, "x2": self.x2_label, "y": self.y_label},
+        }
+
+    def _set_metadata(self, data):
         # Identification and Metadata
         self.uid = data.get("uid")
         self.name = data.get("name")
@@ -52,121 +201,537 @@ class SplineSurface(ParametricBivariateSpline):
         self.y_label  = labels.get("y")
 
         self.subsets = []
+        self.client = None
 
-    def load_subsets(self):
+    def load_subsets(self, max_workers=DEFAULT_MAX_WORKERS):
         """
         Load datasets (subsets) associated with this surface from the API.
         
-        This method fetches all subsets identified by `subset_uids` and caches 
-        them in `self.subsets` for subsequent calls.
+        Subsets identified by `subset_uids` are fetched concurrently by a
+        bounded pool of worker threads and cached in `self.subsets` for
+        subsequent calls.
+
+        Parameters
+        ----------
+        max_workers : int
+            Maximum number of subsets requested at the same time.
 
         Returns
         -------
         list of tuples
-            A list of (columns, table) tuples, where each tuple represents 
-            a loaded subset.
+            A list of (columns, table) tuples in the order of `subset_uids`,
+            so that they line up with `x2_values`.
+
+        Raises
+        ------
+        SubsetLoadError
+            If any subset failed to load, after all requests have finished.
+            It lists every failure and carries the subsets that did load.
         """
         if self.subsets:
             return self.subsets
         
-        self.subsets = [load_subset(uid) for uid in self.subset_uids]
+        loader = self.client.load_subset if self.client is not None else load_subset
+        uids = list(self.subset_uids)
+        if not uids:
+            return self.subsets
+
+        def _load(uid):
+            try:
+                return loader(uid), None
+            except Exception as exc:
+                return None, exc
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(uids)))) as pool:
+            results = list(pool.map(_load, uids))
+
+        self.subsets = gather_subsets(uids, results)
         return self.subsets
 
-    def load_data(self):
+    async def load_subsets_async(self, semaphore=None, max_concurrency=DEFAULT_MAX_WORKERS):
+        """
+        Asynchronous counterpart of load_subsets.
+
+        Parameters
+        ----------
+        semaphore : asyncio.Semaphore, optional
+            Caller-supplied semaphore bounding concurrent requests; shared
+            with other fetches on the same event loop.
+        max_concurrency : int
+            Limit used when no semaphore is given.
+
+        Returns
+        -------
+        list of tuples
+            (columns, table) tuples in the order of `subset_uids`.
+
+        Raises
+        ------
+        SubsetLoadError
+            If any subset failed to load.
+        """
+        if self.subsets:
+            return self.subsets
+
+        uids = list(self.subset_uids)
+        if not uids:
+            return self.subsets
+
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max_concurrency)
+        client = self.client if self.client is not None else get_default_client()
+        aclient = client.async_client
+
+        async def _load(uid):
+            try:
+                return await aclient.load_subset(uid, semaphore=semaphore), None
+            except Exception as exc:
+                return None, exc
+
+        results = await asyncio.gather(*(_load(uid) for uid in uids))
+
+        self.subsets = gather_subsets(uids, results)
+        return self.subsets
+
+    def load_data(self, per_subset=False):
         """
         Load and assemble raw data points from all associated subsets.
         
         Each subset contains (x1, y) data points. The x2 coordinate for
         each subset is taken from `x2_values`.
 
+        Parameters
+        ----------
+        per_subset : bool
+            Return the points of each subset separately as views into the
+            loaded subset tables instead of copying them into one array.
+
         Returns
         -------
         labels : list of str
             A list of [x1, x2, y] coordinate labels.
-        data : ndarray
-            An (N, 3) array of collected data points.
+        data : ndarray or list of tuples
+            An (N, 3) array of collected data points, or with `per_subset`
+            an (x1, x2, y) tuple of 1-D arrays per subset. x2 is a read-only
+            broadcast of the subset's x2 value.
         """
         if not self.subsets:
             self.load_subsets()
-        
-        data = []
-        for i, item in enumerate(self.subsets):
-            subset_data = item[1]
-            for point in subset_data:
-                data.append([point[0], self.x2_values[i], point[1]])
-        
-        return [self.x1_label, self.x2_label, self.y_label], np.array(data)
+
+        labels = [self.x1_label, self.x2_label, self.y_label]
+        tables = [item[1] for item in self.subsets]
+
+        if per_subset:
+            return labels, [
+                (table[:, 0], np.broadcast_to(self.x2_values[i], table.shape[:1]), table[:, 1])
+                for i, table in enumerate(tables)
+            ]
+
+        sizes = [len(table) for table in tables]
+        dtype = np.result_type(np.float64, *(table.dtype for table in tables))
+        data = np.empty((sum(sizes), 3), dtype=dtype)
+
+        start = 0
+        for i, (table, size) in enumerate(zip(tables, sizes)):
+            block = data[start:start + size]
+            block[:, 0] = table[:, 0]
+            block[:, 1] = self.x2_values[i]
+            block[:, 2] = table[:, 1]
+            start += size
+
+        return labels, data
 
 
 # =============================================================================
 # HELPERS
 # =============================================================================
 
-def fill_array(table, subset, columns, num_rows):
-    for ci, col_name in enumerate(columns):
-        for ri in range(num_rows):
-            table[ri, ci] = subset[col_name][ri]
+def parse_subset(payload, columnar=False):
+    """
+    Convert a decoded subset response into a SubsetTable, or into the
+    (columns, table) pair when columnar is False.
+    """
+    table = SubsetTable.from_json(payload['table'])
+
+    return table if columnar else table.astuple()
+
+
+def gather_subsets(uids, results):
+    """
+    Collect per-uid (result, exception) outcomes in order, raising a
+    SubsetLoadError that lists every failure if any subset failed.
+    """
+    loaded, errors = [None] * len(uids), {}
+    for i, (uid, (result, exc)) in enumerate(zip(uids, results)):
+        if exc is not None:
+            errors[uid] = exc
+        else:
+            loaded[i] = result
+
+    if errors:
+        raise SubsetLoadError(errors, loaded)
+
+    return loaded
+
+# =============================================================================
+# CLIENT
+# =============================================================================
+
+class SplineCloudClient:
+    """
+    SplineCloud API client that keeps a pooled HTTP session, applies
+    timeouts to every request and retries failed requests with
+    exponential backoff.
+
+    Parameters
+    ----------
+    base_url : str
+        API root used to build URLs from bare ids.
+    timeout : float or (float, float)
+        Connect and read timeouts in seconds, as accepted by requests.
+    retries : int
+        Maximum number of retries for connection errors, read errors and
+        responses with a status in `status_forcelist`.
+    backoff_factor : float
+        Retries sleep backoff_factor * 2 ** (retry - 1) seconds.
+    status_forcelist : iterable of int
+        HTTP statuses that trigger a retry.
+    pool_maxsize : int
+        Maximum number of pooled connections per host. Connections are
+        opened on demand; this also bounds the requests in flight of
+        `async_client`.
+    session : requests.Session, optional
+        Session to use instead of creating a new one.
+    cache : ResponseCache or path, optional
+        On-disk response cache (or its directory) consulted before the
+        network; see ResponseCache for TTL, revalidation, size cap and
+        offline mode.
+    """
+
+    def __init__(self, base_url=SPLINECLOUD_API_URL, timeout=DEFAULT_TIMEOUT, retries=3,
+                 backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                 pool_maxsize=DEFAULT_POOL_MAXSIZE, session=None, cache=None):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        if cache is not None and not isinstance(cache, ResponseCache):
+            cache = ResponseCache(cache)
+        self.cache = cache
+
+        retry = Retry(
+            total=retries, connect=retries, read=retries, status=retries,
+            backoff_factor=backoff_factor, status_forcelist=tuple(status_forcelist),
+            allowed_methods=frozenset(["GET"]), raise_on_status=False,
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_maxsize,
+                              pool_maxsize=pool_maxsize)
+        self.pool_maxsize = pool_maxsize
+
+        self.session = session if session is not None else requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._async_client = None
+        self._async_lock = threading.Lock()
+
+    @property
+    def async_client(self):
+        """AsyncSplineCloudClient over this client, created on first use and shared."""
+        with self._async_lock:
+            if self._async_client is None or self._async_client.closed:
+                self._async_client = AsyncSplineCloudClient(self)
+
+            return self._async_client
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        with self._async_lock:
+            if self._async_client is not None:
+                self._async_client.close()
+                self._async_client = None
+
+        self.session.close()
+
+    def _resolve_url(self, id_or_url, prefix, endpoint, kind):
+        url_split = id_or_url.split("/")
+        if len(url_split) > 1:
+            return id_or_url
+
+        item_id = url_split[-1]
+        if prefix not in item_id or len(item_id) != 16:
+            raise ValueError("Wrong {} id was specified".format(kind))
+
+        return self.base_url + "/{}/{}/".format(endpoint, item_id)
+
+    def get_json(self, url):
+        """
+        GET url and decode its JSON body; raises requests.HTTPError on error
+        statuses. With a cache, fresh entries are served locally and stale
+        ones are revalidated; in offline mode a missing entry raises
+        CacheMissError.
+        """
+        return json.loads(self._get_content(url))
+
+    def _get_content(self, url):
+        cache = self.cache
+        if cache is None:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            return response.content
+
+        entry = cache.get(url)
+        if entry is not None and (cache.offline or cache.is_fresh(entry)):
+            return entry.body
+        if cache.offline:
+            raise CacheMissError("No cached response for {} in offline mode".format(url))
+
+        headers = entry.validators() if entry is not None else {}
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        if response.status_code == 304 and entry is not None:
+            cache.refresh(entry)
+            return entry.body
+
+        response.raise_for_status()
+        cache.put(url, response.content, etag=response.headers.get("ETag"),
+                  last_modified=response.headers.get("Last-Modified"))
+
+        return response.content
+
+    def load_subset(self, subset_id_or_url, columnar=False, stream=False):
+        """
+        Fetch a subset and return its (columns, table) pair, where table is
+        float64 when every column is numeric and object otherwise. With
+        columnar=True a SubsetTable keeping numeric and text columns apart
+        is returned instead.
+
+        With stream=True the response is decoded incrementally into NumPy
+        buffers while it is downloaded, which keeps peak memory close to
+        the size of the table for large subsets. Responses served through
+        the cache are parsed the same way from the cached body.
+        """
+        url = self._resolve_url(subset_id_or_url, "sbt_", "subsets", "subset")
+
+        if stream:
+            table = self._read_subset_stream(url)
+            return table if columnar else table.astuple()
+
+        return parse_subset(self.get_json(url), columnar)
+
+    def _read_subset_stream(self, url):
+        if self.cache is not None:
+            content = self._get_content(url)
+            return read_subset_table(
+                content[i:i + CHUNK_SIZE] for i in range(0, len(content), CHUNK_SIZE))
+
+        with self.session.get(url, timeout=self.timeout, stream=True) as response:
+            response.raise_for_status()
+            return read_subset_table(response.iter_content(CHUNK_SIZE))
+
+    def load_spline(self, curve_id_or_url):
+        url = self._resolve_url(curve_id_or_url, "spl_", "curves", "curve")
+
+        return self._build_spline(self.get_json(url))
+
+    def _build_spline(self, curve):
+        return SplineCurve(curve, client=self)
+
+    def load_spline_surface(self, surface_id_or_url):
+        """
+        Fetch a spline surface from the SplineCloud API and return a
+        SplineSurface bound to this client.
+
+        Accepts either a full URL or a bare surface id (prefix ``srf_``).
+        """
+        url = self._resolve_url(surface_id_or_url, "srf_", "surfaces", "surface")
+
+        return self._build_surface(self.get_json(url))
+
+    def _build_surface(self, data):
+        return SplineSurface(data, client=self)
+
+    def load_splines(self, curve_ids_or_urls, max_workers=DEFAULT_MAX_WORKERS, lazy=False):
+        """
+        Fetch many spline curves in parallel.
+
+        Parameters
+        ----------
+        curve_ids_or_urls : iterable of str
+            Curve ids or URLs; repeated entries, and ids and URLs naming the
+            same curve, are fetched once.
+        max_workers : int
+            Maximum number of concurrent requests.
+        lazy : bool
+            Defer building each ParametricUnivariateSpline to its first access.
+
+        Returns
+        -------
+        BulkLoadResult
+            Mapping of each requested id to its spline, with `errors`
+            holding the exception for every id that failed.
+        """
+        return self._load_many(curve_ids_or_urls, ("spl_", "curves", "curve"),
+                               self._build_spline, max_workers, lazy)
+
+    def load_spline_surfaces(self, surface_ids_or_urls, max_workers=DEFAULT_MAX_WORKERS,
+                             lazy=False):
+        """Fetch many spline surfaces in parallel; see load_splines."""
+        return self._load_many(surface_ids_or_urls, ("srf_", "surfaces", "surface"),
+                               self._build_surface, max_workers, lazy)
+
+    def _load_many(self, ids_or_urls, endpoint, build, max_workers, lazy):
+        urls, errors = {}, {}
+        for item_id in dict.fromkeys(ids_or_urls):
+            try:
+                urls[item_id] = self._resolve_url(item_id, *endpoint)
+            except ValueError as exc:
+                errors[item_id] = exc
+
+        def _load(url):
+            try:
+                payload = self.get_json(url)
+                return (_Deferred(build, payload) if lazy else build(payload)), None
+            except Exception as exc:
+                return None, exc
+
+        unique_urls = list(dict.fromkeys(urls.values()))
+        loaded = {}
+        if unique_urls:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique_urls)))) as pool:
+                loaded = dict(zip(unique_urls, pool.map(_load, unique_urls)))
+
+        items = {}
+        for item_id, url in urls.items():
+            item, error = loaded[url]
+            if error is not None:
+                errors[item_id] = error
+            else:
+                items[item_id] = item
+
+        return BulkLoadResult(items, errors)
+
+
+class AsyncSplineCloudClient:
+    """
+    asyncio interface to the SplineCloud API.
+
+    Requests are executed by a wrapped SplineCloudClient on a dedicated
+    pool of `max_concurrency` threads, independent of the event loop's
+    default executor. The number of threads never exceeds the client's
+    connection pool, so every request in flight keeps its connection.
+    Responses are decoded, parsed and turned into spline objects in those
+    threads by the same code as the blocking loaders, off the event loop.
+    Timeouts, retries and the response cache of the client apply
+    unchanged. Every method accepts an asyncio.Semaphore that bounds the
+    number of requests in flight.
+
+    Use `SplineCloudClient.async_client` to share one instance, and its
+    threads, between all callers of a client.
+
+    Parameters
+    ----------
+    client : SplineCloudClient, optional
+        Blocking client performing the requests; the default client if None.
+    max_concurrency : int, optional
+        Maximum number of requests in flight, capped at and defaulting to
+        the client's `pool_maxsize`.
+    """
+
+    def __init__(self, client=None, max_concurrency=None):
+        self.client = client if client is not None else get_default_client()
+        pool_maxsize = self.client.pool_maxsize
+        if max_concurrency is None or max_concurrency > pool_maxsize:
+            max_concurrency = pool_maxsize
+
+        self.max_concurrency = max_concurrency
+        self.closed = False
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency,
+                                            thread_name_prefix="splinecloud-async")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Release the worker threads; the wrapped client stays open."""
+        self.closed = True
+        self._executor.shutdown(wait=False)
+
+    async def _call(self, semaphore, func, *args):
+        loop = asyncio.get_running_loop()
+        if semaphore is None:
+            return await loop.run_in_executor(self._executor, func, *args)
+
+        async with semaphore:
+            return await loop.run_in_executor(self._executor, func, *args)
+
+    async def get_json(self, url, semaphore=None):
+        return await self._call(semaphore, self.client.get_json, url)
+
+    async def load_subset(self, subset_id_or_url, semaphore=None, columnar=False, stream=False):
+        return await self._call(semaphore, self.client.load_subset, subset_id_or_url,
+                                columnar, stream)
+
+    async def load_spline(self, curve_id_or_url, semaphore=None):
+        return await self._call(semaphore, self.client.load_spline, curve_id_or_url)
+
+    async def load_spline_surface(self, surface_id_or_url, semaphore=None):
+        return await self._call(semaphore, self.client.load_spline_surface, surface_id_or_url)
+
+
+_default_client = None
+
+
+def get_default_client():
+    """Shared client used by the module-level loaders, created on first use."""
+    global _default_client
+    if _default_client is None:
+        _default_client = SplineCloudClient()
+
+    return _default_client
+
+
+def set_default_client(client):
+    """Replace the client used by the module-level loaders (None resets it)."""
+    global _default_client
+    _default_client = client
+
+
+def get_default_async_client():
+    """Shared asyncio client wrapping the default client, created on first use."""
+    return get_default_client().async_client
+
 
 # =============================================================================
 # MAIN CLIENT FUNCTIONS
 # =============================================================================
 
-def load_subset(subset_id_or_url):
-    url_split = subset_id_or_url.split("/")
-    if len(url_split) > 1:
-        url = subset_id_or_url
-    else:
-        subset_id = url_split[-1]
-        if "sbt_" not in subset_id or len(subset_id) != 16:
-            raise ValueError("Wrong subset id was specified")
-        url = SPLINECLOUD_API_URL + "/subsets/{}/".format(subset_id)
-
-    response = requests.get(url)
-    subset_raw = json.loads(response.content)['table']
-    columns = list(subset_raw.keys())
-
-    # Treat all column data as ordered sequences, ignoring any index keys
-    subset = {
-        col: list(vals.values()) if isinstance(vals, dict) else vals
-        for col, vals in subset_raw.items()
-    }
-
-    num_rows = len(list(subset.values())[0])
-    table = np.zeros((num_rows, len(columns)))
-    try:
-        fill_array(table, subset, columns, num_rows)
-    except ValueError:
-        table = np.empty((num_rows, len(columns)), dtype=object)
-        fill_array(table, subset, columns, num_rows)
-
-    return columns, table
-        
-        
+def load_subset(subset_id_or_url, columnar=False, stream=False):
+    return get_default_client().load_subset(subset_id_or_url, columnar, stream)
+
+
 def load_spline(curve_id_or_url):
-    url_split = curve_id_or_url.split("/")
-    if len(url_split) > 1:
-        url = curve_id_or_url
-    else:
-        curve_id = url_split[-1]
-        if "spl_" not in curve_id or len(curve_id) != 16:
-            raise ValueError("Wrong curve id was specified")
-        url = SPLINECLOUD_API_URL+"/curves/{}/".format(curve_id)
+    return get_default_client().load_spline(curve_id_or_url)
 
-    response = requests.get(url)
-    curve = json.loads(response.content)
 
-    curve_params = curve['spline']
-    t = np.array(curve_params['t'])
-    c = np.array(curve_params['c'])    
-    tcck = t, c[:, 0], c[:, 1], curve_params['k']
+def load_splines(curve_ids_or_urls, max_workers=DEFAULT_MAX_WORKERS, lazy=False):
+    return get_default_client().load_splines(curve_ids_or_urls, max_workers, lazy)
 
-    log_x = curve['scale_x'] == "Logarithmic"
-    log_y = curve['scale_y'] == "Logarithmic"
 
-    spline = ParametricUnivariateSpline(tcck, log_x=log_x, log_y=log_y)
-    spline.load_data = lambda: load_subset(curve['subset_uid'])
+def load_spline_surfaces(surface_ids_or_urls, max_workers=DEFAULT_MAX_WORKERS, lazy=False):
+    return get_default_client().load_spline_surfaces(surface_ids_or_urls, max_workers, lazy)
 
-    return spline
 
 def load_spline_surface(surface_id_or_url):
     """
@@ -175,17 +740,16 @@ def load_spline_surface(surface_id_or_url):
 
     Accepts either a full URL or a bare surface id (prefix ``srf_``).
     """
-    url_split = surface_id_or_url.split("/")
-    if len(url_split) > 1:
-        url = surface_id_or_url
-    else:
-        surface_id = url_split[-1]
-        if "srf_" not in surface_id or len(surface_id) != 16:
-            raise ValueError("Wrong surface id was specified")
-        url = SPLINECLOUD_API_URL + "/surfaces/{}/".format(surface_id)
+    return get_default_client().load_spline_surface(surface_id_or_url)
+
+
+async def load_subset_async(subset_id_or_url, semaphore=None, columnar=False, stream=False):
+    return await get_default_async_client().load_subset(subset_id_or_url, semaphore, columnar, stream)
+
+
+async def load_spline_async(curve_id_or_url, semaphore=None):
+    return await get_default_async_client().load_spline(curve_id_or_url, semaphore)
 
-    response = requests.get(url)
-    response.raise_for_status()
-    data = json.loads(response.content)
 
-    return SplineSurface(data)
+async def load_spline_surface_async(surface_id_or_url, semaphore=None):
+    return await get_default_async_client().load_spline_surface(surface_id_or_url, semaphore)
@@ -0,0 +1,63 @@
+import threading
+from collections import OrderedDict, namedtuple
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class EvalCache:
+    """
+    Bounded LRU memo cache for scalar spline evaluations.
+
+    Keys combine the query coordinates, rounded to `digits` significant
+    digits so that inputs differing only by floating point noise share an
+    entry, with the evaluation flags. Safe to share between threads.
+    """
+
+    MISSING = object()
+
+    def __init__(self, maxsize=4096, digits=12):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+
+        self.maxsize = int(maxsize)
+        self.digits = int(digits)
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def key(self, coords, flags=()):
+        return tuple(float("%.*g" % (self.digits, c)) for c in coords) + tuple(flags)
+
+    def get(self, key):
+        """Cached value for key, or EvalCache.MISSING."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return self.MISSING
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
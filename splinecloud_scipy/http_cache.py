@@ -0,0 +1,178 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+
+class CacheMissError(LookupError):
+    """Raised in offline mode when a URL has no cached response."""
+
+
+class CachedResponse:
+    """A cached response body with its validators and storage time."""
+
+    def __init__(self, url, body, etag=None, last_modified=None, stored_at=0.0):
+        self.url = url
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at
+
+    def age(self):
+        return time.time() - self.stored_at
+
+    def validators(self):
+        """Conditional request headers for revalidating this response."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+
+        return headers
+
+
+class ResponseCache:
+    """
+    Persistent on-disk cache of API responses keyed by URL.
+
+    Entries younger than `ttl` seconds are served without touching the
+    network; older ones are revalidated with their ETag / Last-Modified
+    validators. The total size of cached bodies is kept under `max_bytes`
+    by evicting least recently used entries. In offline mode only cached
+    responses are served, whatever their age.
+
+    Each entry is a body file and a small JSON metadata file, both written
+    atomically, so a cache directory can be shared between processes.
+
+    Parameters
+    ----------
+    directory : str or os.PathLike
+        Cache directory; created if missing. "~" is expanded.
+    ttl : float or None
+        Freshness lifetime in seconds. None keeps entries fresh forever,
+        0 revalidates on every request.
+    max_bytes : int
+        Size cap for the cached bodies.
+    offline : bool
+        Serve only from the cache and never use the network.
+    """
+
+    def __init__(self, directory, ttl=3600.0, max_bytes=256 * 2**20, offline=False):
+        self.directory = os.path.expanduser(os.fspath(directory))
+        self.ttl = ttl
+        self.max_bytes = int(max_bytes)
+        self.offline = offline
+        self._lock = threading.Lock()
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _paths(self, url):
+        name = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.directory, name)
+
+        return base + ".body", base + ".meta"
+
+    def is_fresh(self, entry):
+        return self.ttl is None or entry.age() < self.ttl
+
+    def get(self, url):
+        """Cached response for url, or None."""
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+
+        if meta.get("url") != url:
+            return None
+
+        # mark as recently used for eviction
+        try:
+            os.utime(body_path)
+        except OSError:
+            pass
+
+        return CachedResponse(url, body, meta.get("etag"), meta.get("last_modified"),
+                              meta.get("stored_at", 0.0))
+
+    def put(self, url, body, etag=None, last_modified=None):
+        """Store a response body and its validators, then enforce the size cap."""
+        body_path, meta_path = self._paths(url)
+        meta = {"url": url, "etag": etag, "last_modified": last_modified,
+                "stored_at": time.time()}
+
+        with self._lock:
+            self._write_atomic(body_path, body)
+            self._write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+            self._evict()
+
+    def refresh(self, entry):
+        """Restart the TTL of an entry confirmed unchanged by the server (304)."""
+        self.put(entry.url, entry.body, entry.etag, entry.last_modified)
+
+    def delete(self, url):
+        for path in self._paths(url):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def clear(self):
+        with self._lock:
+            for name in os.listdir(self.directory):
+                if name.endswith((".body", ".meta")):
+                    try:
+                        os.remove(os.path.join(self.directory, name))
+                    except OSError:
+                        pass
+
+    def size(self):
+        """Total size in bytes of the cached bodies."""
+        return sum(size for _, size, _ in self._bodies())
+
+    def _bodies(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".body"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+
+        return entries
+
+    def _evict(self):
+        entries = self._bodies()
+        total = sum(size for _, size, _ in entries)
+
+        for path, size, _ in sorted(entries, key=lambda entry: entry[2]):
+            if total <= self.max_bytes:
+                break
+            for victim in (path, path[:-len(".body")] + ".meta"):
+                try:
+                    os.remove(victim)
+                except OSError:
+                    pass
+            total -= size
+
+    def _write_atomic(self, path, data):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
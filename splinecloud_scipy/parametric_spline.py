@@ -1,14 +1,19 @@
+import itertools
 import math
-from typing import Union, Sequence
+from typing import Any, Iterable, Iterator, Optional, Union, Sequence
 import numpy as np
 import scipy.interpolate as si
 
 from .piecewise_polynomial import PPolyInvertible
+from .eval_cache import EvalCache
+from . import serialization
 
 
 Vector1D = Union[list[float], np.ndarray]
 Vector2D = Sequence[Sequence[float]]
 
+_MISSING = object()     # fill value marking the shorter of blocks and weights
+
 
 class ParametricUnivariateSpline:
 
@@ -35,16 +40,118 @@ class ParametricUnivariateSpline:
 
         self.log_x = log_x
         self.log_y = log_y
+        self._eval_cache: Optional[EvalCache] = None
         
         self._build_splines()
         self._build_ppolyrep()
+        self.inverse_table = None
+        self._inverse_table_params = None
+        self._inverse_table_version = None
+
+    # derived structures rebuilt lazily after unpickling
+    _LAZY_ATTRS = frozenset(("knots_norm", "spline_x", "spline_y", "_fused_ppoly",
+                             "inverse_table", "_inverse_table_version"))
+
+    # bumped whenever knots or coefficients are reassigned
+    _coeffs_version = 0
+
+    @property
+    def knots(self) -> np.ndarray:
+        return self._knots
+
+    @knots.setter
+    def knots(self, value:np.ndarray):
+        self._knots = value
+        self._coeffs_version += 1
+
+    @property
+    def coeffs_x(self) -> np.ndarray:
+        return self._coeffs_x
+
+    @coeffs_x.setter
+    def coeffs_x(self, value:np.ndarray):
+        self._coeffs_x = value
+        self._coeffs_version += 1
+
+    @property
+    def coeffs_y(self) -> np.ndarray:
+        return self._coeffs_y
+
+    @coeffs_y.setter
+    def coeffs_y(self, value:np.ndarray):
+        self._coeffs_y = value
+        self._coeffs_version += 1
+
+    def __getstate__(self) -> dict:
+        """Core arrays and settings only; the derived structures are rebuilt on first use"""
+        cache = self._eval_cache
+        return {
+            "k": self.k, "knots": self.knots, "coeffs_x": self.coeffs_x, "coeffs_y": self.coeffs_y,
+            "log_x": self.log_x, "log_y": self.log_y,
+            "inverse_table_params": self._inverse_table_params,
+            "cache": None if cache is None else (cache.maxsize, cache.digits),
+            "metadata": self._get_metadata(),
+        }
+
+    def __setstate__(self, state:dict):
+        self.k = state["k"]
+        self.knots = state["knots"]
+        self.coeffs_x = state["coeffs_x"]
+        self.coeffs_y = state["coeffs_y"]
+        self.log_x = state["log_x"]
+        self.log_y = state["log_y"]
+        self._inverse_table_params = state["inverse_table_params"]
+        self._eval_cache = None if state["cache"] is None else EvalCache(*state["cache"])
+        self._set_metadata(state["metadata"])
+
+    def __getattr__(self, name):
+        # only reached for missing attributes, i.e. derived ones of an unpickled spline
+        if name in ParametricUnivariateSpline._LAZY_ATTRS and "_knots" in self.__dict__:
+            self._build_derived()
+            return self.__dict__[name]
+
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def _build_derived(self):
+        self.knots_norm = self._normalize_knotvector()
+        self._build_splines()
+        self._build_ppolyrep()
+        self.inverse_table = None
+        self._inverse_table_version = None
+        if self._inverse_table_params is not None:
+            self.build_inverse_table(*self._inverse_table_params)
+
+    def _get_metadata(self) -> dict:
+        """JSON-compatible metadata kept by pickling and to_bytes; extended by subclasses"""
+        return {}
+
+    def _set_metadata(self, metadata:dict):
+        """Restore the metadata returned by _get_metadata"""
+
+    def __call__(self, tpoints:Union[float, Vector1D], nu=0):
+        xy = self.eval_parametric(tpoints, nu=nu)[nu]
+        x_points = xy[..., 0]
+        y_points = xy[..., 1]
 
-    def __call__(self, tpoints:Union[float, Vector1D]):
-        x_points = self.spline_x(tpoints)
-        y_points = self.spline_y(tpoints)
-        
         return x_points, y_points
 
+    def eval_parametric(self, tpoints:Union[float, Vector1D], nu=0) -> np.ndarray:
+        """
+        Evaluate x(t), y(t) and their derivatives up to order nu in a single pass:
+        spans are located once and all coefficient columns are applied together.
+
+        Returns:
+        --------
+        ndarray of shape (nu + 1, *np.shape(tpoints), 2)
+        """
+        if nu not in self._fused_ppoly:
+            self._fused_ppoly[nu] = self._build_fused_ppoly(nu)
+
+        xy = self._fused_ppoly[nu](tpoints)
+        xy = xy.reshape(xy.shape[:-1] + (nu + 1, 2))
+
+        return np.moveaxis(xy, -2, 0)
+
     def _normalize_knotvector(self):
         knots = self.knots
         num_knots = len(knots)
@@ -68,44 +175,269 @@ class ParametricUnivariateSpline:
     def _build_ppolyrep(self):
         self.spline_x.ppoly = PPolyInvertible.from_splinefunc(self.spline_x, extrapolate=True)
         self.spline_y.ppoly = PPolyInvertible.from_splinefunc(self.spline_y, extrapolate=True)
+        self._fused_ppoly = {}
+        self.cache_clear()
+
+    def _build_fused_ppoly(self, nu:int) -> si.PPoly:
+        """Vector-valued PPoly with columns [x, y, x', y', ...] up to the derivative order nu"""
+        ppoly_x, ppoly_y = self.spline_x.ppoly, self.spline_y.ppoly
+        order = len(ppoly_x.c)
+
+        columns = []
+        for d in range(nu + 1):
+            for ppoly in (ppoly_x, ppoly_y):
+                c = ppoly.c if d == 0 else si.PPoly.derivative(ppoly, d).c
+                # pad lower degree derivatives with zero leading coefficients
+                columns.append(np.vstack([np.zeros((order - len(c), c.shape[1])), c]))
+
+        return si.PPoly.construct_fast(np.stack(columns, axis=-1), ppoly_x.x, extrapolate=True)
+
+    def build_inverse_table(self, n=256, tol=1e-10):
+        """
+        Precompute a monotone lookup table of x(t) used by eval to answer
+        queries with a table lookup and a single Newton step.
+
+        Parameters:
+        ----------
+        n: int - initial number of table segments
+        tol: float - target bound of the residual |x(t) - x| (in log10 units if log_x)
+
+        Returns:
+        --------
+        InverseTable
+        """
+        self.inverse_table = self.spline_x.ppoly.build_inverse_table(n=n, tol=tol)
+        self._inverse_table_params = n, tol
+        self._inverse_table_version = self._coeffs_version
+        self.cache_clear()
+
+        return self.inverse_table
+
+    def invalidate(self):
+        """
+        Rebuild the piecewise polynomial representation, and the inverse table
+        if one was built, after knots or coefficients were modified in place.
+        Reassigning knots, coeffs_x or coeffs_y rebuilds the inverse table
+        automatically on the next eval.
+        """
+        self.knots_norm = self._normalize_knotvector()
+        self._build_splines()
+        self._build_ppolyrep()
+        if self.inverse_table is not None:
+            self.build_inverse_table(*self._inverse_table_params)
+
+    def _get_inverse_table(self):
+        if self.inverse_table is not None and self._inverse_table_version != self._coeffs_version:
+            # knots or coefficients were reassigned after the table was built
+            self.invalidate()
+
+        return self.inverse_table
+
+    def eval(self, x:Union[float, Vector1D], extrapolate=False, method=None):
+        """
+        Evaluate y(x) by inverting x(t). The root finding method ('analytic',
+        'newton' or 'brentq') defaults to 'analytic' for arrays and 'brentq'
+        for scalars. If an inverse table was built and no method is specified
+        the table is used instead. Scalar results are memoized when the cache
+        is enabled (see enable_cache).
+        """
+        table = self._get_inverse_table() if method is None else None
 
-    def eval(self, x:Union[float, Vector1D], extrapolate=False):
         if hasattr(x, '__iter__'):
             x = np.log10(x) if self.log_x else x
-            t = np.array([self.spline_x.ppoly.evalinv(xi, extrapolate=extrapolate) for xi in x])
+            if table is not None:
+                t = table.evalinv_many(x, extrapolate=extrapolate)
+            else:
+                t = self.spline_x.ppoly.evalinv_many(x, extrapolate=extrapolate, method=method or "analytic")
             y = self.spline_y.ppoly(t, extrapolate=extrapolate)
 
             if self.log_y:
                 y = np.power(10, y)
         
         else:
+            cache = self._eval_cache
+            if cache is not None:
+                key = cache.key((x,), (extrapolate, method))
+                y = cache.get(key)
+                if y is not EvalCache.MISSING:
+                    return y
+
             x = math.log10(x) if self.log_x else x
-            t = self.spline_x.ppoly.evalinv(x, extrapolate=extrapolate)
+            if table is not None:
+                t = table.evalinv(x, extrapolate=extrapolate)
+            else:
+                t = self.spline_x.ppoly.evalinv(x, extrapolate=extrapolate, method=method or "brentq")
             y = float(self.spline_y.ppoly(t, extrapolate=extrapolate))
 
             if self.log_y:
                 y = 10**y
 
+            if cache is not None:
+                cache.put(key, y)
+
         return y
 
+    def enable_cache(self, maxsize=4096, digits=12):
+        """
+        Memoize scalar eval results in a bounded per-instance LRU cache.
+        The cache is cleared whenever the piecewise polynomial
+        representation is rebuilt.
+
+        Parameters:
+        ----------
+        maxsize: int - maximum number of cached results (least recently used are evicted)
+        digits: int - significant digits x is rounded to when forming keys
+        """
+        self._eval_cache = EvalCache(maxsize=maxsize, digits=digits)
+
+    def disable_cache(self):
+        self._eval_cache = None
+
+    def cache_clear(self):
+        """Drop all cached results and reset the hit/miss counters"""
+        if self._eval_cache is not None:
+            self._eval_cache.clear()
+
+    def cache_info(self):
+        """CacheInfo(hits, misses, maxsize, currsize), or None if caching is off"""
+        if self._eval_cache is None:
+            return None
+
+        return self._eval_cache.info()
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the spline into a compact binary container holding the
+        knots, coefficients, degree, log flags and the piecewise polynomial
+        representation, so loading skips rebuilding it.
+        """
+        attrs = {"k": int(self.k), "log_x": bool(self.log_x), "log_y": bool(self.log_y),
+                 "metadata": self._get_metadata()}
+        arrays = {"knots": self.knots, "knots_norm": self.knots_norm,
+                  "coeffs_x": self.coeffs_x, "coeffs_y": self.coeffs_y}
+        for name, ppoly in (("x", self.spline_x.ppoly), ("y", self.spline_y.ppoly)):
+            arrays["ppoly_{}_c".format(name)] = ppoly.c
+            arrays["ppoly_{}_x".format(name)] = ppoly.x
+            arrays["ppoly_{}_pintervals".format(name)] = ppoly.pintervals
+
+        return serialization.pack("curve", type(self).__name__, attrs, arrays)
+
+    @classmethod
+    def from_bytes(cls, data) -> "ParametricUnivariateSpline":
+        """
+        Restore a spline serialized by to_bytes. The piecewise polynomial
+        arrays are views into data (any bytes-like object) rather than
+        copies; the knots and coefficients are copied so they can be edited
+        in place (see invalidate).
+        """
+        _, attrs, arrays = serialization.unpack(data, "curve")
+
+        self = cls.__new__(cls)
+        self.k = attrs["k"]
+        self.knots = arrays["knots"].copy()
+        self.knots_norm = arrays["knots_norm"].copy()
+        self.coeffs_x = arrays["coeffs_x"].copy()
+        self.coeffs_y = arrays["coeffs_y"].copy()
+
+        self.log_x = attrs["log_x"]
+        self.log_y = attrs["log_y"]
+        self._eval_cache = None
+
+        self._build_splines()
+        for name, spline in (("x", self.spline_x), ("y", self.spline_y)):
+            spline.ppoly = PPolyInvertible.construct_fast(
+                arrays["ppoly_{}_c".format(name)], arrays["ppoly_{}_x".format(name)], extrapolate=True)
+            spline.ppoly.set_pintervals(arrays["ppoly_{}_pintervals".format(name)])
+        self._fused_ppoly = {}
+        self.inverse_table = None
+        self._inverse_table_params = None
+        self._inverse_table_version = None
+        self._set_metadata(attrs.get("metadata", {}))
+
+        return self
+
+    def save(self, path):
+        """Write the spline to a file in the to_bytes format"""
+        serialization.save(path, self.to_bytes())
+
+    @classmethod
+    def load(cls, path, mmap=True) -> "ParametricUnivariateSpline":
+        """
+        Read a spline written by save. With mmap the file is memory mapped
+        and its piecewise polynomial arrays are used in place, so opening is
+        nearly free.
+        """
+        return cls.from_bytes(serialization.load(path, mmap=mmap))
+
     def fit_accuracy(self, points:Vector2D, weights=None, method="RMSE") -> float:
-        pnum = len(points)
+        residuals, pnum = self._accumulate_residuals(points, weights, method)
+
+        return self._accuracy_error(residuals, pnum, method)
+
+    def fit_accuracy_chunked(self, blocks:Iterable[Vector2D], weights:Optional[Iterable[Vector1D]]=None,
+                             method="RMSE") -> float:
+        """
+        Evaluate fit accuracy over a stream of point blocks without materializing
+        the whole dataset.
+
+        Parameters:
+        ----------
+        blocks: iterable of (n, 2) point arrays
+        weights: iterable of weight vectors matching the blocks, optional
+        method: str - 'RMSE', 'MSE' or 'MAE'
+
+        Returns:
+        --------
+        float
+
+        Raises:
+        -------
+        ValueError - if weights and blocks differ in number, or there are no points
+        """
+        pairs: Iterator[tuple[Any, Any]]
         if weights is None:
-            weights = np.ones(pnum)
-       
-        x_vals, y_vals = np.array(points).T
-        y_evaluated = self.eval(x_vals, extrapolate=True)
-        
-        if method in ["RMSE", "MSE"]:
-            residuals = [(weights[i] * (y_vals[i] - y_evaluated[i]))**2 for i in range(pnum)]
-        elif method == "MAE":
-            residuals = [weights[i] * abs(y_vals[i] - y_evaluated[i]) for i in range(pnum)]
+            pairs = zip(blocks, itertools.repeat(None))
         else:
+            pairs = itertools.zip_longest(blocks, weights, fillvalue=_MISSING)
+
+        residuals, pnum = 0.0, 0
+        for block, block_weights in pairs:
+            if block is _MISSING or block_weights is _MISSING:
+                raise ValueError("weights must provide one weight vector per block of points")
+
+            block_residuals, block_pnum = self._accumulate_residuals(block, block_weights, method)
+            residuals += block_residuals
+            pnum += block_pnum
+
+        if pnum == 0:
+            raise ValueError("blocks contain no points to evaluate fit accuracy on")
+
+        return self._accuracy_error(residuals, pnum, method)
+
+    def _accumulate_residuals(self, points:Vector2D, weights:Optional[Vector1D], method:str) -> tuple:
+        if method not in ["RMSE", "MSE", "MAE"]:
             raise ValueError(f"Invalid method: {method}. Should be one of 'RMSE', 'MSE', or 'MAE'")
 
+        point_array = np.asarray(points, dtype=float)
+        if len(point_array) == 0:
+            return 0.0, 0
+
+        x_vals, y_vals = point_array.T
+        deviations = y_vals - self.eval(x_vals, extrapolate=True)
+
+        if method == "MAE":
+            deviations = np.abs(deviations)
+            if weights is not None:
+                deviations *= np.asarray(weights, dtype=float)
+            return float(np.sum(deviations)), len(point_array)
+
+        if weights is not None:
+            deviations *= np.asarray(weights, dtype=float)
+
+        return float(np.dot(deviations, deviations)), len(point_array)
+
+    def _accuracy_error(self, residuals:float, pnum:int, method:str) -> float:
         if method == "RMSE":
-            error = math.sqrt(sum(residuals)/pnum)
-        else:
-            error = sum(residuals)/pnum
+            return math.sqrt(residuals/pnum)
 
-        return error
+        return residuals/pnum
@@ -1,6 +1,146 @@
-import requests, json
+import requests, json, bisect, os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 import numpy as np
 from scipy.interpolate import bisplev
+from scipy.spatial import cKDTree
+
+from .eval_cache import EvalCache
+from . import serialization
+
+
+def bspline_basis(knots, k, x, nu=0):
+    """
+    Evaluate the nonzero B-spline basis functions of degree k and their
+    derivatives up to order nu at every point of x in one vectorized pass
+    (Piegl & Tiller, "The NURBS Book", algorithm A2.3).
+
+    Points outside the knot domain are clamped to it, as bisplev does.
+
+    Parameters
+    ----------
+    knots : 1-D ndarray
+        Knot vector.
+    k : int
+        Spline degree.
+    x : 1-D ndarray, shape (n,)
+        Evaluation points.
+    nu : int
+        Highest derivative order.
+
+    Returns
+    -------
+    span : ndarray of int, shape (n,)
+        Knot span index i such that basis functions i-k .. i are nonzero.
+    ders : ndarray, shape (nu + 1, n, k + 1)
+        ders[d, :, r] is the d-th derivative of basis function span - k + r.
+    """
+    x = np.clip(np.asarray(x, dtype=float), knots[k], knots[-(k + 1)])
+    n = len(x)
+    span = np.clip(np.searchsorted(knots, x, side='right') - 1, k, len(knots) - k - 2)
+
+    # ndu: basis functions (upper triangle) and knot differences (lower triangle)
+    ndu = np.zeros((k + 1, k + 1, n))
+    ndu[0, 0] = 1.0
+    left = np.zeros((k + 1, n))
+    right = np.zeros((k + 1, n))
+    for j in range(1, k + 1):
+        left[j] = x - knots[span + 1 - j]
+        right[j] = knots[span + j] - x
+        saved = np.zeros(n)
+        for r in range(j):
+            ndu[j, r] = right[r + 1] + left[j - r]
+            temp = ndu[r, j - 1] / ndu[j, r]
+            ndu[r, j] = saved + right[r + 1] * temp
+            saved = left[j - r] * temp
+        ndu[j, j] = saved
+
+    ders = np.zeros((nu + 1, n, k + 1))
+    ders[0] = ndu[:, k].T
+
+    # derivatives vanish above the spline degree
+    for r in range(k + 1):
+        a = np.zeros((2, k + 1, n))
+        a[0, 0] = 1.0
+        s1, s2 = 0, 1
+        for d in range(1, min(nu, k) + 1):
+            dsum = np.zeros(n)
+            rk, pk = r - d, k - d
+            if r >= d:
+                a[s2, 0] = a[s1, 0] / ndu[pk + 1, rk]
+                dsum += a[s2, 0] * ndu[rk, pk]
+            j1 = 1 if rk >= -1 else -rk
+            j2 = d - 1 if r - 1 <= pk else k - r
+            for j in range(j1, j2 + 1):
+                a[s2, j] = (a[s1, j] - a[s1, j - 1]) / ndu[pk + 1, rk + j]
+                dsum += a[s2, j] * ndu[rk + j, pk]
+            if r <= pk:
+                a[s2, d] = -a[s1, d - 1] / ndu[pk + 1, r]
+                dsum += a[s2, d] * ndu[r, pk]
+            ders[d, :, r] = dsum
+            s1, s2 = s2, s1
+
+    factor = k
+    for d in range(1, min(nu, k) + 1):
+        ders[d] *= factor
+        factor *= k - d
+
+    return span, ders
+
+
+def _bspline_basis_point(knots, k, x, nu=0):
+    """
+    Scalar counterpart of bspline_basis on Python floats, for single-point
+    evaluations where array overheads dominate. knots is a list.
+    """
+    x = min(max(x, knots[k]), knots[-(k + 1)])
+    span = min(max(bisect.bisect_right(knots, x) - 1, k), len(knots) - k - 2)
+
+    ndu = [[0.0] * (k + 1) for _ in range(k + 1)]
+    ndu[0][0] = 1.0
+    left = [0.0] * (k + 1)
+    right = [0.0] * (k + 1)
+    for j in range(1, k + 1):
+        left[j] = x - knots[span + 1 - j]
+        right[j] = knots[span + j] - x
+        saved = 0.0
+        for r in range(j):
+            ndu[j][r] = right[r + 1] + left[j - r]
+            temp = ndu[r][j - 1] / ndu[j][r]
+            ndu[r][j] = saved + right[r + 1] * temp
+            saved = left[j - r] * temp
+        ndu[j][j] = saved
+
+    ders = [[0.0] * (k + 1) for _ in range(nu + 1)]
+    ders[0] = [ndu[r][k] for r in range(k + 1)]
+
+    for r in range(k + 1):
+        a = [[0.0] * (k + 1) for _ in range(2)]
+        a[0][0] = 1.0
+        s1, s2 = 0, 1
+        for d in range(1, min(nu, k) + 1):
+            dsum = 0.0
+            rk, pk = r - d, k - d
+            if r >= d:
+                a[s2][0] = a[s1][0] / ndu[pk + 1][rk]
+                dsum += a[s2][0] * ndu[rk][pk]
+            j1 = 1 if rk >= -1 else -rk
+            j2 = d - 1 if r - 1 <= pk else k - r
+            for j in range(j1, j2 + 1):
+                a[s2][j] = (a[s1][j] - a[s1][j - 1]) / ndu[pk + 1][rk + j]
+                dsum += a[s2][j] * ndu[rk + j][pk]
+            if r <= pk:
+                a[s2][d] = -a[s1][d - 1] / ndu[pk + 1][r]
+                dsum += a[s2][d] * ndu[r][pk]
+            ders[d][r] = dsum
+            s1, s2 = s2, s1
+
+    factor = k
+    for d in range(1, min(nu, k) + 1):
+        ders[d] = [value * factor for value in ders[d]]
+        factor *= k - d
+
+    return span, ders
 
 
 class ParametricBivariateSpline:
@@ -12,7 +152,7 @@ class ParametricBivariateSpline:
     """
 
     def __init__(self, tu, tv, cp, ku, kv, w=None,
-                 log_x1=False, log_x2=False, log_y=False):
+                 log_x1=False, log_x2=False, log_y=False, search_density=1):
         """
         Parameters
         ----------
@@ -26,6 +166,9 @@ class ParametricBivariateSpline:
             NURBS weights (stored for future use; all ≈ 1 in current data).
         log_x1, log_x2, log_y : bool
             Whether each output axis uses a logarithmic scale.
+        search_density : int
+            Number of search grid nodes per knot span along each axis used
+            for Newton initial guesses. Denser grids need fewer iterations.
         """
         cp = np.asarray(cp, dtype=float)
         nu, nv, _ = cp.shape
@@ -36,12 +179,67 @@ class ParametricBivariateSpline:
         self.kv = int(kv)
         self.w = np.asarray(w, dtype=float) if w is not None else np.ones((nu, nv))
         self.log_x1, self.log_x2, self.log_y = log_x1, log_x2, log_y
+        self.search_density = int(search_density)
 
-        self._tck_x1 = (self.tu, self.tv, cp[:, :, 0].ravel(), self.ku, self.kv)
-        self._tck_y  = (self.tu, self.tv, cp[:, :, 1].ravel(), self.ku, self.kv)
-        self._tck_x2 = (self.tu, self.tv, cp[:, :, 2].ravel(), self.ku, self.kv)
+        # control grid with coordinates ordered as [x1, x2, y] for batched evaluation
+        self._cp_grid = np.ascontiguousarray(cp[:, :, [0, 2, 1]])
 
+        self._build_tcks()
         self._build_search_grid()
+        self._boundary_tree = None   # boundary polyline, built on first extrapolation
+        self._eval_cache = None      # opt-in memo cache for scalar evaluations
+
+    # derived structures rebuilt lazily after unpickling
+    _LAZY_ATTRS = frozenset((
+        "_tu_list", "_tv_list", "_tck_x1", "_tck_x2", "_tck_y",
+        "_search_u", "_search_v", "_search_x1", "_search_x2", "_search_y",
+        "_search_nodes_u", "_search_nodes_v", "_search_tree",
+    ))
+
+    def __getstate__(self):
+        """
+        Core arrays and settings only. The tck tuples and the search grid
+        are rebuilt on first use after unpickling, the boundary polyline on
+        first extrapolation, and an enabled cache starts out empty.
+        """
+        cache = self._eval_cache
+        return {
+            "tu": self.tu, "tv": self.tv, "cp_grid": self._cp_grid, "w": self.w,
+            "ku": self.ku, "kv": self.kv,
+            "log_x1": self.log_x1, "log_x2": self.log_x2, "log_y": self.log_y,
+            "search_density": self.search_density,
+            "cache": None if cache is None else (cache.maxsize, cache.digits),
+            "metadata": self._get_metadata(),
+        }
+
+    def __setstate__(self, state):
+        self.tu, self.tv = state["tu"], state["tv"]
+        self._cp_grid = state["cp_grid"]
+        self.w = state["w"]
+        self.ku, self.kv = state["ku"], state["kv"]
+        self.log_x1, self.log_x2, self.log_y = state["log_x1"], state["log_x2"], state["log_y"]
+        self.search_density = state["search_density"]
+
+        self._boundary_tree = None
+        self._eval_cache = None if state["cache"] is None else EvalCache(*state["cache"])
+        self._set_metadata(state["metadata"])
+
+    def __getattr__(self, name):
+        # only reached for missing attributes, i.e. derived ones of an unpickled surface
+        if name in ParametricBivariateSpline._LAZY_ATTRS and "_cp_grid" in self.__dict__:
+            self._build_tcks()
+            self._build_search_grid()
+            return self.__dict__[name]
+
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def _build_tcks(self):
+        """Knot lists and one scipy tck tuple per output coordinate."""
+        self._tu_list, self._tv_list = self.tu.tolist(), self.tv.tolist()
+
+        self._tck_x1 = (self.tu, self.tv, self._cp_grid[:, :, 0].ravel(), self.ku, self.kv)
+        self._tck_x2 = (self.tu, self.tv, self._cp_grid[:, :, 1].ravel(), self.ku, self.kv)
+        self._tck_y  = (self.tu, self.tv, self._cp_grid[:, :, 2].ravel(), self.ku, self.kv)
 
     def __call__(self, u, v):
         """
@@ -78,23 +276,66 @@ class ParametricBivariateSpline:
         
         return x1, x2, y
 
+    def eval_uv(self, u, v, order=0, chunk_size=65536):
+        """
+        Evaluate the surface coordinates and their partial derivatives at
+        scattered parameter pairs (u[i], v[i]) with batched basis functions.
+
+        Values are returned in internal (log-) space, like bisplev.
+
+        Parameters
+        ----------
+        u, v : array-like, shape (n,)
+            Paired parameter values; clamped to the knot domain.
+        order : int
+            Highest partial derivative order along each of u and v.
+        chunk_size : int
+            Number of points processed at once (bounds temporary memory).
+
+        Returns
+        -------
+        D : ndarray, shape (order + 1, order + 1, n, 3)
+            D[a, b, i] = d^(a+b) S / du^a dv^b at (u[i], v[i]) for the
+            coordinates [x1, x2, y].
+        """
+        u = np.atleast_1d(np.asarray(u, dtype=float)).ravel()
+        v = np.atleast_1d(np.asarray(v, dtype=float)).ravel()
+        n = len(u)
+        D = np.empty((order + 1, order + 1, n, 3))
+
+        ru = np.arange(self.ku + 1)
+        rv = np.arange(self.kv + 1)
+        for start in range(0, n, chunk_size):
+            sl = slice(start, start + chunk_size)
+            span_u, Nu = bspline_basis(self.tu, self.ku, u[sl], nu=order)
+            span_v, Nv = bspline_basis(self.tv, self.kv, v[sl], nu=order)
+
+            rows = (span_u - self.ku)[:, None] + ru    # (m, ku+1)
+            cols = (span_v - self.kv)[:, None] + rv    # (m, kv+1)
+            patch = self._cp_grid[rows[:, :, None], cols[:, None, :]]   # (m, ku+1, kv+1, 3)
+
+            tmp = np.einsum('bmq,mpqc->bmpc', Nv, patch)
+            D[:, :, sl] = np.einsum('amp,bmpc->abmc', Nu, tmp)
+
+        return D
+
     def _build_search_grid(self):
         """
-        Pre-evaluate the surface at the centres of all knot spans.
+        Pre-evaluate the surface at the centres of all knot spans
+        (subdivided search_density times along each axis) and index the
+        nodes with a KD-tree for nearest-node lookups.
         Called once at construction; result cached for all eval() calls.
 
         Stores
         ------
-        _search_u  : (Mu,)    u midpoints of each unique u span
-        _search_v  : (Mv,)    v midpoints of each unique v span
+        _search_u  : (Mu,)    u centres of each (sub)span
+        _search_v  : (Mv,)    v centres of each (sub)span
         _search_x1 : (Mu, Mv) physical x1 at each (u_mid, v_mid)
         _search_x2 : (Mu, Mv) physical x2 at each (u_mid, v_mid)
+        _search_tree : cKDTree over the flattened (x1, x2) nodes
         """
-        tu_unique = np.unique(self.tu)
-        tv_unique = np.unique(self.tv)
-
-        self._search_u = (tu_unique[:-1] + tu_unique[1:]) / 2   # (Mu,)
-        self._search_v = (tv_unique[:-1] + tv_unique[1:]) / 2   # (Mv,)
+        self._search_u = self._span_centres(self.tu, self.search_density)   # (Mu,)
+        self._search_v = self._span_centres(self.tv, self.search_density)   # (Mv,)
 
         # bisplev returns (Mu, Mv) grid if Mu, Mv > 1, but may return scalar/1D if they are 1.
         # Ensure result is always (Mu, Mv)
@@ -102,52 +343,143 @@ class ParametricBivariateSpline:
         self._search_x2 = np.atleast_2d(bisplev(self._search_u, self._search_v, self._tck_x2)).reshape(len(self._search_u), len(self._search_v))
         self._search_y  = np.atleast_2d(bisplev(self._search_u, self._search_v, self._tck_y)).reshape(len(self._search_u), len(self._search_v))
 
-    def _bisplev_d2(self, u, v, tck, du=0, dv=0, eps=1e-7):
+        self._index_search_grid()
+
+    def _index_search_grid(self):
+        """Flattened node parameters and KD-tree of the search grid."""
+        self._search_nodes_u = np.repeat(self._search_u, len(self._search_v))
+        self._search_nodes_v = np.tile(self._search_v, len(self._search_u))
+        self._search_tree = cKDTree(np.column_stack([self._search_x1.ravel(), self._search_x2.ravel()]))
+
+    @staticmethod
+    def _span_centres(knots, density):
+        knots_unique = np.unique(knots)
+        offsets = (np.arange(density) + 0.5) / density
+        starts, widths = knots_unique[:-1], np.diff(knots_unique)
+
+        return (starts[:, None] + widths[:, None] * offsets).ravel()
+
+    def _nearest_search_node(self, x1, x2):
         """
-        Evaluate a second-order (or mixed) derivative of a bivariate spline,
-        working around the bisplev constraint that derivative order must be
-        strictly less than the spline degree (dx < kx).
+        Parameters (u, v) of the search grid nodes nearest to the (x1, x2)
+        points given in internal (log-) space.
+        """
+        points = np.column_stack([np.ravel(x1), np.ravel(x2)])
+        best = np.zeros(len(points), dtype=int)
+
+        finite = np.isfinite(points).all(axis=1)
+        if finite.any():
+            best[finite] = self._search_tree.query(points[finite])[1]
 
-        For degree >= 3: uses bisplev directly.
-        For degree == 2: the second derivative is piecewise constant;
-                         computed via finite differences of the first derivative.
-        For degree <= 1: returns 0 (linear or constant spline).
+        return self._search_nodes_u[best], self._search_nodes_v[best]
+
+    def eval_uv_d2(self, u, v):
+        """
+        Value, gradient and Hessian of all three coordinate surfaces at
+        scattered parameter pairs in one pass over the basis functions.
+
+        Derivatives are exact for every degree: second derivatives are
+        piecewise constant for degree 2 and vanish for degree <= 1.
 
         Parameters
         ----------
-        du, dv : int
-            Derivative orders along u and v (each 0, 1, or 2, with du+dv <= 2).
-        """
-        # Pure second derivative w.r.t. u
-        if du == 2 and dv == 0:
-            if self.ku >= 3:
-                return float(bisplev(u, v, tck, dx=2, dy=0))
-            elif self.ku >= 2:
-                fp = float(bisplev(u + eps, v, tck, dx=1, dy=0))
-                fm = float(bisplev(u - eps, v, tck, dx=1, dy=0))
-                return (fp - fm) / (2 * eps)
-            else:
-                return 0.0
-
-        # Pure second derivative w.r.t. v
-        if du == 0 and dv == 2:
-            if self.kv >= 3:
-                return float(bisplev(u, v, tck, dx=0, dy=2))
-            elif self.kv >= 2:
-                fp = float(bisplev(u, v + eps, tck, dx=0, dy=1))
-                fm = float(bisplev(u, v - eps, tck, dx=0, dy=1))
-                return (fp - fm) / (2 * eps)
-            else:
-                return 0.0
+        u, v : float or array-like, shape (n,)
+            Paired parameter values; clamped to the knot domain.
 
-        # Mixed derivative d²/dudv
-        if du == 1 and dv == 1:
-            if self.ku >= 2 and self.kv >= 2:
-                return float(bisplev(u, v, tck, dx=1, dy=1))
-            else:
-                return 0.0
+        Returns
+        -------
+        S   : ndarray, shape (n, 3)     — [x1, x2, y]
+        dS  : ndarray, shape (2, n, 3)  — [d/du, d/dv]
+        d2S : ndarray, shape (3, n, 3)  — [d²/du², d²/dv², d²/dudv]
+
+        The n axis is dropped for scalar u and v.
+        """
+        if np.ndim(u) == 0 and np.ndim(v) == 0:
+            span_u, Nu = _bspline_basis_point(self._tu_list, self.ku, float(u), nu=2)
+            span_v, Nv = _bspline_basis_point(self._tv_list, self.kv, float(v), nu=2)
+            patch = self._cp_grid[span_u - self.ku:span_u + 1, span_v - self.kv:span_v + 1]
+            D = np.einsum('ap,pqc,bq->abc', Nu, patch, Nv)
+        else:
+            D = self.eval_uv(u, v, order=2)
 
-        raise ValueError(f"Unsupported derivative order du={du}, dv={dv}")
+        return D[0, 0], np.stack([D[1, 0], D[0, 1]]), np.stack([D[2, 0], D[0, 2], D[1, 1]])
+
+    # boundary edges in the order the polyline traverses them
+    _BOUNDARY_EDGES = ('u_min', 'v_max', 'u_max', 'v_min')
+
+    def _build_boundary(self, n_edge=100):
+        """
+        Sample the edges of the parameter domain into a closed polyline
+        around the surface footprint and index its vertices with a KD-tree.
+        Called lazily on the first extrapolation; result cached.
+
+        Stores
+        ------
+        _boundary_u, _boundary_v   : (M,) parameters of the polyline vertices
+        _boundary_x1, _boundary_x2 : (M,) internal-space positions of the vertices
+        _boundary_edge : (M,) edge of the segment starting at each vertex,
+                         as an index into _BOUNDARY_EDGES
+        _boundary_tree : cKDTree over the vertex positions
+        """
+        u_min, u_max = self.tu[self.ku],  self.tu[-(self.ku + 1)]
+        v_min, v_max = self.tv[self.kv],  self.tv[-(self.kv + 1)]
+
+        # each edge runs up to, but not including, the next corner
+        u_vals = np.linspace(u_min, u_max, n_edge)[:-1]
+        v_vals = np.linspace(v_min, v_max, n_edge)[:-1]
+        u_back = np.linspace(u_max, u_min, n_edge)[:-1]
+        v_back = np.linspace(v_max, v_min, n_edge)[:-1]
+        m = n_edge - 1
+
+        self._boundary_u = np.concatenate([np.full(m, u_min), u_vals, np.full(m, u_max), u_back])
+        self._boundary_v = np.concatenate([v_vals, np.full(m, v_max), v_back, np.full(m, v_min)])
+        self._boundary_edge = np.repeat(np.arange(4), m)
+
+        S = self.eval_uv(self._boundary_u, self._boundary_v)[0, 0]
+        self._boundary_x1, self._boundary_x2 = S[:, 0], S[:, 1]
+        self._boundary_tree = cKDTree(S[:, :2])
+
+    def _nearest_boundary_point(self, x1, x2):
+        """
+        Nearest point on the cached boundary polyline to the (x1, x2) points
+        given in internal (log-) space.
+
+        Returns
+        -------
+        u, v : ndarray (n,)  — parameters interpolated along the nearest segment
+        edge : ndarray (n,)  — edge of that segment, as an index into _BOUNDARY_EDGES
+        """
+        if self._boundary_tree is None:
+            self._build_boundary()
+
+        x1 = np.atleast_1d(np.asarray(x1, dtype=float)).ravel()
+        x2 = np.atleast_1d(np.asarray(x2, dtype=float)).ravel()
+        n_vertices = len(self._boundary_u)
+
+        points = np.column_stack([x1, x2])
+        vertex = np.zeros(len(points), dtype=int)
+        finite = np.isfinite(points).all(axis=1)
+        if finite.any():
+            vertex[finite] = self._boundary_tree.query(points[finite])[1]
+
+        # project onto the two segments that share the nearest vertex
+        seg = np.stack([(vertex - 1) % n_vertices, vertex], axis=1)      # (n, 2)
+        end = (seg + 1) % n_vertices
+        ax, ay = self._boundary_x1[seg], self._boundary_x2[seg]
+        dx, dy = self._boundary_x1[end] - ax, self._boundary_x2[end] - ay
+        len2 = dx**2 + dy**2
+        s = ((x1[:, None] - ax) * dx + (x2[:, None] - ay) * dy) / np.where(len2 > 0, len2, 1.0)
+        s = np.clip(np.nan_to_num(s), 0.0, 1.0)
+        dist2 = (ax + s * dx - x1[:, None])**2 + (ay + s * dy - x2[:, None])**2
+
+        rows = np.arange(len(points))
+        best = np.argmin(np.nan_to_num(dist2, nan=np.inf), axis=1)
+        seg, end, s = seg[rows, best], end[rows, best], s[rows, best]
+
+        u = self._boundary_u[seg] + s * (self._boundary_u[end] - self._boundary_u[seg])
+        v = self._boundary_v[seg] + s * (self._boundary_v[end] - self._boundary_v[seg])
+
+        return u, v, self._boundary_edge[seg]
 
     def _compute_boundary_point(self, x1, x2):
         """
@@ -169,59 +501,24 @@ class ParametricBivariateSpline:
         u_min, u_max = self.tu[self.ku],  self.tu[-(self.ku + 1)]
         v_min, v_max = self.tv[self.kv],  self.tv[-(self.kv + 1)]
 
-
-        # --- Coarse boundary search --------------------------------------
-        n_edge = 100
-        u_vals = np.linspace(u_min, u_max, n_edge)
-        v_vals = np.linspace(v_min, v_max, n_edge)
-
-        best_dist2 = np.inf
-        best_u, best_v = u_min, v_min
-        best_edge = None
-
-        edges = [
-            ('u_min', np.full(n_edge, u_min), v_vals),
-            ('u_max', np.full(n_edge, u_max), v_vals),
-            ('v_min', u_vals, np.full(n_edge, v_min)),
-            ('v_max', u_vals, np.full(n_edge, v_max)),
-        ]
-
-        for edge_name, u_edge, v_edge in edges:
-            x1_edge = np.array([float(bisplev(ui, vi, self._tck_x1))
-                            for ui, vi in zip(u_edge, v_edge)])
-            x2_edge = np.array([float(bisplev(ui, vi, self._tck_x2))
-                            for ui, vi in zip(u_edge, v_edge)])
-            dist2 = (x1_edge - x1)**2 + (x2_edge - x2)**2
-            idx = np.argmin(dist2)
-            if dist2[idx] < best_dist2:
-                best_dist2 = dist2[idx]
-                best_u, best_v = u_edge[idx], v_edge[idx]
-                best_edge = edge_name
+        # --- Coarse boundary search on the cached polyline ----------------
+        (best_u,), (best_v,), (best_edge,) = self._nearest_boundary_point(x1, x2)
 
         # --- Refine with 1D Newton along the boundary edge ---------------
         u_b, v_b = self._refine_boundary_point(
-            x1, x2, best_u, best_v, best_edge,
+            x1, x2, best_u, best_v, self._BOUNDARY_EDGES[best_edge],
             u_min, u_max, v_min, v_max
         )
 
         # --- Evaluate all derivatives at boundary point ------------------
-        def _eval_derivs(tck, u, v):
-            val   = float(bisplev(u, v, tck))
-            du    = float(bisplev(u, v, tck, dx=1, dy=0))
-            dv    = float(bisplev(u, v, tck, dx=0, dy=1))
-            du2   = self._bisplev_d2(u, v, tck, du=2, dv=0)
-            dv2   = self._bisplev_d2(u, v, tck, du=0, dv=2)
-            dudv  = self._bisplev_d2(u, v, tck, du=1, dv=1)
-            return val, du, dv, du2, dv2, dudv
-
-        x1b, dx1du, dx1dv, d2x1du2, d2x1dv2, d2x1dudv = _eval_derivs(self._tck_x1, u_b, v_b)
-        x2b, dx2du, dx2dv, d2x2du2, d2x2dv2, d2x2dudv = _eval_derivs(self._tck_x2, u_b, v_b)
-        yb,  dydu,  dydv,  d2ydu2,  d2ydv2,  d2ydydv  = _eval_derivs(self._tck_y,  u_b, v_b)
+        S_b, (dSdu, dSdv), (d2Sdu2, d2Sdv2, d2Sdudv) = self.eval_uv_d2(u_b, v_b)
+
+        x1b, x2b = S_b[0], S_b[1]
 
         # --- Solve for (du_ext, dv_ext) to match target (x1, x2) ----------
         # First-order solve: J * [du, dv]^T = [x1 - x1b, x2 - x2b]^T
         # then refine with second-order correction
-        J = np.array([[dx1du, dx1dv], [dx2du, dx2dv]])
+        J = np.array([[dSdu[0], dSdv[0]], [dSdu[1], dSdv[1]]])
         rhs = np.array([x1 - x1b, x2 - x2b])
 
         try:
@@ -231,13 +528,6 @@ class ParametricBivariateSpline:
 
         du_ext, dv_ext = d_params
 
-        S_b     = np.array([x1b,       x2b,       yb      ])
-        dSdu    = np.array([dx1du,     dx2du,     dydu    ])
-        dSdv    = np.array([dx1dv,     dx2dv,     dydv    ])
-        d2Sdu2  = np.array([d2x1du2,   d2x2du2,   d2ydu2  ])
-        d2Sdv2  = np.array([d2x1dv2,   d2x2dv2,   d2ydv2  ])
-        d2Sdudv = np.array([d2x1dudv,  d2x2dudv,  d2ydydv ])
-
         return S_b, dSdu, dSdv, d2Sdu2, d2Sdv2, d2Sdudv, du_ext, dv_ext
 
     def _refine_boundary_point(self, x1, x2, u0, v0, edge,
@@ -248,21 +538,13 @@ class ParametricBivariateSpline:
         """
         u, v = u0, v0
         free_u = edge in ('v_min', 'v_max')   # u is free parameter
+        axis = 0 if free_u else 1             # derivative index of the free parameter
 
         for _ in range(max_iter):
-            x1b = float(bisplev(u, v, self._tck_x1))
-            x2b = float(bisplev(u, v, self._tck_x2))
-
-            if free_u:
-                dx1dt = float(bisplev(u, v, self._tck_x1, dx=1, dy=0))
-                dx2dt = float(bisplev(u, v, self._tck_x2, dx=1, dy=0))
-                d2x1dt2 = self._bisplev_d2(u, v, self._tck_x1, du=2, dv=0)
-                d2x2dt2 = self._bisplev_d2(u, v, self._tck_x2, du=2, dv=0)
-            else:
-                dx1dt = float(bisplev(u, v, self._tck_x1, dx=0, dy=1))
-                dx2dt = float(bisplev(u, v, self._tck_x2, dx=0, dy=1))
-                d2x1dt2 = self._bisplev_d2(u, v, self._tck_x1, du=0, dv=2)
-                d2x2dt2 = self._bisplev_d2(u, v, self._tck_x2, du=0, dv=2)
+            S, dS, d2S = self.eval_uv_d2(u, v)
+            x1b, x2b = S[0], S[1]
+            dx1dt, dx2dt = dS[axis, 0], dS[axis, 1]
+            d2x1dt2, d2x2dt2 = d2S[axis, 0], d2S[axis, 1]
 
             grad = (x1b - x1) * dx1dt + (x2b - x2) * dx2dt
             hess = (dx1dt**2 + dx2dt**2
@@ -274,9 +556,14 @@ class ParametricBivariateSpline:
 
             step = grad / hess
             if free_u:
-                u = np.clip(u - step, u_min, u_max)
+                u_new, v_new = np.clip(u - step, u_min, u_max), v
             else:
-                v = np.clip(v - step, v_min, v_max)
+                u_new, v_new = u, np.clip(v - step, v_min, v_max)
+
+            # stalled against a corner of the parameter domain
+            if u_new == u and v_new == v:
+                break
+            u, v = u_new, v_new
 
         return u, v
 
@@ -378,10 +665,11 @@ class ParametricBivariateSpline:
             g_boundary = np.sqrt(grad_x1x2[0]**2 + grad_x1x2[1]**2)
             steepness = g_boundary / (g_char + 1e-14)
 
-            # Steepness threshold: boundary gradient must not exceed 10x the
-            # surface's characteristic gradient. Self-calibrating — surfaces
-            # with globally steep gradients get a proportionally larger budget.
-            if steepness > 10.0:
+            # Steepness threshold: boundary gradient must not exceed
+            # steepness_threshold times the surface's characteristic gradient.
+            # Self-calibrating — surfaces with globally steep gradients get a
+            # proportionally larger budget.
+            if steepness > steepness_threshold:
                 return _failed
 
         # ----------------------------------------------------------------
@@ -416,6 +704,149 @@ class ParametricBivariateSpline:
 
         return y, (float(grad_x1x2_ext[0]), float(grad_x1x2_ext[1]))
 
+    def _refine_boundary_points(self, x1, x2, u, v, free_u, tol=1e-10, max_iter=50):
+        """
+        Vectorized counterpart of _refine_boundary_point: 1D Newton along
+        the free parameter of each point's boundary edge.
+
+        free_u : ndarray of bool — True where u is the free parameter.
+        """
+        u_min, u_max = self.tu[self.ku], self.tu[-(self.ku + 1)]
+        v_min, v_max = self.tv[self.kv], self.tv[-(self.kv + 1)]
+        u, v = u.copy(), v.copy()
+        axis = np.where(free_u, 0, 1)
+        active = np.ones(len(u), dtype=bool)
+
+        for _ in range(max_iter):
+            idx = np.where(active)[0]
+            if not len(idx):
+                break
+
+            S, dS, d2S = self.eval_uv_d2(u[idx], v[idx])
+            ax, rows = axis[idx], np.arange(len(idx))
+            fx1, fx2 = S[:, 0] - x1[idx], S[:, 1] - x2[idx]
+            dx1dt, dx2dt = dS[ax, rows, 0], dS[ax, rows, 1]
+
+            grad = fx1 * dx1dt + fx2 * dx2dt
+            hess = (dx1dt**2 + dx2dt**2
+                    + fx1 * d2S[ax, rows, 0]
+                    + fx2 * d2S[ax, rows, 1])
+
+            done = (np.abs(hess) < 1e-14) | (np.abs(grad) < tol) | ~np.isfinite(grad)
+            step = np.where(done, 0.0, grad / np.where(done, 1.0, hess))
+
+            fu = free_u[idx]
+            u_new = np.where(fu, np.clip(u[idx] - step, u_min, u_max), u[idx])
+            v_new = np.where(fu, v[idx], np.clip(v[idx] - step, v_min, v_max))
+
+            # stalled against a corner of the parameter domain
+            done |= (u_new == u[idx]) & (v_new == v[idx])
+            u[idx], v[idx] = u_new, v_new
+            active[idx[done]] = False
+
+        return u, v
+
+    def _extrapolate_points(self, x1, x2, compute_gradients=False,
+            limit_distance=False, limit_consistency=False, limit_steepness=False,
+            consistency_threshold=0.5, distance_threshold=0.5, steepness_threshold=10):
+        """
+        Vectorized counterpart of _extrapolate_point for many exterior points:
+        boundary projection, derivative evaluation, second-order Taylor
+        expansion and reliability checks, all in batched form.
+
+        Parameters
+        ----------
+        x1, x2 : 1-D ndarray
+            Target coordinates in internal (log-) space.
+
+        Returns
+        -------
+        y : 1-D ndarray
+            Extrapolated values in physical space, nan where a reliability
+            check rejected the point.
+        (dydx1, dydx2) : 1-D ndarrays, only when compute_gradients=True.
+        """
+        x1 = np.asarray(x1, dtype=float)
+        x2 = np.asarray(x2, dtype=float)
+
+        # --- Boundary projection -----------------------------------------
+        u0, v0, edge = self._nearest_boundary_point(x1, x2)
+        free_u = np.isin(edge, [self._BOUNDARY_EDGES.index('v_min'),
+                                self._BOUNDARY_EDGES.index('v_max')])
+        u_b, v_b = self._refine_boundary_points(x1, x2, u0, v0, free_u)
+
+        S_b, (dSdu, dSdv), (d2Sdu2, d2Sdv2, d2Sdudv) = self.eval_uv_d2(u_b, v_b)
+        x1_b, x2_b, y_b = S_b.T
+
+        # --- Parameter displacement: J * [du, dv]^T = [x1 - x1b, x2 - x2b]^T
+        det = dSdu[:, 0] * dSdv[:, 1] - dSdv[:, 0] * dSdu[:, 1]
+        singular = det == 0
+        det = np.where(singular, 1.0, det)
+
+        def _solve(b1, b2):
+            return (( dSdv[:, 1] * b1 - dSdv[:, 0] * b2) / det,
+                    (-dSdu[:, 1] * b1 + dSdu[:, 0] * b2) / det)
+
+        du, dv = _solve(x1 - x1_b, x2 - x2_b)
+        du, dv = np.where(singular, 0.0, du), np.where(singular, 0.0, dv)
+
+        # --- Taylor expansion --------------------------------------------
+        first_order  = dSdu[:, 2] * du + dSdv[:, 2] * dv
+        second_order = 0.5 * d2Sdu2[:, 2] * du**2 + d2Sdudv[:, 2] * du * dv + 0.5 * d2Sdv2[:, 2] * dv**2
+        y1 = y_b + first_order
+        y2 = y1 + second_order
+
+        rejected = np.zeros(len(x1), dtype=bool)
+
+        x1_extent = self._search_x1.max() - self._search_x1.min()
+        x2_extent = self._search_x2.max() - self._search_x2.min()
+
+        if limit_distance:
+            surface_diagonal = np.sqrt(x1_extent**2 + x2_extent**2)
+            query_distance = np.sqrt((x1 - x1_b)**2 + (x2 - x2_b)**2)
+            rejected |= query_distance > distance_threshold * surface_diagonal
+
+        if limit_consistency:
+            regularisation = 1e-6 * (np.abs(y_b) + 1.0)
+            consistency = np.abs(y2 - y1) / (np.abs(y2 - y_b) + regularisation)
+            rejected |= consistency > consistency_threshold
+
+        if limit_steepness:
+            y_extent = self._search_y.max() - self._search_y.min()
+            g_char_x1 = y_extent / (x1_extent + 1e-14)
+            g_char_x2 = y_extent / (x2_extent + 1e-14)
+            g_char    = np.sqrt(g_char_x1**2 + g_char_x2**2)
+
+            g_x1, g_x2 = _solve(dSdu[:, 2], dSdv[:, 2])
+            steepness = np.sqrt(g_x1**2 + g_x2**2) / (g_char + 1e-14)
+            rejected |= singular | (steepness > steepness_threshold)
+
+        y = np.pow(10, y2) if self.log_y else y2.copy()
+
+        if not compute_gradients:
+            y[rejected] = np.nan
+            return y
+
+        # --- Gradient at (u_b + du, v_b + dv) ----------------------------
+        dydu_ext = dSdu[:, 2] + d2Sdu2[:, 2]  * du + d2Sdudv[:, 2] * dv
+        dydv_ext = dSdv[:, 2] + d2Sdudv[:, 2] * du + d2Sdv2[:, 2]  * dv
+        dydx1, dydx2 = _solve(dydu_ext, dydv_ext)
+        rejected |= singular
+
+        if self.log_y:
+            dydx1 = dydx1 * y * np.log(10)
+            dydx2 = dydx2 * y * np.log(10)
+        if self.log_x1:
+            dydx1 = dydx1 / (np.pow(10, x1) * np.log(10))
+        if self.log_x2:
+            dydx2 = dydx2 / (np.pow(10, x2) * np.log(10))
+
+        y[rejected] = np.nan
+        dydx1[rejected] = np.nan
+        dydx2[rejected] = np.nan
+
+        return y, (dydx1, dydx2)
+
     def eval(self, x1, x2, tol=1e-10, max_iter=50, threshold=100,
              compute_gradients=False, extrapolate=False,
              limit_distance=False, limit_consistency=False, limit_steepness=False,
@@ -484,12 +915,131 @@ class ParametricBivariateSpline:
                 Y[i, j] = self.eval_point(X1[i, j], X2[i, j], **eval_params)
             return X1, X2, Y
 
+    def enable_cache(self, maxsize=4096, digits=12):
+        """
+        Memoize scalar eval_point (and scalar eval) results in a bounded
+        per-instance LRU cache.
+
+        Parameters
+        ----------
+        maxsize : int
+            Maximum number of cached results; least recently used entries
+            are evicted first.
+        digits : int
+            Significant digits (x1, x2) are rounded to when forming keys.
+            Queries agreeing to that precision share one cached result.
+        """
+        self._eval_cache = EvalCache(maxsize=maxsize, digits=digits)
+
+    def disable_cache(self):
+        """Stop memoizing and drop all cached results."""
+        self._eval_cache = None
+
+    def cache_clear(self):
+        """Drop all cached results and reset the hit/miss counters."""
+        if self._eval_cache is not None:
+            self._eval_cache.clear()
+
+    def cache_info(self):
+        """CacheInfo(hits, misses, maxsize, currsize), or None if caching is off."""
+        if self._eval_cache is None:
+            return None
+
+        return self._eval_cache.info()
+
+    def to_bytes(self):
+        """
+        Serialize the surface into a compact binary container.
+
+        The container holds the knot vectors, control grid, weights,
+        degrees, log flags and the pre-evaluated search grid, so loading
+        skips the search grid evaluation. The search grid KD-tree is rebuilt
+        from the stored nodes, and the boundary polyline on first use.
+
+        Returns
+        -------
+        bytes
+        """
+        attrs = {"ku": self.ku, "kv": self.kv,
+                 "log_x1": bool(self.log_x1), "log_x2": bool(self.log_x2), "log_y": bool(self.log_y),
+                 "search_density": self.search_density, "metadata": self._get_metadata()}
+        arrays = {"tu": self.tu, "tv": self.tv, "cp_grid": self._cp_grid, "w": self.w,
+                  "search_u": self._search_u, "search_v": self._search_v,
+                  "search_x1": self._search_x1, "search_x2": self._search_x2,
+                  "search_y": self._search_y}
+
+        return serialization.pack("surface", type(self).__name__, attrs, arrays)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Restore a surface serialized by to_bytes.
+
+        Parameters
+        ----------
+        data : bytes-like
+            Serialized surface. The arrays of the restored surface are views
+            into it rather than copies, so they are read-only unless data is
+            writable (e.g. a bytearray).
+        """
+        _, attrs, arrays = serialization.unpack(data, "surface")
+
+        self = cls.__new__(cls)
+        self.tu, self.tv = arrays["tu"], arrays["tv"]
+        self.ku, self.kv = attrs["ku"], attrs["kv"]
+        self.w = arrays["w"]
+        self.log_x1, self.log_x2, self.log_y = attrs["log_x1"], attrs["log_x2"], attrs["log_y"]
+        self.search_density = attrs["search_density"]
+
+        self._cp_grid = arrays["cp_grid"]
+        self._build_tcks()
+
+        self._search_u, self._search_v = arrays["search_u"], arrays["search_v"]
+        self._search_x1, self._search_x2 = arrays["search_x1"], arrays["search_x2"]
+        self._search_y = arrays["search_y"]
+        self._index_search_grid()
+
+        self._boundary_tree = None
+        self._eval_cache = None
+        self._set_metadata(attrs["metadata"])
+
+        return self
+
+    def save(self, path):
+        """Write the surface to a file in the to_bytes format."""
+        serialization.save(path, self.to_bytes())
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Read a surface written by save.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+        mmap : bool
+            Memory map the file and use its arrays in place, so opening is
+            nearly free and the pages are shared between processes. The
+            arrays are then read-only; with mmap=False they are views into
+            a writable copy of the file.
+        """
+        return cls.from_bytes(serialization.load(path, mmap=mmap))
+
+    def _get_metadata(self):
+        """JSON-compatible metadata kept by pickling and to_bytes; extended by subclasses."""
+        return {}
+
+    def _set_metadata(self, metadata):
+        """Restore the metadata returned by _get_metadata."""
+
     def eval_point(self, x1, x2, tol=1e-10, max_iter=50, compute_gradients=False, extrapolate=False,
                    limit_distance=False, limit_consistency=False, limit_steepness=False,
                    consistency_threshold=0.5, distance_threshold=0.5, steepness_threshold=10):
         """
         Find y = S_y(u*, v*) where S_x1(u*, v*) = x1 and S_x2(u*, v*) = x2.
 
+        Results are memoized when the cache is enabled (see enable_cache).
+
         Parameters
         ----------
         x1, x2 : float
@@ -504,6 +1054,30 @@ class ParametricBivariateSpline:
         y : float, or None if Newton did not converge.
         (dydx1, dydx2) : tuple of float, only if compute_gradients=True.
         """
+        eval_params = dict(
+            tol=tol, max_iter=max_iter,
+            compute_gradients=compute_gradients, extrapolate=extrapolate,
+            limit_distance=limit_distance, limit_consistency=limit_consistency,
+            limit_steepness=limit_steepness, consistency_threshold=consistency_threshold,
+            distance_threshold=distance_threshold, steepness_threshold=steepness_threshold
+        )
+
+        cache = self._eval_cache
+        if cache is None:
+            return self._eval_point(x1, x2, **eval_params)
+
+        key = cache.key((x1, x2), eval_params.values())
+        result = cache.get(key)
+        if result is EvalCache.MISSING:
+            result = self._eval_point(x1, x2, **eval_params)
+            cache.put(key, result)
+
+        return result
+
+    def _eval_point(self, x1, x2, tol=1e-10, max_iter=50, compute_gradients=False, extrapolate=False,
+                    limit_distance=False, limit_consistency=False, limit_steepness=False,
+                    consistency_threshold=0.5, distance_threshold=0.5, steepness_threshold=10):
+        """Uncached single-point inversion behind eval_point."""
         # --- Convert to log-space for internal search ---------------------
         x1_phys, x2_phys = x1, x2
         if self.log_x1: x1 = np.log10(x1)
@@ -514,14 +1088,8 @@ class ParametricBivariateSpline:
         v_min, v_max = self.tv[self.kv], self.tv[-(self.kv + 1)]
 
         # --- Initial guess from search grid ---
-        sx1 = self._search_x1.ravel()
-        sx2 = self._search_x2.ravel()
-        su = np.repeat(self._search_u, len(self._search_v))
-        sv = np.tile(self._search_v, len(self._search_u))
-
-        dist2 = (sx1 - x1)**2 + (sx2 - x2)**2
-        best  = np.argmin(dist2)
-        u, v  = su[best], sv[best]
+        u, v = self._nearest_search_node(x1, x2)
+        u, v = u[0], v[0]
 
         # --- Newton's method — keep final Jacobian if needed ---
         # Use relative tolerance to handle large physical-space values
@@ -595,7 +1163,8 @@ class ParametricBivariateSpline:
     def eval_grid(self, x1_vals, x2_vals, tol=1e-10, max_iter=50, 
                   compute_gradients=False, extrapolate=False,
                   limit_distance=False, limit_consistency=False, limit_steepness=False,
-                  consistency_threshold=0.5, distance_threshold=0.5, steepness_threshold=10):
+                  consistency_threshold=0.5, distance_threshold=0.5, steepness_threshold=10,
+                  continuation=False, diagnostics=None, workers=None):
         """
         Evaluate y over a regular (x1, x2) grid using vectorized Newton.
 
@@ -607,50 +1176,179 @@ class ParametricBivariateSpline:
         max_iter : int
         compute_gradients : bool
             If True, also return dy/dx1 and dy/dx2 grids.
+        continuation : bool
+            If True, sweep the grid line by line and start each node's Newton
+            iteration from the solution of its already-solved neighbour
+            instead of the search grid. Usually cuts most nodes to 1-2
+            iterations on smooth grids.
+        diagnostics : dict, optional
+            If given, filled with Newton statistics: 'iterations' (Nx1, Nx2)
+            evaluations per node, 'total_iterations', 'mean_iterations' and
+            'converged' (number of nodes solved by Newton).
+        workers : int, optional
+            Number of processes to evaluate the grid with, -1 for all CPUs.
+            The grid is split into tiles across a process pool and each
+            worker writes its results directly into a shared memory output
+            buffer. Results are identical to the serial evaluation.
 
         Returns
         -------
         X1, X2, Y : 2-D arrays of shape (Nx1, Nx2)
         dYdX1, dYdX2 : 2-D arrays of shape (Nx1, Nx2), only if compute_gradients=True.
         """
-        # --- Convert to log-space for internal search ---------------------
+        if workers is not None and (isinstance(workers, bool) or not isinstance(workers, (int, np.integer))
+                                    or (workers < 1 and workers != -1)):
+            raise ValueError("workers must be a positive integer or -1, got {!r}".format(workers))
+
         x1_phys_vals = np.asarray(x1_vals, dtype=float)
         x2_phys_vals = np.asarray(x2_vals, dtype=float)
-        if self.log_x1: x1_vals = np.log10(x1_phys_vals)
-        if self.log_x2: x2_vals = np.log10(x2_phys_vals)
-
-        X1, X2 = np.meshgrid(x1_vals, x2_vals, indexing='ij')
         X1_phys, X2_phys = np.meshgrid(x1_phys_vals, x2_phys_vals, indexing='ij')
-        shape = X1.shape
-        x1_flat = X1.ravel()
-        x2_flat = X2.ravel()
-        x1_phys_flat = X1_phys.ravel()
-        x2_phys_flat = X2_phys.ravel()
-        n = len(x1_flat)
+        shape = X1_phys.shape
+
+        options = dict(
+            tol=tol, max_iter=max_iter,
+            compute_gradients=compute_gradients, extrapolate=extrapolate,
+            limit_distance=limit_distance, limit_consistency=limit_consistency,
+            limit_steepness=limit_steepness, consistency_threshold=consistency_threshold,
+            distance_threshold=distance_threshold, steepness_threshold=steepness_threshold)
+
+        if workers is not None and workers != 1 and X1_phys.size:
+            result = self._eval_grid_parallel(
+                x1_phys_vals, x2_phys_vals, workers, options, continuation, diagnostics)
+        else:
+            result = self._eval_scattered(
+                X1_phys.ravel(), X2_phys.ravel(), **options,
+                sweep_shape=shape if continuation else None, diagnostics=diagnostics)
+
+        if diagnostics is not None:
+            diagnostics['iterations'] = diagnostics['iterations'].reshape(shape)
+
+        if not compute_gradients:
+            return X1_phys, X2_phys, result.reshape(shape)
+
+        Y_flat, dydx1_flat, dydx2_flat = result
+        return (X1_phys, X2_phys, Y_flat.reshape(shape),
+                dydx1_flat.reshape(shape), dydx2_flat.reshape(shape))
+
+    def _eval_grid_parallel(self, x1_vals, x2_vals, workers, options, continuation, diagnostics):
+        """
+        eval_grid over a process pool. Returns the flat result of
+        _eval_scattered and fills diagnostics the same way.
+
+        The grid is tiled along the continuation line axis: every tile holds
+        a stretch of all lines, so each node sees the same warm-start chain
+        as in the serial sweep. Outputs (and per-node iterations) are
+        written by the workers into one shared memory block.
+        """
+        if workers < 0:
+            workers = os.cpu_count() or 1
+
+        shape = (len(x1_vals), len(x2_vals))
+        n = shape[0] * shape[1]
+        axis = _sweep_line_axis(shape)
+        tiles = [t for t in np.array_split(np.arange(shape[axis]), workers * _TILES_PER_WORKER) if len(t)]
+
+        tasks = []
+        for tile in tiles:
+            start, stop = int(tile[0]), int(tile[-1]) + 1
+            x1_tile = x1_vals[start:stop] if axis == 0 else x1_vals
+            x2_tile = x2_vals[start:stop] if axis == 1 else x2_vals
+            tasks.append((start, stop, x1_tile, x2_tile))
+
+        num_outputs = 3 if options["compute_gradients"] else 1
+        with_iterations = diagnostics is not None
+        out_bytes = num_outputs * n * 8
+        shm = shared_memory.SharedMemory(create=True, size=out_bytes + (n * 8 if with_iterations else 0))
+        try:
+            layout = (shm.name, shape, axis, num_outputs, with_iterations)
+            with ProcessPoolExecutor(max_workers=min(workers, len(tasks)),
+                                     initializer=_init_grid_worker, initargs=(self,)) as pool:
+                converged = sum(pool.map(_eval_grid_tile, tasks, [layout] * len(tasks),
+                                         [options] * len(tasks), [continuation] * len(tasks)))
+
+            out = np.ndarray((num_outputs, n), dtype=float, buffer=shm.buf)
+            result = tuple(out.copy())
+            del out
+            if with_iterations:
+                iterations = np.ndarray(n, dtype=np.int64, buffer=shm.buf, offset=out_bytes).copy()
+                diagnostics['iterations'] = iterations
+                diagnostics['total_iterations'] = int(iterations.sum())
+                diagnostics['mean_iterations'] = float(iterations.mean())
+                diagnostics['converged'] = int(converged)
+        finally:
+            shm.close()
+            shm.unlink()
+
+        return result if options["compute_gradients"] else result[0]
+
+    def eval_points(self, x1, x2, tol=1e-10, max_iter=50,
+                    compute_gradients=False, extrapolate=False,
+                    limit_distance=False, limit_consistency=False, limit_steepness=False,
+                    consistency_threshold=0.5, distance_threshold=0.5, steepness_threshold=10):
+        """
+        Evaluate y at scattered (x1[i], x2[i]) pairs using vectorized Newton.
+
+        Parameters
+        ----------
+        x1, x2 : array-like
+            Target coordinates in physical space; broadcast against each other.
+        tol : float
+        max_iter : int
+        compute_gradients : bool
+            If True, also return dy/dx1 and dy/dx2 arrays.
+        extrapolate : bool
+            If True, extrapolate points outside the surface domain.
+        limit_distance, limit_consistency, limit_steepness : bool
+            Reliability checks for extrapolation.
+        consistency_threshold, distance_threshold, steepness_threshold : float
+            Thresholds for reliability checks.
+
+        Returns
+        -------
+        Y : ndarray of the broadcast input shape, nan where no solution was found.
+        dYdX1, dYdX2 : ndarrays of the same shape, only if compute_gradients=True.
+        """
+        x1, x2 = np.broadcast_arrays(np.asarray(x1, dtype=float), np.asarray(x2, dtype=float))
+        shape = x1.shape
+
+        result = self._eval_scattered(
+            x1.ravel(), x2.ravel(), tol=tol, max_iter=max_iter,
+            compute_gradients=compute_gradients, extrapolate=extrapolate,
+            limit_distance=limit_distance, limit_consistency=limit_consistency,
+            limit_steepness=limit_steepness, consistency_threshold=consistency_threshold,
+            distance_threshold=distance_threshold, steepness_threshold=steepness_threshold)
+
+        if not compute_gradients:
+            return result.reshape(shape)
+
+        return tuple(r.reshape(shape) for r in result)
+
+    def _newton_uv(self, x1, x2, u, v, tol=1e-10, max_iter=50, compute_jacobian=False):
+        """
+        Vectorized Newton inversion of (u, v) -> (x1, x2) in internal space,
+        starting from the given (u, v) guesses.
+
+        Returns
+        -------
+        u, v       : 1-D ndarrays of solved parameters
+        active     : 1-D bool ndarray, True where Newton did not converge
+        J_final    : (n, 2, 2) Jacobians at the last step, or None
+        iterations : 1-D int ndarray of Newton evaluations per point
+        """
+        n = len(x1)
+        u, v = np.array(u, dtype=float), np.array(v, dtype=float)
 
         # --- Knot domain boundaries ---
         u_min, u_max = self.tu[self.ku], self.tu[-(self.ku + 1)]
         v_min, v_max = self.tv[self.kv], self.tv[-(self.kv + 1)]
 
-        # --- Vectorized initial guess ------------------------------------
-        sx1 = self._search_x1.ravel()
-        sx2 = self._search_x2.ravel()
-        su = np.repeat(self._search_u, len(self._search_v))
-        sv = np.tile(self._search_v, len(self._search_u))
-
-        dist2 = (sx1[None, :] - x1_flat[:, None])**2 + \
-                (sx2[None, :] - x2_flat[:, None])**2
-        best = np.argmin(dist2, axis=1)
-        u = su[best].copy()
-        v = sv[best].copy()
-
         # Store final Jacobian only when gradients are needed
-        J_final = np.zeros((n, 2, 2)) if compute_gradients else None
+        J_final = np.zeros((n, 2, 2)) if compute_jacobian else None
+        iterations = np.zeros(n, dtype=int)
 
-        # --- Vectorized Newton -------------------------------------------
         # Use relative tolerance to handle large physical-space values
-        tol_x1 = tol * (1 + np.abs(x1_flat))
-        tol_x2 = tol * (1 + np.abs(x2_flat))
+        tol_x1 = tol * (1 + np.abs(x1))
+        tol_x2 = tol * (1 + np.abs(x2))
 
         active = np.ones(n, dtype=bool)
 
@@ -659,13 +1357,14 @@ class ParametricBivariateSpline:
                 break
 
             idx = np.where(active)[0]
+            iterations[idx] += 1
             ua, va = u[idx], v[idx]
-            x1a, x2a = x1_flat[idx], x2_flat[idx]
+            x1a, x2a = x1[idx], x2[idx]
 
-            fx1 = np.array([bisplev(ui, vi, self._tck_x1)
-                        for ui, vi in zip(ua, va)]) - x1a
-            fx2 = np.array([bisplev(ui, vi, self._tck_x2)
-                        for ui, vi in zip(ua, va)]) - x2a
+            # values and first derivatives of all active points in one pass
+            D = self.eval_uv(ua, va, order=1)
+            fx1 = D[0, 0, :, 0] - x1a
+            fx2 = D[0, 0, :, 1] - x2a
 
             converged = (np.abs(fx1) < tol_x1[idx]) & (np.abs(fx2) < tol_x2[idx])
             active[idx[converged]] = False
@@ -674,19 +1373,14 @@ class ParametricBivariateSpline:
             if not still.any():
                 break
 
-            ua, va = ua[still], va[still]
             fx1, fx2 = fx1[still], fx2[still]
 
-            dx1du = np.array([bisplev(ui, vi, self._tck_x1, dx=1, dy=0)
-                            for ui, vi in zip(ua, va)])
-            dx1dv = np.array([bisplev(ui, vi, self._tck_x1, dx=0, dy=1)
-                            for ui, vi in zip(ua, va)])
-            dx2du = np.array([bisplev(ui, vi, self._tck_x2, dx=1, dy=0)
-                            for ui, vi in zip(ua, va)])
-            dx2dv = np.array([bisplev(ui, vi, self._tck_x2, dx=0, dy=1)
-                            for ui, vi in zip(ua, va)])
+            dx1du = D[1, 0, still, 0]
+            dx1dv = D[0, 1, still, 0]
+            dx2du = D[1, 0, still, 1]
+            dx2dv = D[0, 1, still, 1]
 
-            if compute_gradients:
+            if compute_jacobian:
                 still_idx = idx[still]
                 J_final[still_idx, 0, 0] = dx1du
                 J_final[still_idx, 0, 1] = dx1dv
@@ -701,39 +1395,132 @@ class ParametricBivariateSpline:
             u[idx[still]] = np.clip(u[idx[still]] + du, u_min, u_max)
             v[idx[still]] = np.clip(v[idx[still]] + dv, v_min, v_max)
 
+        return u, v, active, J_final, iterations
+
+    def _newton_sweep(self, x1, x2, shape, tol=1e-10, max_iter=50, compute_jacobian=False,
+                      probe_iter=4, line_axis=None):
+        """
+        Grid continuation: solve a regular grid line by line, seeding each
+        node's Newton iteration with the solution of its neighbour in the
+        previous line (or the search grid where that neighbour did not
+        converge).
+
+        Each line only gets probe_iter iterations. Nodes still unsolved after
+        that, typically exterior ones, are finished in one batched pass at
+        the end: cold-seeded nodes continue where they stopped, and failed
+        warm starts restart from their search-grid seed. Lines run along
+        line_axis, by default the longer grid axis, so the number of
+        sequential steps is the shorter dimension. Returns the same tuple as
+        _newton_uv.
+        """
+        n = len(x1)
+        if line_axis is None:
+            line_axis = _sweep_line_axis(shape)
+        lines = np.arange(n).reshape(shape)
+        if line_axis == 0:
+            lines = lines.T
+        probe_iter = min(probe_iter, max_iter)
+
+        u_cold, v_cold = self._nearest_search_node(x1, x2)
+        u, v = u_cold.copy(), v_cold.copy()
+        active = np.ones(n, dtype=bool)
+        warm = np.zeros(n, dtype=bool)
+        J_final = np.zeros((n, 2, 2)) if compute_jacobian else None
+        iterations = np.zeros(n, dtype=int)
+
+        def _solve(nodes, u0, v0, budget):
+            un, vn, an, Jn, it = self._newton_uv(
+                x1[nodes], x2[nodes], u0, v0, tol=tol, max_iter=budget,
+                compute_jacobian=compute_jacobian)
+            u[nodes], v[nodes], active[nodes] = un, vn, an
+            iterations[nodes] += it
+            if compute_jacobian:
+                J_final[nodes] = Jn
+
+        prev = None
+        for line in lines:
+            if prev is not None:
+                warm[line] = ~active[prev]
+                u[line] = np.where(warm[line], u[prev], u[line])
+                v[line] = np.where(warm[line], v[prev], v[line])
+            _solve(line, u[line], v[line], probe_iter)
+            prev = line
+
+        # --- Finish unsolved nodes in one batch --------------------------
+        resume = np.where(active & ~warm)[0]
+        restart = np.where(active & warm)[0]
+        if len(resume):
+            _solve(resume, u[resume], v[resume], max_iter - probe_iter)
+        if len(restart):
+            _solve(restart, u_cold[restart], v_cold[restart], max_iter)
+
+        return u, v, active, J_final, iterations
+
+    def _eval_scattered(self, x1_phys_flat, x2_phys_flat, tol=1e-10, max_iter=50,
+                        compute_gradients=False, extrapolate=False,
+                        limit_distance=False, limit_consistency=False, limit_steepness=False,
+                        consistency_threshold=0.5, distance_threshold=0.5, steepness_threshold=10,
+                        sweep_shape=None, sweep_axis=None, diagnostics=None):
+        """
+        Vectorized Newton inversion for flat arrays of physical (x1, x2) pairs.
+        Shared by eval_grid and eval_points.
+
+        sweep_shape : tuple, optional
+            Grid shape of the flat inputs; enables continuation warm starts.
+        sweep_axis : int, optional
+            Grid axis the continuation lines run along (default: the longer).
+        diagnostics : dict, optional
+            Filled with Newton iteration statistics.
+
+        Returns
+        -------
+        Y_flat : 1-D ndarray, or (Y_flat, dydx1_flat, dydx2_flat) if compute_gradients=True.
+        """
+        # --- Convert to log-space for internal search ---------------------
+        x1_flat = np.log10(x1_phys_flat) if self.log_x1 else x1_phys_flat
+        x2_flat = np.log10(x2_phys_flat) if self.log_x2 else x2_phys_flat
+        n = len(x1_flat)
+
+        # --- Vectorized Newton from search-grid or continuation seeds ------
+        if sweep_shape is None:
+            u, v = self._nearest_search_node(x1_flat, x2_flat)
+            u, v, active, J_final, iterations = self._newton_uv(
+                x1_flat, x2_flat, u, v, tol=tol, max_iter=max_iter,
+                compute_jacobian=compute_gradients)
+        else:
+            u, v, active, J_final, iterations = self._newton_sweep(
+                x1_flat, x2_flat, sweep_shape, tol=tol, max_iter=max_iter,
+                compute_jacobian=compute_gradients, line_axis=sweep_axis)
+
+        if diagnostics is not None:
+            diagnostics['iterations'] = iterations
+            diagnostics['total_iterations'] = int(iterations.sum())
+            diagnostics['mean_iterations'] = float(iterations.mean()) if n else 0.0
+            diagnostics['converged'] = int(n - active.sum())
+
         # --- Final y evaluation ------------------------------------------
-        Y_flat = np.array([bisplev(ui, vi, self._tck_y)
-                          for ui, vi in zip(u, v)], dtype=float)
+        Y_flat = self.eval_uv(u, v)[0, 0, :, 2]
 
         # --- Handle non-converged (exterior) points ----------------------
         failed = active  # points that never converged
-        extrap_cache = {}  # fi -> (dydx1, dydx2) for gradient reuse
+        failed_idx = np.where(failed)[0]
 
         if failed.any():
             if extrapolate:
-                failed_idx = np.where(failed)[0]
-                for fi in failed_idx:
-                    result = self._extrapolate_point(
-                        x1_flat[fi], x2_flat[fi],
-                        compute_gradients=compute_gradients,
-                        limit_distance=limit_distance, 
-                        limit_consistency=limit_consistency,
-                        limit_steepness=limit_steepness, 
-                        consistency_threshold=consistency_threshold,
-                        distance_threshold=distance_threshold, 
-                        steepness_threshold=steepness_threshold)
-                    if compute_gradients:
-                        y_ext, (dydx1_ext, dydx2_ext) = result
-                        if y_ext is not None:
-                            Y_flat[fi] = np.log10(y_ext) if self.log_y else y_ext
-                            extrap_cache[fi] = (dydx1_ext, dydx2_ext)
-                        else:
-                            Y_flat[fi] = np.nan
-                    else:
-                        if result is not None:
-                            Y_flat[fi] = np.log10(result) if self.log_y else result
-                        else:
-                            Y_flat[fi] = np.nan
+                result = self._extrapolate_points(
+                    x1_flat[failed_idx], x2_flat[failed_idx],
+                    compute_gradients=compute_gradients,
+                    limit_distance=limit_distance,
+                    limit_consistency=limit_consistency,
+                    limit_steepness=limit_steepness,
+                    consistency_threshold=consistency_threshold,
+                    distance_threshold=distance_threshold,
+                    steepness_threshold=steepness_threshold)
+                if compute_gradients:
+                    y_ext, (dydx1_ext, dydx2_ext) = result
+                else:
+                    y_ext = result
+                Y_flat[failed_idx] = np.log10(y_ext) if self.log_y else y_ext
             else:
                 Y_flat[failed] = np.nan
 
@@ -741,7 +1528,7 @@ class ParametricBivariateSpline:
             if self.log_y:
                 Y_flat = np.pow(10, Y_flat)
 
-            return X1_phys, X2_phys, Y_flat.reshape(shape)
+            return Y_flat
 
         # --- Gradients via implicit function theorem ---------------------
         dydx1_flat = np.full(n, np.nan)
@@ -751,11 +1538,8 @@ class ParametricBivariateSpline:
         conv = ~failed
         if conv.any():
             conv_idx = np.where(conv)[0]
-            dydu = np.array([bisplev(u[i], v[i], self._tck_y, dx=1, dy=0)
-                            for i in conv_idx])
-            dydv = np.array([bisplev(u[i], v[i], self._tck_y, dx=0, dy=1)
-                            for i in conv_idx])
-            grad_uv = np.stack([dydu, dydv], axis=1)
+            D = self.eval_uv(u[conv_idx], v[conv_idx], order=1)
+            grad_uv = np.stack([D[1, 0, :, 2], D[0, 1, :, 2]], axis=1)
 
             det = (J_final[conv_idx, 0, 0] * J_final[conv_idx, 1, 1] -
                    J_final[conv_idx, 0, 1] * J_final[conv_idx, 1, 0])
@@ -772,21 +1556,20 @@ class ParametricBivariateSpline:
                   J_final[conv_idx, 0, 0] * grad_uv[:, 1]) / det,
                 np.nan)
 
-        # Extrapolated points: reuse cached gradients from the first pass
-        for fi, (dydx1_ext, dydx2_ext) in extrap_cache.items():
-            if dydx1_ext is not None:
-                dydx1_flat[fi] = dydx1_ext
-                dydx2_flat[fi] = dydx2_ext
+        # Extrapolated points: gradients from the batched extrapolation pass
+        if extrapolate and failed.any():
+            dydx1_flat[failed_idx] = dydx1_ext
+            dydx2_flat[failed_idx] = dydx2_ext
 
         if self.log_y:
             Y_flat = np.pow(10, Y_flat)
             # Only apply log_y correction to converged points — extrapolated
-            # gradients already have it baked in from _extrapolate_point
+            # gradients already have it baked in from _extrapolate_points
             if conv.any():
                 dydx1_flat[conv] *= Y_flat[conv] * np.log(10)
                 dydx2_flat[conv] *= Y_flat[conv] * np.log(10)
         # Only apply log_x1/log_x2 correction to converged points —
-        # extrapolated gradients already have it baked in from _extrapolate_point
+        # extrapolated gradients already have it baked in from _extrapolate_points
         if self.log_x1:
             if conv.any():
                 dydx1_flat[conv] /= (x1_phys_flat[conv] * np.log(10))
@@ -794,7 +1577,52 @@ class ParametricBivariateSpline:
             if conv.any():
                 dydx2_flat[conv] /= (x2_phys_flat[conv] * np.log(10))
 
-        return (X1_phys, X2_phys, Y_flat.reshape(shape),
-                dydx1_flat.reshape(shape), dydx2_flat.reshape(shape))
+        return Y_flat, dydx1_flat, dydx2_flat
+
+
+# =============================================================================
+# PARALLEL GRID EVALUATION
+# =============================================================================
+
+_TILES_PER_WORKER = 4      # grid tiles per process, for load balancing
+_grid_worker_surface = None
+
+
+def _sweep_line_axis(shape):
+    """Grid axis continuation lines run along: the longer one."""
+    return 0 if shape[0] > shape[1] else 1
+
+
+def _init_grid_worker(surface):
+    global _grid_worker_surface
+    _grid_worker_surface = surface
+
+
+def _eval_grid_tile(tile, layout, options, continuation):
+    """Evaluate one grid tile in a pool worker and write it to the shared output."""
+    start, stop, x1_vals, x2_vals = tile
+    shm_name, shape, axis, num_outputs, with_iterations = layout
+
+    X1, X2 = np.meshgrid(x1_vals, x2_vals, indexing='ij')
+    diagnostics = {} if with_iterations else None
+    result = _grid_worker_surface._eval_scattered(
+        X1.ravel(), X2.ravel(), **options,
+        sweep_shape=X1.shape if continuation else None, sweep_axis=axis,
+        diagnostics=diagnostics)
+    outputs = result if options["compute_gradients"] else (result,)
 
+    index = (slice(start, stop), slice(None)) if axis == 0 else (slice(None), slice(start, stop))
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        out = np.ndarray((num_outputs,) + shape, dtype=float, buffer=shm.buf)
+        for k, values in enumerate(outputs):
+            out[k][index] = values.reshape(X1.shape)
+        if with_iterations:
+            iterations = np.ndarray(shape, dtype=np.int64, buffer=shm.buf, offset=out.nbytes)
+            iterations[index] = diagnostics['iterations'].reshape(X1.shape)
+            del iterations
+        del out
+    finally:
+        shm.close()
 
+    return diagnostics['converged'] if with_iterations else 0
@@ -1,5 +1,6 @@
+from bisect import bisect_right
 from functools import partial
-from typing import Sequence
+from typing import Optional, Sequence, Union
 import math
 
 import numpy as np
@@ -10,6 +11,70 @@ from scipy.optimize import brentq
 Vector1D = Sequence[float]
 Vector2D = Sequence[Sequence[float]]
 
+INVERSION_METHODS = ("brentq", "newton", "analytic")
+
+
+class IntervalIndex:
+    """
+    Binary search index over a sequence of half-open intervals [a, b).
+
+    Values below the first interval are assigned to the first interval,
+    values at or above the end of the last interval - to the last one.
+    Values that fall into a gap between intervals are not assigned.
+    If the intervals are not sorted or overlap, lookups fall back to a
+    linear scan that returns the first matching interval.
+    """
+
+    def __init__(self, intervals:Vector2D):
+        self.intervals = np.asarray(intervals, dtype=float).reshape(-1, 2)
+        self.lefts = np.ascontiguousarray(self.intervals[:, 0])
+        self.rights = np.ascontiguousarray(self.intervals[:, 1])
+        self.ordered = bool(np.all(np.diff(self.lefts) >= 0) and np.all(self.rights[:-1] <= self.lefts[1:]))
+
+        self._lefts = self.lefts.tolist()
+        self._rights = self.rights.tolist()
+
+    def __len__(self) -> int:
+        return len(self.intervals)
+
+    def lookup(self, xvalue:float) -> Optional[int]:
+        """Index of the interval containing xvalue or None"""
+        last = len(self._lefts) - 1
+        if xvalue < self._lefts[0]:
+            return 0
+        elif xvalue > self._rights[last]:
+            return last
+
+        if self.ordered:
+            i = max(bisect_right(self._lefts, xvalue) - 1, 0)
+            if self._lefts[i] <= xvalue < self._rights[i]:
+                return i
+        else:
+            for i, (left, right) in enumerate(zip(self._lefts, self._rights)):
+                if left <= xvalue < right:
+                    return i
+
+        if xvalue == self._rights[last]:
+            return last
+
+        return None
+
+    def lookup_many(self, xvalues:Union[Vector1D, np.ndarray]) -> np.ndarray:
+        """Batched lookup, returns -1 where no interval is found"""
+        xarray = np.asarray(xvalues, dtype=float)
+        if not self.ordered:
+            found_list = [self.lookup(xv) for xv in xarray.ravel()]
+            return np.array([-1 if ni is None else ni for ni in found_list], dtype=int).reshape(xarray.shape)
+
+        last = len(self.lefts) - 1
+        n = np.clip(np.searchsorted(self.lefts, xarray, side="right") - 1, 0, last)
+        found = (xarray >= self.lefts[n]) & (xarray < self.rights[n])
+        found |= xarray < self.lefts[0]
+        at_end = xarray >= self.rights[last]
+        n[at_end] = last
+
+        return np.where(found | at_end, n, -1)
+
 
 class PPolyInvertible(si.PPoly):
     """Piecewise polynomial with ability to evaluate inverse dependency x(y)"""
@@ -21,6 +86,7 @@ class PPolyInvertible(si.PPoly):
         self.k = len(self.c) - 1
         self.powers = np.arange(self.k, -1, -1)
         self.intervals = self._form_intervals(self.x)
+        self.span_coeffs = np.ascontiguousarray(self.c.T)
         return self
 
     @classmethod
@@ -39,24 +105,12 @@ class PPolyInvertible(si.PPoly):
 
     def project_intervals(self, spline):
         breaks = spline(self.x)
-        self.pintervals = self._form_intervals(breaks)
-
-    def _get_interval(self, xvalue:float, intervals:Vector2D) -> int:
-        if xvalue < intervals[0][0]:
-            return 0
-        elif xvalue > intervals[-1][1]:
-            return len(intervals) - 1
-
-        i = 0
-        for interval in intervals:
-            if xvalue >= interval[0] and xvalue < interval[1]:
-                return i
-            else:
-                i += 1
+        self.set_pintervals(self._form_intervals(breaks))
 
-        ## patch end case
-        if xvalue == interval[1]:
-            return i-1
+    def set_pintervals(self, pintervals:Vector2D):
+        """Set the intervals of values spanned by the polynomial pieces"""
+        self.pintervals = pintervals
+        self.pinterval_index = IntervalIndex(pintervals)
 
     def _form_intervals(self, breaks:Vector1D) -> np.ndarray:
         n = len(breaks) - 2*self.k - 1
@@ -77,10 +131,14 @@ class PPolyInvertible(si.PPoly):
 
         return error
 
-    def evalinv(self, xvalue:int, extrapolate=False) -> float:
-        n = self._get_interval(xvalue, self.pintervals)
+    def evalinv(self, xvalue:float, extrapolate=False, method="brentq") -> Optional[float]:
+        if method != "brentq":
+            t = self.evalinv_many([xvalue], extrapolate=extrapolate, method=method)[0]
+            return None if np.isnan(t) else float(t)
+
+        n = self.pinterval_index.lookup(xvalue)
         if n is None:
-            return
+            return None
 
         tmin, tmax = self.intervals[n]
         coeffs = self.c.T[n + self.k]
@@ -97,29 +155,29 @@ class PPolyInvertible(si.PPoly):
 
         if xvalue < x_start: # extrapolate left
             if not extrapolate:
-                return
+                return None
 
             t_sol = self.solve(xvalue, extrapolate=True)
             if len(t_sol) == 0:
-                return
+                return None
 
             t_filter = [ts for ts in t_sol if ts < 0]
             if len(t_filter) == 0:
-                return
+                return None
 
             return max(t_filter)
 
         elif xvalue > x_end: # extrapolate right
             if not extrapolate:
-                return
+                return None
 
             t_sol = self.solve(xvalue, extrapolate=True)
             if len(t_sol) == 0:
-                return
+                return None
 
             t_filter = [ts for ts in t_sol if ts > 1]
             if len(t_filter) == 0:
-                return
+                return None
 
             return min(t_filter)
 
@@ -134,7 +192,7 @@ class PPolyInvertible(si.PPoly):
 
         if (xvalue < xmin or xvalue > xmax):
             # xvalue may be out of interval if C0 continuity isn't kept
-            return
+            return None
 
         guess_error = partial(self._guess_error, coeffs=coeffs, tbreak=tbreak, xvalue=xvalue)
         try:
@@ -143,3 +201,427 @@ class PPolyInvertible(si.PPoly):
             if not extrapolate: raise ex               
         else:
             return t
+
+        return None
+
+    def evalinv_many(self, xvalues:Vector1D, extrapolate=False, method="analytic") -> np.ndarray:
+        """
+        Vectorized counterpart of evalinv for an array of x values.
+        Returns an array of parameter values with nan where evalinv returns None.
+
+        Methods: 'analytic' - closed-form roots for spans of degree up to 3,
+        'newton' - safeguarded Newton iterations for any degree,
+        'brentq' - pointwise evalinv calls (reference implementation).
+        """
+        if method not in INVERSION_METHODS:
+            raise ValueError(f"Invalid method: {method}. Should be one of 'brentq', 'newton', or 'analytic'")
+
+        xarray = np.asarray(xvalues, dtype=float)
+        if method == "brentq":
+            tlist = [self.evalinv(xv, extrapolate=extrapolate) for xv in xarray.ravel()]
+            return np.array([np.nan if tv is None else tv for tv in tlist]).reshape(xarray.shape)
+
+        tvalues = np.full(xarray.shape, np.nan)
+        xflat = xarray.ravel()
+        tflat = tvalues.reshape(-1)
+
+        x_start = self.pintervals[0][0]
+        x_end = self.pintervals[-1][1]
+
+        n = self.pinterval_index.lookup_many(xflat)
+        found = n >= 0
+        n = np.where(found, n, 0)
+        tmin, tmax = self.intervals[n].T
+
+        at_start = found & (np.abs(xflat - x_start) < 1e-12)
+        at_end = found & ~at_start & (np.abs(xflat - x_end) < 1e-12)
+        tflat[at_start] = tmin[at_start]
+        tflat[at_end] = tmax[at_end]
+
+        pending = found & ~at_start & ~at_end
+        # exclusive as in evalinv, x_end may lie below x_start if x(t) is not monotonic
+        left = pending & (xflat < x_start)
+        right = pending & ~left & (xflat > x_end)
+        if extrapolate:
+            tflat[left] = self._solve_extrapolated(xflat[left], "left", method)
+            tflat[right] = self._solve_extrapolated(xflat[right], "right", method)
+
+        inner = pending & ~left & ~right
+        spans = n[inner] + self.k
+        tflat[inner] = self._solve_spans(xflat[inner], spans, tmin[inner], tmax[inner], method)
+
+        return tvalues
+
+    def _eval_poly_many(self, t:np.ndarray, coeffs:np.ndarray, tbreak:Union[np.ndarray, float],
+                        nu=0) -> np.ndarray:
+        """Evaluate span polynomials (or their nu-th derivative) row-wise with Horner's scheme"""
+        s = t - tbreak
+        order = coeffs.shape[-1] - 1
+        poly = np.zeros_like(s)
+        for i in range(order - nu + 1):
+            poly = poly*s + coeffs[..., i]*math.perm(order - i, nu)
+
+        return poly
+
+    def _solve_spans(self, xvalues:np.ndarray, spans:np.ndarray, tmin:np.ndarray,
+                     tmax:np.ndarray, method="analytic") -> np.ndarray:
+        """Solve x(t) = xvalue within the given spans"""
+        coeffs = self.span_coeffs[spans]
+        tbreak = self.x[spans]
+
+        xmin = self._eval_poly_many(tmin, coeffs, tbreak)
+        xmax = self._eval_poly_many(tmax, coeffs, tbreak)
+
+        t = np.full(xvalues.shape, np.nan)
+        on_min = np.abs(xvalues - xmin) < 1e-12
+        on_max = ~on_min & (np.abs(xvalues - xmax) < 1e-12)
+        t[on_min] = tmin[on_min]
+        t[on_max] = tmax[on_max]
+
+        # xvalue may be out of span if C0 continuity isn't kept
+        active = ~on_min & ~on_max & (xvalues >= xmin) & (xvalues <= xmax)
+        args = xvalues[active], coeffs[active], tbreak[active], tmin[active], tmax[active]
+
+        if method == "analytic" and self.k <= 3:
+            t[active] = self._solve_spans_analytic(*args)
+        else:
+            t[active] = self._solve_spans_newton(*args)
+
+        return t
+
+    def _solve_spans_newton(self, xvalues:np.ndarray, coeffs:np.ndarray, tbreak:np.ndarray,
+                            tmin:np.ndarray, tmax:np.ndarray, max_iter=100) -> np.ndarray:
+        """Safeguarded Newton iterations within brackets where x(tmin) < xvalue < x(tmax)"""
+        t = np.full(xvalues.shape, np.nan)
+        idx = np.arange(len(xvalues))
+        lo, hi = tmin, tmax
+        ta = 0.5*(lo + hi)
+
+        for _ in range(max_iter):
+            if len(idx) == 0:
+                break
+
+            c, tb = coeffs[idx], tbreak[idx]
+            err = self._eval_poly_many(ta, c, tb) - xvalues[idx]
+            done = (np.abs(err) < 1e-12) | (hi - lo <= 4*np.finfo(float).eps*np.maximum(1.0, np.abs(ta)))
+            t[idx[done]] = ta[done]
+
+            keep = ~done
+            idx, ta, lo, hi, err, c, tb = idx[keep], ta[keep], lo[keep], hi[keep], err[keep], c[keep], tb[keep]
+
+            below = err < 0
+            lo = np.where(below, ta, lo)
+            hi = np.where(below, hi, ta)
+
+            slope = self._eval_poly_many(ta, c, tb, nu=1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                t_newton = ta - err/slope
+            inside = (t_newton > lo) & (t_newton < hi)
+            ta = np.where(inside, t_newton, 0.5*(lo + hi))
+        else:
+            t[idx] = ta
+
+        return t
+
+    def _solve_spans_analytic(self, xvalues:np.ndarray, coeffs:np.ndarray, tbreak:np.ndarray,
+                              tmin:np.ndarray, tmax:np.ndarray) -> np.ndarray:
+        """Closed-form roots within spans, with Newton iterations for degenerate spans"""
+        shifted = coeffs.copy()
+        shifted[:, -1] -= xvalues
+        roots = real_roots(shifted) + tbreak[:, None]
+
+        # take the first root that falls within the span
+        margin = 1e-9*(tmax - tmin)
+        in_span = (roots >= (tmin - margin)[:, None]) & (roots <= (tmax + margin)[:, None])
+        t = np.where(in_span, roots, np.inf).min(axis=1)
+        t = self._polish_roots(np.clip(t, tmin, tmax), xvalues, coeffs, tbreak)
+
+        err = self._eval_poly_many(t, coeffs, tbreak) - xvalues
+        failed = ~(np.abs(err) <= 1e-12*np.maximum(1.0, np.abs(xvalues)))
+        failed |= ~in_span.any(axis=1) | (t < tmin - margin) | (t > tmax + margin)
+        t = np.clip(t, tmin, tmax)
+        t[failed] = self._solve_spans_newton(
+            xvalues[failed], coeffs[failed], tbreak[failed], tmin[failed], tmax[failed])
+
+        return t
+
+    def _polish_roots(self, t:np.ndarray, xvalues:np.ndarray, coeffs:np.ndarray,
+                      tbreak:Union[np.ndarray, float], steps=2) -> np.ndarray:
+        """Refine closed-form roots with a few Newton steps to recover round-off losses"""
+        for _ in range(steps):
+            err = self._eval_poly_many(t, coeffs, tbreak) - xvalues
+            slope = self._eval_poly_many(t, coeffs, tbreak, nu=1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                step = np.where(slope != 0, err/slope, 0.0)
+            t = t - step
+
+        return t
+
+    def _solve_extrapolated(self, xvalues:np.ndarray, side="left", method="analytic") -> np.ndarray:
+        """Solve x(t) = xvalue on the polynomial extended beyond the first or the last breakpoint"""
+        if side == "left":
+            coeffs, tbreak, tbound = self.span_coeffs[0], self.x[0], self.x[0]
+        else:
+            coeffs, tbreak, tbound = self.span_coeffs[-1], self.x[-2], self.x[-1]
+
+        t = np.full(xvalues.shape, np.nan)
+        lead = np.flatnonzero(coeffs[:-1])
+        if len(xvalues) == 0 or len(lead) == 0:
+            return t
+
+        # only the constant term differs between points
+        coeffs = coeffs[lead[0]:]
+        shifted = np.tile(coeffs, (len(xvalues), 1))
+        shifted[:, -1] -= xvalues
+
+        if method == "analytic" and len(coeffs) <= 4:
+            roots = real_roots(shifted)
+            roots = np.where(np.isnan(roots), np.nan, self._polish_roots(
+                roots, xvalues[:, None], coeffs, 0.0))
+        else:
+            roots = companion_roots(shifted)
+
+        troots = roots + tbreak
+        with np.errstate(invalid="ignore"):
+            if side == "left":
+                t_sol = np.where(troots < tbound, troots, -np.inf).max(axis=1)
+            else:
+                t_sol = np.where(troots > tbound, troots, np.inf).min(axis=1)
+
+        t[np.isfinite(t_sol)] = t_sol[np.isfinite(t_sol)]
+        return t
+
+    def build_inverse_table(self, n=256, tol=1e-10, max_nodes=2**20) -> "InverseTable":
+        return InverseTable(self, n=n, tol=tol, max_nodes=max_nodes)
+
+
+class InverseTable:
+    """
+    Monotone lookup table of x(t) nodes for fast inversion of PPolyInvertible.
+
+    Parameter values are estimated by cubic Hermite interpolation of t(x)
+    between the nodes and refined with a single Newton step. The nodes are
+    refined adaptively until the residual |x(t) - x| at test points within
+    every table segment drops below tol (or the table reaches max_nodes).
+    Values outside the table range are delegated to the PPolyInvertible.
+    """
+
+    def __init__(self, ppoly:PPolyInvertible, n=256, tol=1e-10, max_nodes=2**20):
+        self.ppoly = ppoly
+        self.tol = tol
+
+        spans = [(i + ppoly.k, tmin, tmax) for i, (tmin, tmax) in enumerate(ppoly.intervals) if tmax > tmin]
+        if not spans:
+            raise ValueError("Inverse table requires at least one span of nonzero length")
+
+        t_range = sum(tmax - tmin for _, tmin, tmax in spans)
+        span_t, span_index = [], []
+        for span, tmin, tmax in spans:
+            num = max(2, math.ceil(n*(tmax - tmin)/t_range) + 1)
+            span_t.append(np.linspace(tmin, tmax, num))
+            span_index.append(np.full(num, span))
+
+        node_t, node_span = np.concatenate(span_t), np.concatenate(span_index)
+
+        while True:
+            self._set_nodes(node_t, node_span)
+            errors = self._segment_errors()
+            self.max_error = float(errors.max(initial=0.0))
+
+            bad = np.flatnonzero(errors > tol)
+            if len(bad) == 0 or len(node_t) >= max_nodes:
+                break
+
+            node_t = np.concatenate([node_t, 0.5*(node_t[bad] + node_t[bad + 1])])
+            node_span = np.concatenate([node_span, node_span[bad]])
+            order = np.lexsort((node_t, node_span))
+            node_t, node_span = node_t[order], node_span[order]
+
+    def __len__(self) -> int:
+        return len(self.node_x)
+
+    def _set_nodes(self, node_t:np.ndarray, node_span:np.ndarray):
+        coeffs = self.ppoly.span_coeffs[node_span]
+        tbreak = self.ppoly.x[node_span]
+        node_x = self.ppoly._eval_poly_many(node_t, coeffs, tbreak)
+        node_dx = self.ppoly._eval_poly_many(node_t, coeffs, tbreak, nu=1)
+
+        # segments between the last node of one span and the first node of the next one are gaps
+        valid = node_span[:-1] == node_span[1:]
+        h = np.diff(node_x)
+        # allow round-off overlaps between adjacent spans
+        eps = 1e-12*max(1.0, float(np.abs(node_x).max()))
+        if np.any(h < -eps) or np.any(h[valid] <= 0):
+            raise ValueError("Inverse table requires x(t) to increase monotonically")
+
+        t0, t1 = node_t[:-1], node_t[1:]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            secant = (t1 - t0)/h
+            m0 = np.where(node_dx[:-1] > 0, 1/node_dx[:-1], secant)
+            m1 = np.where(node_dx[1:] > 0, 1/node_dx[1:], secant)
+
+        self.node_t, self.node_x = node_t, node_x
+        self.seg_span, self.seg_valid = node_span[:-1], valid
+        self.seg_m0, self.seg_m1 = m0, m1
+
+        self.x_first, self.x_last = float(node_x[0]), float(node_x[-1])
+        self.search_x = np.maximum.accumulate(node_x)
+
+        # plain lists for scalar lookups
+        self._search_x = self.search_x.tolist()
+        self._node_t, self._node_x = node_t.tolist(), node_x.tolist()
+        self._seg_span, self._seg_valid = self.seg_span.tolist(), valid.tolist()
+        self._seg_m0, self._seg_m1 = m0.tolist(), m1.tolist()
+        self._span_coeffs = self.ppoly.span_coeffs.tolist()
+        self._tbreak = self.ppoly.x.tolist()
+
+    def _segment_errors(self) -> np.ndarray:
+        seg = np.flatnonzero(self.seg_valid)
+        errors = np.zeros(len(self.seg_valid))
+
+        s = np.array([1/3, 2/3])
+        x0, x1 = self.node_x[seg], self.node_x[seg + 1]
+        x_test = x0[:, None] + s*(x1 - x0)[:, None]
+        seg_test = np.repeat(seg[:, None], len(s), axis=1)
+
+        t = self._estimate(x_test.ravel(), seg_test.ravel())
+        spans = self.seg_span[seg_test.ravel()]
+        residual = self.ppoly._eval_poly_many(t, self.ppoly.span_coeffs[spans], self.ppoly.x[spans]) - x_test.ravel()
+        errors[seg] = np.abs(residual).reshape(x_test.shape).max(axis=1)
+
+        return errors
+
+    def _estimate(self, xvalues:np.ndarray, seg:np.ndarray) -> np.ndarray:
+        """Hermite interpolation of t(x) within table segments followed by one Newton step"""
+        t0, t1 = self.node_t[seg], self.node_t[seg + 1]
+        x0, x1 = self.node_x[seg], self.node_x[seg + 1]
+        h = x1 - x0
+        s = (xvalues - x0)/h
+
+        t = ((2*s**3 - 3*s**2 + 1)*t0 + (s**3 - 2*s**2 + s)*h*self.seg_m0[seg]
+             + (3*s**2 - 2*s**3)*t1 + (s**3 - s**2)*h*self.seg_m1[seg])
+        t = np.clip(t, t0, t1)
+
+        spans = self.seg_span[seg]
+        coeffs, tbreak = self.ppoly.span_coeffs[spans], self.ppoly.x[spans]
+        err = self.ppoly._eval_poly_many(t, coeffs, tbreak) - xvalues
+        slope = self.ppoly._eval_poly_many(t, coeffs, tbreak, nu=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.where(slope > 0, t - err/slope, t)
+
+        return np.clip(t, t0, t1)
+
+    def evalinv(self, xvalue:float, extrapolate=False) -> Optional[float]:
+        if not (self.x_first <= xvalue <= self.x_last):
+            return self.ppoly.evalinv(xvalue, extrapolate=extrapolate)
+
+        seg = min(bisect_right(self._search_x, xvalue) - 1, len(self._seg_valid) - 1)
+        if not self._seg_valid[seg]:
+            return None
+
+        # scalar version of _estimate using plain floats
+        t0, t1 = self._node_t[seg], self._node_t[seg + 1]
+        x0, x1 = self._node_x[seg], self._node_x[seg + 1]
+        h = x1 - x0
+        s = (xvalue - x0)/h
+
+        t = ((2*s**3 - 3*s**2 + 1)*t0 + (s**3 - 2*s**2 + s)*h*self._seg_m0[seg]
+             + (3*s**2 - 2*s**3)*t1 + (s**3 - s**2)*h*self._seg_m1[seg])
+        t = min(max(t, t0), t1)
+
+        span = self._seg_span[seg]
+        coeffs, dt = self._span_coeffs[span], t - self._tbreak[span]
+        poly, slope = 0.0, 0.0
+        for c in coeffs:
+            slope = slope*dt + poly
+            poly = poly*dt + c
+
+        if slope > 0:
+            t -= (poly - xvalue)/slope
+
+        return min(max(t, t0), t1)
+
+    def evalinv_many(self, xvalues:Vector1D, extrapolate=False) -> np.ndarray:
+        xarray = np.asarray(xvalues, dtype=float)
+        tvalues = np.full(xarray.shape, np.nan)
+        xflat = xarray.ravel()
+        tflat = tvalues.reshape(-1)
+
+        inside = (xflat >= self.x_first) & (xflat <= self.x_last)
+        outside = ~inside & ~np.isnan(xflat)
+        tflat[outside] = self.ppoly.evalinv_many(xflat[outside], extrapolate=extrapolate)
+
+        idx = np.flatnonzero(inside)
+        seg = np.minimum(np.searchsorted(self.search_x, xflat[idx], side="right") - 1, len(self.seg_valid) - 1)
+        valid = self.seg_valid[seg]
+        idx, seg = idx[valid], seg[valid]
+        tflat[idx] = self._estimate(xflat[idx], seg)
+
+        return tvalues
+
+
+def real_roots(coeffs:np.ndarray) -> np.ndarray:
+    """
+    Closed-form real roots of polynomials up to degree 3 given row-wise by
+    coefficients in decreasing powers. Missing (complex) roots are set to nan.
+    """
+    m, order = coeffs.shape[0], coeffs.shape[1] - 1
+    roots = np.full((m, order), np.nan)
+
+    with np.errstate(all="ignore"):
+        if order == 1:
+            a, b = coeffs.T
+            roots[:, 0] = -b/a
+
+        elif order == 2:
+            a, b, c = coeffs.T
+            sq = np.sqrt(b*b - 4*a*c)
+            q = -0.5*(b + np.copysign(sq, b))
+            roots[:, 0] = q/a
+            roots[:, 1] = c/q
+
+        elif order == 3:
+            a, b, c, d = coeffs.T
+            b, c, d = b/a, c/a, d/a
+            # depressed cubic y^3 + p*y + q = 0 with t = y - b/3
+            p = c - b*b/3
+            q = 2*b**3/27 - b*c/3 + d
+            shift = -b/3
+            disc = (q/2)**2 + (p/3)**3
+
+            # single real root (Cardano)
+            sq = np.sqrt(np.maximum(disc, 0.0))
+            single = np.cbrt(-q/2 + sq) + np.cbrt(-q/2 - sq) + shift
+
+            # three real roots (trigonometric form)
+            p_neg = np.where(p < 0, p, -1.0)
+            r = 2*np.sqrt(np.maximum(-p/3, 0.0))
+            phi = np.arccos(np.clip(1.5*q/p_neg*np.sqrt(-3/p_neg), -1.0, 1.0))/3
+
+            one = disc > 0
+            for i in range(3):
+                trig = r*np.cos(phi - 2*np.pi*i/3) + shift
+                roots[:, i] = np.where(one, single if i == 0 else np.nan, trig)
+
+        else:
+            raise ValueError(f"Closed-form roots are not supported for degree {order}")
+
+    roots[~np.isfinite(roots)] = np.nan
+    return roots
+
+
+def companion_roots(coeffs:np.ndarray) -> np.ndarray:
+    """
+    Real roots of polynomials given row-wise by coefficients in decreasing powers,
+    computed as eigenvalues of batched companion matrices. Leading coefficients
+    must be nonzero. Missing (complex) roots are set to nan.
+    """
+    m, order = coeffs.shape[0], coeffs.shape[1] - 1
+    companion = np.zeros((m, order, order))
+    companion[:, 0, :] = -coeffs[:, 1:]/coeffs[:, :1]
+    companion[:, np.arange(1, order), np.arange(order - 1)] = 1.0
+
+    roots = np.linalg.eigvals(companion)
+    real = np.abs(roots.imag) <= 1e-10*np.maximum(1.0, np.abs(roots.real))
+
+    return np.where(real, roots.real, np.nan)
@@ -0,0 +1,142 @@
+"""
+Binary container for spline objects.
+
+Layout (all integers little-endian):
+
+    magic       8 bytes   b"SCSPLINE"
+    header_len  uint32    length of the JSON header in bytes
+    header      JSON      {"version", "kind", "class", "attrs", "arrays"}
+    padding     zeros     up to the next ALIGNMENT boundary
+    arrays      raw       C-ordered buffers, each starting on an ALIGNMENT boundary
+
+"arrays" maps each array name to its dtype string, shape and byte offset
+from the start of the array section, so arrays are read as views into the
+underlying buffer without copying.
+"""
+import json
+import math
+import os
+import struct
+import tempfile
+
+import numpy as np
+
+
+MAGIC = b"SCSPLINE"
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+
+_PREFIX = struct.Struct("<8sI")
+
+
+def _align(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def pack(kind, class_name, attrs, arrays):
+    """
+    Serialize JSON-compatible attrs and a dict of arrays into bytes.
+
+    Parameters
+    ----------
+    kind : str
+        Object family checked on unpacking, e.g. "curve" or "surface".
+    class_name : str
+        Name of the serialized class, stored for information.
+    attrs : dict
+        JSON-compatible scalar metadata.
+    arrays : dict
+        Name -> array-like; stored in C order with its dtype and shape.
+    """
+    arrays = {name: np.ascontiguousarray(a) for name, a in arrays.items()}
+
+    layout, size = {}, 0
+    for name, a in arrays.items():
+        layout[name] = {"dtype": a.dtype.str, "shape": list(a.shape), "offset": size}
+        size = _align(size + a.nbytes)
+
+    header = {"version": FORMAT_VERSION, "kind": kind, "class": class_name,
+              "attrs": attrs, "arrays": layout}
+    header_bytes = json.dumps(header).encode("utf-8")
+    start = _align(_PREFIX.size + len(header_bytes))
+
+    out = bytearray(start + size)
+    _PREFIX.pack_into(out, 0, MAGIC, len(header_bytes))
+    out[_PREFIX.size:_PREFIX.size + len(header_bytes)] = header_bytes
+    for name, a in arrays.items():
+        begin = start + layout[name]["offset"]
+        out[begin:begin + a.nbytes] = a.tobytes()
+
+    return bytes(out)
+
+
+def unpack(buffer, kind):
+    """
+    Read a container produced by pack.
+
+    Arrays are views into buffer (read-only unless buffer is writable).
+
+    Returns
+    -------
+    class_name : str
+    attrs : dict
+    arrays : dict of ndarray
+    """
+    buffer = memoryview(buffer).cast("B")
+    if len(buffer) < _PREFIX.size:
+        raise ValueError("Data is too short to be a serialized spline")
+
+    magic, header_len = _PREFIX.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError("Data is not a serialized spline")
+
+    header = json.loads(bytes(buffer[_PREFIX.size:_PREFIX.size + header_len]).decode("utf-8"))
+    if header.get("version") != FORMAT_VERSION:
+        raise ValueError("Unsupported serialized spline version: {}".format(header.get("version")))
+    if header.get("kind") != kind:
+        raise ValueError("Serialized object is a {}, expected a {}".format(header.get("kind"), kind))
+
+    start = _align(_PREFIX.size + header_len)
+    arrays = {}
+    for name, entry in header["arrays"].items():
+        dtype = np.dtype(entry["dtype"])
+        shape = tuple(entry["shape"])
+        count = math.prod(shape)
+        arrays[name] = np.frombuffer(buffer, dtype=dtype, count=count,
+                                     offset=start + entry["offset"]).reshape(shape)
+
+    return header["class"], header["attrs"], arrays
+
+
+def save(path, data):
+    """Write serialized data to path atomically."""
+    path = os.fspath(path)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # mkstemp creates files readable by the owner only
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def load(path, mmap=True):
+    """
+    Buffer holding the contents of path: a read-only memory map, so arrays
+    unpacked from it are paged in on access, or a writable bytearray read
+    from the file when mmap is False.
+    """
+    if mmap:
+        return np.memmap(path, dtype=np.uint8, mode="r")
+
+    with open(path, "rb") as f:
+        buffer = bytearray(os.fstat(f.fileno()).st_size)
+        f.readinto(buffer)
+
+    return buffer
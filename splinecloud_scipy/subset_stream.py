@@ -0,0 +1,329 @@
+"""
+Incremental parser for subset responses.
+
+Only the `table` member is decoded into arrays; runs of plain numbers are
+matched with one regular expression and converted to float64 in bulk,
+which is what keeps this parser as fast as json.loads. An event based
+parser such as ijson yields one Python object per value instead, so it
+would add a dependency without removing the per-value cost, and its
+pure Python backend is several times slower than json.loads.
+
+Non-standard NaN, Infinity and -Infinity tokens are accepted, as by
+json.loads.
+"""
+import codecs
+import json
+import re
+
+import numpy as np
+
+from .subset_table import SubsetTable
+
+
+CHUNK_SIZE = 64 * 1024      # bytes read from the response per step
+_LOOKAHEAD = 512            # characters guaranteed in the buffer before matching a run
+_INITIAL_CAPACITY = 1024    # rows preallocated for the first column
+
+_NUMBER = r'-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?'
+_STRING = r'"(?:[^"\\]|\\.)*"'
+
+_WHITESPACE_RE = re.compile(r'\s*')
+_STRING_RE = re.compile(_STRING)
+_SCALAR_RE = re.compile(r'{}|true|false|null|NaN|-?Infinity'.format(_NUMBER))
+# comma separated numbers of a list column: 1.0, 2, 3e-1
+_NUMBER_RUN_RE = re.compile(r'{0}(?:\s*,\s*{0})*'.format(_NUMBER))
+# index keyed numbers of a dict column: "0": 1.0, "1": 2
+_INDEXED_RUN_RE = re.compile(r'"\d+"\s*:\s*{0}(?:\s*,\s*"\d+"\s*:\s*{0})*'.format(_NUMBER))
+_INDEXED_VALUE_RE = re.compile(r':\s*({})'.format(_NUMBER))
+# characters that may follow a complete token
+_DELIMITERS = frozenset(' \t\r\n,:]}')
+
+
+def read_subset_table(chunks):
+    """
+    Parse a subset response from an iterable of UTF-8 byte chunks.
+
+    The `table` object is decoded column by column straight into NumPy
+    buffers, without building the intermediate dict tree and Python lists
+    of json.loads, so peak memory stays close to the size of the result.
+    Columns are typed as in SubsetTable.from_json; other members of the
+    response are parsed and discarded.
+
+    Parameters
+    ----------
+    chunks : iterable of bytes
+        Response body, e.g. requests.Response.iter_content().
+
+    Returns
+    -------
+    SubsetTable
+    """
+    reader = _Reader(chunks)
+    table = None
+
+    reader.expect('{')
+    if reader.peek() == '}':
+        reader.pos += 1
+    else:
+        while True:
+            key = reader.read_string()
+            reader.expect(':')
+            if key == 'table':
+                table = _read_table(reader)
+            else:
+                reader.read_value()
+            if reader.next_delimiter('}'):
+                break
+
+    if table is None:
+        raise KeyError('table')
+
+    return table
+
+
+def _read_table(reader):
+    columns, numeric, text = [], {}, {}
+    num_rows = None
+
+    reader.expect('{')
+    if reader.peek() == '}':
+        reader.pos += 1
+        return SubsetTable(columns, numeric, text)
+
+    while True:
+        name = reader.read_string()
+        reader.expect(':')
+
+        buffer = _ColumnBuffer(_INITIAL_CAPACITY if num_rows is None else num_rows)
+        _read_column(reader, buffer)
+        values, is_numeric = buffer.finish()
+
+        if num_rows is None:
+            num_rows = len(values)
+        elif len(values) != num_rows:
+            raise ValueError("Subset column '{}' has {} rows, expected {}".format(
+                name, len(values), num_rows))
+
+        columns.append(name)
+        if is_numeric:
+            numeric[name] = values
+        else:
+            text[name] = values
+
+        if reader.next_delimiter('}'):
+            break
+
+    return SubsetTable(columns, numeric, text)
+
+
+def _read_column(reader, buffer):
+    """Read a column given as a list, or as a dict keyed by row index."""
+    opener = reader.peek()
+    if opener == '[':
+        closer, run_re = ']', _NUMBER_RUN_RE
+    elif opener == '{':
+        closer, run_re = '}', _INDEXED_RUN_RE
+    else:
+        raise ValueError("Expected a list or an object for a subset column")
+
+    reader.pos += 1
+    if reader.peek() == closer:
+        reader.pos += 1
+        return
+
+    while True:
+        run = reader.read_run(run_re)
+        if run is not None:
+            buffer.extend(_INDEXED_VALUE_RE.findall(run) if opener == '{' else run.split(','))
+        else:
+            if opener == '{':
+                reader.read_string()
+                reader.expect(':')
+            buffer.append(reader.read_value())
+
+        if reader.next_delimiter(closer):
+            return
+
+
+class _ColumnBuffer:
+    """
+    Growable float64 column that switches to Python objects once a
+    non-numeric value is met.
+    """
+
+    def __init__(self, capacity):
+        self.values = np.empty(max(int(capacity), 1))
+        self.size = 0
+        self.objects = None
+
+    def _reserve(self, size):
+        if size > len(self.values):
+            values = np.empty(max(size, 2 * len(self.values)))
+            values[:self.size] = self.values[:self.size]
+            self.values = values
+
+    def extend(self, tokens):
+        """Append numbers given as JSON number tokens."""
+        if self.objects is not None:
+            self.objects.extend(json.loads(token) for token in tokens)
+            return
+
+        end = self.size + len(tokens)
+        self._reserve(end)
+        self.values[self.size:end] = tokens
+        self.size = end
+
+    def append(self, value):
+        if self.objects is None:
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                self._reserve(self.size + 1)
+                self.values[self.size] = value
+                self.size += 1
+                return
+
+            self.objects = self.values[:self.size].tolist()
+            self.values = None
+
+        self.objects.append(value)
+
+    def finish(self):
+        """Return the column array and whether it is numeric."""
+        if self.objects is None:
+            self.values.resize(self.size, refcheck=False)
+            return self.values, True
+
+        try:
+            return np.asarray(self.objects, dtype=np.float64), True
+        except (TypeError, ValueError):
+            column = np.empty(len(self.objects), dtype=object)
+            column[:] = self.objects
+            return column, False
+
+
+class _Reader:
+    """Buffered JSON token reader over a stream of byte chunks."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        """Append the next chunk to the unread text; False at end of stream."""
+        if self.eof:
+            return False
+
+        text = ''
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                break
+        else:
+            text = self._decoder.decode(b'', final=True)
+            self.eof = True
+
+        self.buf = self.buf[self.pos:] + text
+        self.pos = 0
+
+        return bool(text)
+
+    def skip_whitespace(self):
+        while True:
+            self.pos = _WHITESPACE_RE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf) or not self.fill():
+                return
+
+    def peek(self):
+        self.skip_whitespace()
+        if self.pos >= len(self.buf):
+            raise ValueError("Unexpected end of JSON stream")
+
+        return self.buf[self.pos]
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError("Expected {!r} at {!r}".format(char, self.buf[self.pos:self.pos + 20]))
+        self.pos += 1
+
+    def next_delimiter(self, closer):
+        """Consume ',' (returns False) or the closing bracket (returns True)."""
+        char = self.peek()
+        self.pos += 1
+        if char == closer:
+            return True
+        if char != ',':
+            raise ValueError("Expected ',' or {!r}, got {!r}".format(closer, char))
+
+        return False
+
+    def _complete(self, end):
+        """Whether a token match ending at end cannot continue in the next chunk."""
+        return self.eof or (end < len(self.buf) and self.buf[end] in _DELIMITERS)
+
+    def read_token(self, pattern):
+        """Match a single token, reading on while it may be truncated."""
+        self.skip_whitespace()
+        while True:
+            match = pattern.match(self.buf, self.pos)
+            if match is not None and self._complete(match.end()):
+                self.pos = match.end()
+                return match.group()
+            if not self.fill() and match is None:
+                raise ValueError("Invalid JSON at {!r}".format(self.buf[self.pos:self.pos + 20]))
+
+    def read_run(self, pattern):
+        """
+        Match a run of comma separated tokens, up to the last one known to be
+        complete; None if no run starts here.
+        """
+        self.skip_whitespace()
+        while len(self.buf) - self.pos < _LOOKAHEAD and self.fill():
+            pass
+
+        match = pattern.match(self.buf, self.pos)
+        if match is None:
+            return None
+
+        end = match.end()
+        if not self._complete(end):
+            # the last token may continue in the next chunk
+            end = self.buf.rfind(',', match.start(), end)
+            if end < 0:
+                return None
+
+        run = self.buf[self.pos:end]
+        self.pos = end
+
+        return run
+
+    def read_string(self):
+        if self.peek() != '"':
+            raise ValueError("Expected a string at {!r}".format(self.buf[self.pos:self.pos + 20]))
+
+        return json.loads(self.read_token(_STRING_RE))
+
+    def read_value(self):
+        char = self.peek()
+        if char == '"':
+            return self.read_string()
+        if char not in '[{':
+            return json.loads(self.read_token(_SCALAR_RE))
+
+        self.pos += 1
+        closer = ']' if char == '[' else '}'
+        items = [] if char == '[' else {}
+        if self.peek() == closer:
+            self.pos += 1
+            return items
+
+        while True:
+            if char == '[':
+                items.append(self.read_value())
+            else:
+                key = self.read_string()
+                self.expect(':')
+                items[key] = self.read_value()
+            if self.next_delimiter(closer):
+                return items
@@ -0,0 +1,107 @@
+import numpy as np
+
+
+class SubsetTable:
+    """
+    Columnar table of subset data.
+
+    Numeric columns are stored as float64 arrays and all other columns as
+    object arrays, so a single text column does not force the numeric data
+    into Python objects. Columns keep the order of the API response.
+
+    Parameters
+    ----------
+    columns : list of str
+        Column names in table order.
+    numeric : dict
+        Float64 array for each numeric column.
+    text : dict
+        Object array for each non-numeric column.
+    """
+
+    def __init__(self, columns, numeric, text):
+        self.columns = list(columns)
+        self.numeric = numeric
+        self.text = text
+
+    @classmethod
+    def from_json(cls, table):
+        """
+        Build a table from the decoded `table` field of a subset response,
+        where each column is a list of values or a dict keyed by row index.
+        """
+        columns = list(table.keys())
+        numeric, text = {}, {}
+        num_rows = None
+
+        for name, values in table.items():
+            # Treat column data as ordered sequences, ignoring any index keys
+            if isinstance(values, dict):
+                values = list(values.values())
+
+            if num_rows is None:
+                num_rows = len(values)
+            elif len(values) != num_rows:
+                raise ValueError("Subset column '{}' has {} rows, expected {}".format(
+                    name, len(values), num_rows))
+
+            try:
+                numeric[name] = np.asarray(values, dtype=np.float64)
+            except (TypeError, ValueError):
+                column = np.empty(len(values), dtype=object)
+                column[:] = values
+                text[name] = column
+
+        return cls(columns, numeric, text)
+
+    def __len__(self):
+        if not self.columns:
+            return 0
+
+        return len(self[self.columns[0]])
+
+    def __getitem__(self, name):
+        if name in self.numeric:
+            return self.numeric[name]
+
+        return self.text[name]
+
+    def __repr__(self):
+        return "<{} rows={} numeric={} text={}>".format(
+            type(self).__name__, len(self), len(self.numeric), len(self.text))
+
+    @property
+    def is_numeric(self):
+        return not self.text
+
+    def to_array(self):
+        """
+        Two-dimensional (rows, columns) array: float64 when every column is
+        numeric, object otherwise.
+        """
+        num_rows = len(self)
+        if self.is_numeric:
+            if not self.columns:
+                return np.empty((num_rows, 0))
+
+            return np.column_stack([self.numeric[name] for name in self.columns])
+
+        table = np.empty((num_rows, len(self.columns)), dtype=object)
+        for ci, name in enumerate(self.columns):
+            table[:, ci] = self[name]
+
+        return table
+
+    def to_records(self):
+        """Structured array with a float64 or object field per column."""
+        dtype = [(name, np.float64 if name in self.numeric else object)
+                 for name in self.columns]
+        records = np.empty(len(self), dtype=dtype)
+        for name in self.columns:
+            records[name] = self[name]
+
+        return records
+
+    def astuple(self):
+        """The (columns, table) pair returned by load_subset."""
+        return list(self.columns), self.to_array()
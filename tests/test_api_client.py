@@ -1,4 +1,13 @@
+import asyncio
+import json
+import pickle
+import tempfile
+import threading
+import time
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
 import responses
 import numpy as np
 
@@ -9,7 +18,16 @@ from splinecloud_scipy import (
     SPLINECLOUD_API_URL, 
     ParametricUnivariateSpline, 
     ParametricBivariateSpline,
-    SplineSurface
+    SplineSurface,
+    SplineCloudClient,
+    SubsetLoadError,
+    ResponseCache,
+    CacheMissError,
+    AsyncSplineCloudClient,
+    load_subset_async,
+    BulkLoadResult,
+    SubsetTable,
+    SplineCurve
 )
 
 
@@ -49,6 +67,24 @@ class APIClientTests(unittest.TestCase):
         self.assertEqual(columns, ['column1', 'column2'])
         self.assertEqual(table.tolist(), [["attr1", 4], ["attr2", 5], ["attr3", 6]])
 
+    @responses.activate
+    def test_load_subset_columnar(self):
+        subset_url = SPLINECLOUD_API_URL+'/subsets/sbt_1234567890abcdef'
+        subset_response = {
+            'table': {
+                'column1': {'0': "attr1", '1': "attr2"},
+                'column2': {'0': 4, '1': 5},
+            }
+        }
+
+        responses.add(responses.GET, subset_url, json=subset_response, status=200)
+        table = load_subset(subset_url, columnar=True)
+
+        self.assertIsInstance(table, SubsetTable)
+        self.assertEqual(table.columns, ['column1', 'column2'])
+        self.assertEqual(table['column2'].dtype, np.float64)
+        self.assertEqual(table['column1'].tolist(), ["attr1", "attr2"])
+
     @responses.activate
     def test_load_spline(self):
         curve_url = SPLINECLOUD_API_URL+'/subsets/sbt_1234567890abcdef'
@@ -145,5 +181,623 @@ class APIClientTests(unittest.TestCase):
         self.assertEqual(surface.relation_uid, "lr2_qwerty")
 
 
+
+class StubAPIServer:
+    """
+    Local HTTP server standing in for the SplineCloud API. Serves JSON
+    bodies from `routes`; each path can first fail with `failures[path]`
+    503 responses, stall for `delays[path]` seconds or carry an ETag
+    from `etags[path]` that is honoured in conditional requests.
+    """
+
+    def __init__(self):
+        self.routes, self.failures, self.delays, self.etags = {}, {}, {}, {}
+        self.hits = {}
+        self.inflight = self.max_inflight = 0
+        self.lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with stub.lock:
+                    stub.hits[self.path] = stub.hits.get(self.path, 0) + 1
+                    stub.inflight += 1
+                    stub.max_inflight = max(stub.max_inflight, stub.inflight)
+                try:
+                    self._respond()
+                finally:
+                    with stub.lock:
+                        stub.inflight -= 1
+
+            def _respond(self):
+                if stub.delays.get(self.path):
+                    threading.Event().wait(stub.delays[self.path])
+
+                if stub.failures.get(self.path, 0) > 0:
+                    stub.failures[self.path] -= 1
+                    self.send_response(503)
+                    self.end_headers()
+                    return
+
+                if self.path not in stub.routes:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+
+                etag = stub.etags.get(self.path)
+                if etag is not None and self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+
+                body = json.dumps(stub.routes[self.path]).encode()
+                self.send_response(200)
+                if etag is not None:
+                    self.send_header("ETag", etag)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        class Server(ThreadingHTTPServer):
+            request_queue_size = 128    # accept bursts of concurrent connections
+
+        self.server = Server(("127.0.0.1", 0), Handler)
+        self.url = "http://127.0.0.1:{}".format(self.server.server_address[1])
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+SUBSET_TABLE = {'table': {'x': {'0': 1, '1': 2}, 'y': {'0': 3.0, '1': 4.0}}}
+
+
+class SplineCloudClientTests(unittest.TestCase):
+
+    def test_bare_ids_use_base_url(self):
+        with StubAPIServer() as stub:
+            stub.routes['/subsets/sbt_1234567890ab/'] = SUBSET_TABLE
+
+            with SplineCloudClient(base_url=stub.url) as client:
+                columns, table = client.load_subset('sbt_1234567890ab')
+
+        self.assertEqual(columns, ['x', 'y'])
+        self.assertEqual(table.tolist(), [[1.0, 3.0], [2.0, 4.0]])
+
+    def test_invalid_id(self):
+        client = SplineCloudClient()
+        with self.assertRaises(ValueError):
+            client.load_spline('spl_short')
+
+    def test_retries_transient_errors(self):
+        with StubAPIServer() as stub:
+            stub.routes['/subsets/a'] = SUBSET_TABLE
+            stub.failures['/subsets/a'] = 2
+
+            client = SplineCloudClient(retries=3, backoff_factor=0)
+            columns, _ = client.load_subset(stub.url + '/subsets/a')
+
+        self.assertEqual(columns, ['x', 'y'])
+        self.assertEqual(stub.hits['/subsets/a'], 3)
+
+    def test_gives_up_after_retries(self):
+        with StubAPIServer() as stub:
+            stub.routes['/subsets/a'] = SUBSET_TABLE
+            stub.failures['/subsets/a'] = 5
+
+            client = SplineCloudClient(retries=1, backoff_factor=0)
+            with self.assertRaises(requests.HTTPError):
+                client.load_subset(stub.url + '/subsets/a')
+
+        self.assertEqual(stub.hits['/subsets/a'], 2)
+
+    def test_timeout(self):
+        with StubAPIServer() as stub:
+            stub.routes['/subsets/slow'] = SUBSET_TABLE
+            stub.delays['/subsets/slow'] = 0.5
+
+            client = SplineCloudClient(timeout=0.1, retries=0)
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                client.load_subset(stub.url + '/subsets/slow')
+
+    def test_surface_subsets_use_client(self):
+        with StubAPIServer() as stub:
+            stub.routes['/subsets/sbt_1234567890ab/'] = SUBSET_TABLE
+            stub.routes['/surfaces/srf_1234567890ab/'] = {
+                "spline": {"tu": [0, 0, 1, 1], "tv": [0, 0, 1, 1],
+                           "cp": np.zeros((2, 2, 3)).tolist(), "w": np.ones((2, 2)).tolist(),
+                           "ku": 1, "kv": 1},
+                "subset_uids": ["sbt_1234567890ab"],
+                "x2_values": [0.5],
+            }
+
+            client = SplineCloudClient(base_url=stub.url)
+            surface = client.load_spline_surface('srf_1234567890ab')
+            labels, data = surface.load_data()
+
+        self.assertIs(surface.client, client)
+        self.assertEqual(data.tolist(), [[1.0, 0.5, 3.0], [2.0, 0.5, 4.0]])
+
+
+def get_stub_surface(subset_uids):
+    return {
+        "spline": {"tu": [0, 0, 1, 1], "tv": [0, 0, 1, 1],
+                   "cp": np.zeros((2, 2, 3)).tolist(), "w": np.ones((2, 2)).tolist(),
+                   "ku": 1, "kv": 1},
+        "subset_uids": subset_uids,
+        "x2_values": list(range(len(subset_uids))),
+    }
+
+
+class LoadSubsetsTests(unittest.TestCase):
+
+    def setUp(self):
+        self.uids = ["sbt_{:012d}".format(i) for i in range(12)]
+
+    def serve_subsets(self, stub, delay=0.0):
+        for i, uid in enumerate(self.uids):
+            path = '/subsets/{}/'.format(uid)
+            stub.routes[path] = {'table': {'x': [float(i)], 'y': [float(10 * i)]}}
+            stub.delays[path] = delay
+
+    def test_concurrent_and_ordered(self):
+        with StubAPIServer() as stub:
+            self.serve_subsets(stub, delay=0.1)
+            client = SplineCloudClient(base_url=stub.url)
+            surface = SplineSurface(get_stub_surface(self.uids), client=client)
+
+            start = time.time()
+            subsets = surface.load_subsets(max_workers=4)
+            duration = time.time() - start
+
+        self.assertEqual([table[0, 0] for _, table in subsets], list(range(12)))
+        self.assertEqual(stub.max_inflight, 4)
+        self.assertLess(duration, 12 * 0.1)
+        self.assertIs(surface.load_subsets(), subsets)
+
+    def test_errors_are_aggregated(self):
+        with StubAPIServer() as stub:
+            self.serve_subsets(stub)
+            for uid in (self.uids[2], self.uids[7]):
+                del stub.routes['/subsets/{}/'.format(uid)]
+
+            client = SplineCloudClient(base_url=stub.url, retries=0)
+            surface = SplineSurface(get_stub_surface(self.uids), client=client)
+            with self.assertRaises(SubsetLoadError) as ctx:
+                surface.load_subsets()
+
+        error = ctx.exception
+        self.assertEqual(sorted(error.errors), [self.uids[2], self.uids[7]])
+        self.assertIsInstance(error.errors[self.uids[2]], requests.HTTPError)
+        self.assertIsNone(error.results[2])
+        self.assertEqual(error.results[3][1][0, 0], 3.0)
+        self.assertEqual(surface.subsets, [])
+
+
+class StreamedSubsetTests(unittest.TestCase):
+
+    def test_matches_buffered_load(self):
+        n = 20000
+        payload = {'table': {
+            'x': {str(i): 0.1 * i for i in range(n)},
+            'y': [float(i) ** 0.5 for i in range(n)],
+            'name': ["p{}".format(i) for i in range(n)],
+        }}
+        with StubAPIServer() as stub:
+            stub.routes['/subsets/sbt_1234567890ab/'] = payload
+            client = SplineCloudClient(base_url=stub.url)
+
+            columns_ref, table_ref = client.load_subset('sbt_1234567890ab')
+            columns, table = client.load_subset('sbt_1234567890ab', stream=True)
+            columnar = client.load_subset('sbt_1234567890ab', columnar=True, stream=True)
+            streamed_async = asyncio.run(AsyncSplineCloudClient(client).load_subset(
+                'sbt_1234567890ab', columnar=True, stream=True))
+
+        self.assertEqual(columns, columns_ref)
+        self.assertEqual(table.tolist(), table_ref.tolist())
+        self.assertIsInstance(columnar, SubsetTable)
+        self.assertEqual(columnar['x'].dtype, np.float64)
+        self.assertEqual(streamed_async['name'].tolist(), columnar['name'].tolist())
+
+    def test_non_finite_values_match_buffered_load(self):
+        payload = {'table': {
+            'x': [0.0, float('nan'), float('inf'), -float('inf')],
+            'y': {'0': float('nan'), '1': 1.0, '2': -float('inf'), '3': 2.0},
+        }}
+        with StubAPIServer() as stub:
+            stub.routes['/subsets/sbt_1234567890ab/'] = payload
+            client = SplineCloudClient(base_url=stub.url)
+
+            columns_ref, table_ref = client.load_subset('sbt_1234567890ab')
+            columns, table = client.load_subset('sbt_1234567890ab', stream=True)
+
+        self.assertEqual(columns, columns_ref)
+        self.assertEqual(table.dtype, np.float64)
+        np.testing.assert_array_equal(table, table_ref)
+
+    def test_http_errors(self):
+        with StubAPIServer() as stub:
+            client = SplineCloudClient(base_url=stub.url, retries=0)
+            with self.assertRaises(requests.HTTPError):
+                client.load_subset('sbt_1234567890ab', stream=True)
+
+
+class SurfaceLoadDataTests(unittest.TestCase):
+
+    def get_surface(self, tables):
+        surface = SplineSurface(get_stub_surface(["sbt_{:012d}".format(i) for i in range(len(tables))]))
+        surface.x2_values = [0.5 * i for i in range(len(tables))]
+        surface.subsets = [(['x', 'y'], table) for table in tables]
+        return surface
+
+    def test_matches_pointwise_assembly(self):
+        rng = np.random.default_rng(0)
+        surface = self.get_surface([rng.normal(size=(n, 2)) for n in (5, 0, 12, 1)])
+        labels, data = surface.load_data()
+
+        expected = [[point[0], surface.x2_values[i], point[1]]
+                    for i, (_, table) in enumerate(surface.subsets) for point in table]
+        self.assertEqual(data.dtype, np.float64)
+        self.assertEqual(data.tolist(), expected)
+
+    def test_object_tables(self):
+        table = np.array([[1.0, 2.0, "a"]], dtype=object)
+        labels, data = self.get_surface([table]).load_data()
+
+        self.assertEqual(data.dtype, object)
+        self.assertEqual(data.tolist(), [[1.0, 0.0, 2.0]])
+
+    def test_serialization_keeps_metadata(self):
+        surface = self.get_surface([np.arange(4.0).reshape(2, 2)])
+        surface.uid, surface.x1_label = "srf_1234567890ab", "alpha"
+
+        restored = SplineSurface.from_bytes(surface.to_bytes())
+
+        self.assertIsInstance(restored, SplineSurface)
+        self.assertEqual(restored.uid, "srf_1234567890ab")
+        self.assertEqual(restored.x1_label, "alpha")
+        self.assertEqual(restored.subset_uids, surface.subset_uids)
+        self.assertEqual(restored.x2_values, surface.x2_values)
+        self.assertEqual(restored.subsets, [])
+        self.assertIsNone(restored.client)
+
+    def test_per_subset_views(self):
+        tables = [np.arange(6.0).reshape(3, 2), np.arange(4.0).reshape(2, 2)]
+        labels, data = self.get_surface(tables).load_data(per_subset=True)
+
+        self.assertEqual(len(data), 2)
+        x1, x2, y = data[1]
+        self.assertTrue(np.shares_memory(x1, tables[1]))
+        self.assertTrue(np.shares_memory(y, tables[1]))
+        self.assertEqual(x1.tolist(), [0.0, 2.0])
+        self.assertEqual(x2.tolist(), [0.5, 0.5])
+        self.assertEqual(y.tolist(), [1.0, 3.0])
+        self.assertFalse(x2.flags.writeable)
+
+
+class ResponseCacheClientTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def test_fresh_entries_skip_network(self):
+        with StubAPIServer() as stub:
+            stub.routes['/subsets/a'] = SUBSET_TABLE
+            client = SplineCloudClient(cache=self.tmpdir.name)
+
+            first = client.load_subset(stub.url + '/subsets/a')
+            second = client.load_subset(stub.url + '/subsets/a')
+
+        self.assertEqual(stub.hits['/subsets/a'], 1)
+        self.assertEqual(first[1].tolist(), second[1].tolist())
+
+    def test_survives_client_restart(self):
+        with StubAPIServer() as stub:
+            stub.routes['/subsets/a'] = SUBSET_TABLE
+            SplineCloudClient(cache=self.tmpdir.name).load_subset(stub.url + '/subsets/a')
+            SplineCloudClient(cache=self.tmpdir.name).load_subset(stub.url + '/subsets/a')
+
+        self.assertEqual(stub.hits['/subsets/a'], 1)
+
+    def test_stale_entries_are_revalidated(self):
+        with StubAPIServer() as stub:
+            stub.routes['/subsets/a'] = SUBSET_TABLE
+            stub.etags['/subsets/a'] = '"v1"'
+            cache = ResponseCache(self.tmpdir.name, ttl=0)
+            client = SplineCloudClient(cache=cache)
+
+            client.load_subset(stub.url + '/subsets/a')
+            # unchanged: the server answers 304 and the cached body is used
+            stub.routes['/subsets/a'] = {'table': {'x': [9.0]}}
+            columns, _ = client.load_subset(stub.url + '/subsets/a')
+            self.assertEqual(columns, ['x', 'y'])
+
+            # changed: a new ETag returns the new body
+            stub.etags['/subsets/a'] = '"v2"'
+            columns, _ = client.load_subset(stub.url + '/subsets/a')
+            self.assertEqual(columns, ['x'])
+
+        self.assertEqual(stub.hits['/subsets/a'], 3)
+
+    def test_streamed_subset_from_cache(self):
+        with StubAPIServer() as stub:
+            stub.routes['/subsets/a'] = SUBSET_TABLE
+            client = SplineCloudClient(cache=self.tmpdir.name)
+
+            client.load_subset(stub.url + '/subsets/a')
+            columns, table = client.load_subset(stub.url + '/subsets/a', stream=True)
+
+        self.assertEqual(stub.hits['/subsets/a'], 1)
+        self.assertEqual(columns, ['x', 'y'])
+
+    def test_offline_mode(self):
+        with StubAPIServer() as stub:
+            stub.routes['/subsets/a'] = SUBSET_TABLE
+            SplineCloudClient(cache=self.tmpdir.name).load_subset(stub.url + '/subsets/a')
+
+            offline = SplineCloudClient(cache=ResponseCache(self.tmpdir.name, ttl=0, offline=True))
+            columns, _ = offline.load_subset(stub.url + '/subsets/a')
+            with self.assertRaises(CacheMissError):
+                offline.load_subset(stub.url + '/subsets/b')
+
+        self.assertEqual(columns, ['x', 'y'])
+        self.assertEqual(stub.hits, {'/subsets/a': 1})
+
+
+def get_stub_curve(scale):
+    return {
+        "spline": {"t": [0, 0, 1, 1], "c": [[0.0, 0.0], [1.0, scale]], "k": 1},
+        "scale_x": "Linear",
+        "scale_y": "Linear",
+        "subset_uid": "sbt_1234567890ab",
+    }
+
+
+class SplineCurveTests(unittest.TestCase):
+
+    def test_load_data_is_bound_to_client(self):
+        with StubAPIServer() as stub:
+            stub.routes['/curves/spl_1234567890ab/'] = get_stub_curve(2.0)
+            stub.routes['/subsets/sbt_1234567890ab/'] = SUBSET_TABLE
+            client = SplineCloudClient(base_url=stub.url)
+
+            spline = client.load_spline('spl_1234567890ab')
+            columns, table = spline.load_data()
+
+        self.assertIsInstance(spline, SplineCurve)
+        self.assertEqual(spline.subset_uid, "sbt_1234567890ab")
+        self.assertIs(spline.client, client)
+        self.assertEqual(columns, ['x', 'y'])
+
+    def test_pickle(self):
+        with StubAPIServer() as stub:
+            stub.routes['/curves/spl_1234567890ab/'] = dict(get_stub_curve(2.0), uid="spl_1234567890ab")
+            spline = SplineCloudClient(base_url=stub.url).load_spline('spl_1234567890ab')
+
+        restored = pickle.loads(pickle.dumps(spline))
+
+        self.assertIsInstance(restored, SplineCurve)
+        self.assertEqual(restored.uid, "spl_1234567890ab")
+        self.assertEqual(restored.subset_uid, "sbt_1234567890ab")
+        self.assertIsNone(restored.client)
+        self.assertEqual(restored.eval(0.5), spline.eval(0.5))
+
+    def test_without_subset(self):
+        curve = get_stub_curve(1.0)
+        del curve["subset_uid"]
+
+        with self.assertRaises(ValueError):
+            SplineCurve(curve).load_data()
+
+    def test_surface_pickle_drops_client(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = SplineCloudClient(cache=tmpdir)
+            surface = SplineSurface(dict(get_stub_surface(["sbt_1234567890ab"]), uid="srf_1234567890ab"),
+                                    client=client)
+            surface.subsets = [(['x', 'y'], np.ones((2, 2)))]
+
+            restored = pickle.loads(pickle.dumps(surface))
+
+        self.assertIsInstance(restored, SplineSurface)
+        self.assertEqual(restored.uid, "srf_1234567890ab")
+        self.assertEqual(restored.subset_uids, ["sbt_1234567890ab"])
+        self.assertIsNone(restored.client)
+        self.assertEqual(restored.subsets, [])
+        self.assertEqual(restored(0.5, 0.5), surface(0.5, 0.5))
+
+
+class BulkLoadTests(unittest.TestCase):
+
+    def setUp(self):
+        self.ids = ["spl_{:012d}".format(i) for i in range(6)]
+
+    def serve_curves(self, stub, delay=0.0):
+        for i, curve_id in enumerate(self.ids):
+            path = '/curves/{}/'.format(curve_id)
+            stub.routes[path] = get_stub_curve(float(i))
+            stub.delays[path] = delay
+
+    def test_parallel_and_deduplicated(self):
+        with StubAPIServer() as stub:
+            self.serve_curves(stub, delay=0.1)
+            client = SplineCloudClient(base_url=stub.url)
+            duplicate_url = stub.url + '/curves/{}/'.format(self.ids[0])
+
+            start = time.time()
+            splines = client.load_splines(self.ids + self.ids[:2] + [duplicate_url], max_workers=6)
+            duration = time.time() - start
+
+        self.assertIsInstance(splines, BulkLoadResult)
+        self.assertEqual(list(splines), self.ids + [duplicate_url])
+        self.assertEqual(splines.errors, {})
+        self.assertTrue(all(hits == 1 for hits in stub.hits.values()))
+        self.assertLess(duration, 6 * 0.1)
+        self.assertIs(splines[self.ids[0]], splines[duplicate_url])
+        for i, curve_id in enumerate(self.ids):
+            self.assertIsInstance(splines[curve_id], ParametricUnivariateSpline)
+            self.assertAlmostEqual(float(splines[curve_id].eval(1.0)), float(i))
+
+    def test_per_id_errors(self):
+        with StubAPIServer() as stub:
+            self.serve_curves(stub)
+            del stub.routes['/curves/{}/'.format(self.ids[3])]
+
+            client = SplineCloudClient(base_url=stub.url, retries=0)
+            splines = client.load_splines(self.ids + ['spl_bad'])
+
+        self.assertEqual(sorted(splines.errors), [self.ids[3], 'spl_bad'])
+        self.assertIsInstance(splines.errors[self.ids[3]], requests.HTTPError)
+        self.assertIsInstance(splines.errors['spl_bad'], ValueError)
+        self.assertEqual(len(splines), 5)
+        self.assertNotIn(self.ids[3], splines)
+
+    def test_lazy_construction(self):
+        with StubAPIServer() as stub:
+            stub.routes['/curves/{}/'.format(self.ids[0])] = {"spline": {}}
+            stub.routes['/curves/{}/'.format(self.ids[1])] = get_stub_curve(2.0)
+
+            client = SplineCloudClient(base_url=stub.url)
+            splines = client.load_splines(self.ids[:2], lazy=True)
+
+        # the malformed payload only fails once it is built
+        self.assertEqual(splines.errors, {})
+        with self.assertRaises(KeyError):
+            splines[self.ids[0]]
+        spline = splines[self.ids[1]]
+        self.assertIs(splines[self.ids[1]], spline)
+        self.assertAlmostEqual(float(spline.eval(1.0)), 2.0)
+
+    def test_surfaces(self):
+        with StubAPIServer() as stub:
+            stub.routes['/surfaces/srf_1234567890ab/'] = get_stub_surface(["sbt_1234567890ab"])
+            client = SplineCloudClient(base_url=stub.url)
+            surfaces = client.load_spline_surfaces(['srf_1234567890ab'])
+
+        self.assertIsInstance(surfaces['srf_1234567890ab'], SplineSurface)
+        self.assertIs(surfaces['srf_1234567890ab'].client, client)
+
+
+class AsyncClientTests(unittest.TestCase):
+
+    def setUp(self):
+        self.uids = ["sbt_{:012d}".format(i) for i in range(8)]
+
+    def serve_subsets(self, stub, delay=0.0):
+        for i, uid in enumerate(self.uids):
+            path = '/subsets/{}/'.format(uid)
+            stub.routes[path] = {'table': {'x': [float(i)], 'y': [float(10 * i)]}}
+            stub.delays[path] = delay
+
+    def test_matches_blocking_loaders(self):
+        with StubAPIServer() as stub:
+            stub.routes['/subsets/a'] = SUBSET_TABLE
+            stub.routes['/surfaces/srf_1234567890ab/'] = get_stub_surface(self.uids[:1])
+            client = SplineCloudClient(base_url=stub.url)
+            aclient = AsyncSplineCloudClient(client)
+
+            async def fetch():
+                return await asyncio.gather(
+                    aclient.load_subset(stub.url + '/subsets/a'),
+                    aclient.load_spline_surface('srf_1234567890ab'))
+
+            (columns, table), surface = asyncio.run(fetch())
+            columns_ref, table_ref = client.load_subset(stub.url + '/subsets/a')
+
+        self.assertEqual(columns, columns_ref)
+        self.assertEqual(table.tolist(), table_ref.tolist())
+        self.assertIsInstance(surface, SplineSurface)
+        self.assertIs(surface.client, client)
+
+    def test_shared_semaphore_bounds_requests(self):
+        with StubAPIServer() as stub:
+            self.serve_subsets(stub, delay=0.1)
+            client = SplineCloudClient(base_url=stub.url)
+            surface = SplineSurface(get_stub_surface(self.uids), client=client)
+
+            async def fetch():
+                semaphore = asyncio.Semaphore(3)
+                return await surface.load_subsets_async(semaphore=semaphore)
+
+            start = time.time()
+            subsets = asyncio.run(fetch())
+            duration = time.time() - start
+
+        self.assertEqual([table[0, 0] for _, table in subsets], list(range(8)))
+        self.assertEqual(stub.max_inflight, 3)
+        self.assertLess(duration, 8 * 0.1)
+
+    def test_errors_are_aggregated(self):
+        with StubAPIServer() as stub:
+            self.serve_subsets(stub)
+            del stub.routes['/subsets/{}/'.format(self.uids[5])]
+
+            client = SplineCloudClient(base_url=stub.url, retries=0)
+            surface = SplineSurface(get_stub_surface(self.uids), client=client)
+            with self.assertRaises(SubsetLoadError) as ctx:
+                asyncio.run(surface.load_subsets_async())
+
+        self.assertEqual(list(ctx.exception.errors), [self.uids[5]])
+        self.assertEqual(surface.subsets, [])
+
+    def test_module_level_loader(self):
+        with StubAPIServer() as stub:
+            stub.routes['/subsets/a'] = SUBSET_TABLE
+            columns, _ = asyncio.run(load_subset_async(stub.url + '/subsets/a'))
+
+        self.assertEqual(columns, ['x', 'y'])
+
+    def test_requests_overlap_beyond_default_executor(self):
+        # more requests in flight than the default executor's min(32, cpu + 4)
+        # threads, without connections being discarded from the pool
+        self.uids = ["sbt_{:012d}".format(i) for i in range(48)]
+        with StubAPIServer() as stub:
+            self.serve_subsets(stub, delay=0.5)
+            client = SplineCloudClient(base_url=stub.url)
+
+            async def fetch(aclient):
+                return await asyncio.gather(*(aclient.load_subset(uid) for uid in self.uids))
+
+            adapter = client.session.get_adapter(stub.url)
+            with self.assertNoLogs('urllib3.connectionpool', level='WARNING'):
+                subsets = asyncio.run(fetch(client.async_client))
+                asyncio.run(fetch(client.async_client))
+
+        self.assertEqual([table[0, 0] for _, table in subsets], list(range(48)))
+        self.assertEqual(stub.max_inflight, 48)
+        self.assertIs(client.session.get_adapter(stub.url), adapter)
+
+    def test_concurrency_capped_at_pool_size(self):
+        with StubAPIServer() as stub:
+            self.serve_subsets(stub, delay=0.1)
+            client = SplineCloudClient(base_url=stub.url, pool_maxsize=4)
+            surface = SplineSurface(get_stub_surface(self.uids), client=client)
+
+            async def fetch():
+                return await surface.load_subsets_async(semaphore=asyncio.Semaphore(8))
+
+            with self.assertNoLogs('urllib3.connectionpool', level='WARNING'):
+                subsets = asyncio.run(fetch())
+
+            aclient = client.async_client
+            client.close()
+
+        self.assertEqual(len(subsets), 8)
+        self.assertEqual(stub.max_inflight, 4)
+        self.assertEqual(aclient.max_concurrency, 4)
+        self.assertEqual(AsyncSplineCloudClient(client, max_concurrency=100).max_concurrency, 4)
+        self.assertTrue(aclient.closed)
+        self.assertIsNot(client.async_client, aclient)
+
+
 if __name__ == '__main__':
     unittest.main()
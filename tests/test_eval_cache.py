@@ -0,0 +1,70 @@
+import threading
+import unittest
+
+from splinecloud_scipy.eval_cache import EvalCache, CacheInfo
+
+
+class TestEvalCache(unittest.TestCase):
+
+    def test_hits_and_misses(self):
+        cache = EvalCache(maxsize=4)
+        key = cache.key((1.0, 2.0), (True, 0.5))
+
+        self.assertIs(cache.get(key), EvalCache.MISSING)
+        cache.put(key, 3.0)
+        self.assertEqual(cache.get(key), 3.0)
+        self.assertEqual(cache.info(), CacheInfo(hits=1, misses=1, maxsize=4, currsize=1))
+
+    def test_keys_are_quantized(self):
+        cache = EvalCache(digits=10)
+
+        self.assertEqual(cache.key((0.1 + 0.2,)), cache.key((0.3,)))
+        self.assertNotEqual(cache.key((0.3,)), cache.key((0.3 + 1e-6,)))
+        self.assertNotEqual(cache.key((0.3,), (True,)), cache.key((0.3,), (False,)))
+
+    def test_lru_eviction(self):
+        cache = EvalCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")         # "b" is now least recently used
+        cache.put("c", 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.get("b"), EvalCache.MISSING)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_clear(self):
+        cache = EvalCache()
+        cache.put("a", 1)
+        cache.get("a")
+        cache.clear()
+
+        self.assertEqual(cache.info(), CacheInfo(hits=0, misses=0, maxsize=4096, currsize=0))
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            EvalCache(maxsize=0)
+
+    def test_concurrent_access(self):
+        cache = EvalCache(maxsize=16)
+
+        def worker(offset):
+            for i in range(2000):
+                key = cache.key(((i + offset) % 40,))
+                if cache.get(key) is EvalCache.MISSING:
+                    cache.put(key, i)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        info = cache.info()
+        self.assertEqual(info.hits + info.misses, 8000)
+        self.assertLessEqual(info.currsize, 16)
+
+
+if __name__ == '__main__':
+    unittest.main()
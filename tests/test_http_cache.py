@@ -0,0 +1,72 @@
+import os
+import tempfile
+import time
+import unittest
+
+from splinecloud_scipy.http_cache import ResponseCache
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.cache = ResponseCache(self.tmpdir.name)
+
+    def test_put_and_get(self):
+        self.assertIsNone(self.cache.get("http://a"))
+        self.cache.put("http://a", b'{"x": 1}', etag='"e1"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT")
+
+        entry = self.cache.get("http://a")
+        self.assertEqual(entry.body, b'{"x": 1}')
+        self.assertEqual(entry.validators(), {"If-None-Match": '"e1"',
+                                              "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"})
+        self.assertTrue(self.cache.is_fresh(entry))
+
+    def test_ttl(self):
+        self.cache.put("http://a", b"1")
+        entry = self.cache.get("http://a")
+
+        self.assertFalse(ResponseCache(self.tmpdir.name, ttl=0).is_fresh(entry))
+        self.assertTrue(ResponseCache(self.tmpdir.name, ttl=None).is_fresh(entry))
+
+    def test_refresh_restarts_ttl(self):
+        self.cache.put("http://a", b"1", etag='"e1"')
+        entry = self.cache.get("http://a")
+        entry.stored_at -= 7200
+        self.assertFalse(self.cache.is_fresh(entry))
+
+        self.cache.refresh(entry)
+        refreshed = self.cache.get("http://a")
+        self.assertTrue(self.cache.is_fresh(refreshed))
+        self.assertEqual(refreshed.etag, '"e1"')
+
+    def test_size_cap_evicts_least_recently_used(self):
+        cache = ResponseCache(self.tmpdir.name, max_bytes=250)
+        for i, url in enumerate(["http://a", "http://b"]):
+            cache.put(url, b"x" * 100)
+            path = cache._paths(url)[0]
+            os.utime(path, (time.time() - 100 + i, time.time() - 100 + i))
+
+        cache.get("http://a")       # a becomes most recently used
+        cache.put("http://c", b"x" * 100)
+
+        self.assertIsNotNone(cache.get("http://a"))
+        self.assertIsNone(cache.get("http://b"))
+        self.assertIsNotNone(cache.get("http://c"))
+        self.assertLessEqual(cache.size(), 250)
+
+    def test_clear_and_delete(self):
+        self.cache.put("http://a", b"1")
+        self.cache.put("http://b", b"2")
+
+        self.cache.delete("http://a")
+        self.assertIsNone(self.cache.get("http://a"))
+
+        self.cache.clear()
+        self.assertIsNone(self.cache.get("http://b"))
+        self.assertEqual(self.cache.size(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
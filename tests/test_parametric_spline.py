@@ -1,4 +1,8 @@
+import os
+import pickle
+import tempfile
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 from scipy.interpolate import splev
@@ -896,6 +900,322 @@ class TestParametricUnivariateSplineEvalLogScale(unittest.TestCase):
         self.assertTrue(np.allclose(np.round(y, 2), y_round))
 
 
+class TestParametricUnivariateSplineCall(unittest.TestCase):
+
+    def setUp(self):
+        self.t = [0.0, 0.0, 0.0, 0.0, 0.27, 0.33, 0.33, 0.45, 1.0, 1.0, 1.0, 1.0]
+        self.cx = [0.11, 1.23, 1.88, 2.39, 3.16, 4.32, 6.03, 7.12]
+        self.cy = [0.05, 0.13, 0.24, 0.31, 0.23, 0.15, 0.07, 0.11]
+        self.spline = ParametricUnivariateSpline((self.t, self.cx, self.cy, 3))
+
+    def test_call_matches_splev(self):
+        tpoints = np.linspace(-0.1, 1.1, 101)
+        x, y = self.spline(tpoints)
+        x_ref, y_ref = splev(tpoints, (np.array(self.t), np.array([self.cx, self.cy]), 3))
+
+        np.testing.assert_allclose(x, x_ref, atol=1e-12)
+        np.testing.assert_allclose(y, y_ref, atol=1e-12)
+
+    def test_scalar_call(self):
+        x, y = self.spline(0.5)
+        x_ref, y_ref = splev(0.5, (np.array(self.t), np.array([self.cx, self.cy]), 3))
+
+        self.assertAlmostEqual(float(x), float(x_ref))
+        self.assertAlmostEqual(float(y), float(y_ref))
+
+    def test_eval_parametric_derivatives(self):
+        tpoints = np.linspace(0.0, 1.0, 57)
+        xy = self.spline.eval_parametric(tpoints, nu=2)
+
+        self.assertEqual(xy.shape, (3, len(tpoints), 2))
+        for nu in range(3):
+            x_ref, y_ref = splev(tpoints, (np.array(self.t), np.array([self.cx, self.cy]), 3), der=nu)
+            np.testing.assert_allclose(xy[nu, :, 0], x_ref, atol=1e-9)
+            np.testing.assert_allclose(xy[nu, :, 1], y_ref, atol=1e-9)
+
+            x_nu, y_nu = self.spline(tpoints, nu=nu)
+            np.testing.assert_allclose(x_nu, xy[nu, :, 0])
+
+
+class TestParametricUnivariateSplineInverseTable(unittest.TestCase):
+
+    def setUp(self):
+        t = [0, 0, 0, 0, 0.1654, 0.2535, 0.34, 0.4281, 0.5124, 0.5974, 0.6847, 0.7759, 0.8547, 1, 1, 1, 1]
+        cx = [1900.49, 1906.88, 1916.68, 1929.82, 1939.97, 1949.98, 1959.93, 1969.84, 1980.03, 1989.97, 2002.16, 2010.82, 2016.44]
+        cy = [1.84, 2.14, 1.44, 2.58, 2.1, 2.2, 2.9, 2.95, 2.78, 3.41, 4.35, 3.9, 4.3]
+        self.spline = ParametricUnivariateSpline((t, cx, cy, 3))
+
+    def test_eval_matches_root_solve(self):
+        x = np.linspace(1880, 2040, 500)
+        y_ref = self.spline.eval(x, extrapolate=True)
+
+        table = self.spline.build_inverse_table(n=32, tol=1e-10)
+        self.assertLessEqual(table.max_error, 1e-10)
+
+        y = self.spline.eval(x, extrapolate=True)
+        np.testing.assert_allclose(y, y_ref, atol=1e-9)
+
+        for xi, yi in zip(x[::25], y_ref[::25]):
+            self.assertAlmostEqual(self.spline.eval(xi, extrapolate=True), yi, places=9)
+
+    def test_out_of_range(self):
+        self.spline.build_inverse_table()
+
+        self.assertTrue(np.isnan(self.spline.eval(1850.0)))
+        self.assertTrue(np.isnan(self.spline.eval([1850.0, 2050.0])).all())
+
+    def test_rebuilt_after_coefficients_change(self):
+        self.spline.build_inverse_table()
+        table = self.spline.inverse_table
+
+        coeffs_x = self.spline.coeffs_x.copy()
+        coeffs_x[5] += 2.0
+        self.spline.coeffs_x = coeffs_x
+        x = np.linspace(1905, 2010, 50)
+        y = self.spline.eval(x)
+
+        self.assertIsNot(self.spline.inverse_table, table)
+        np.testing.assert_allclose(y, self.spline.eval(x, method="brentq"), atol=1e-9)
+
+    def test_table_version_set_on_construction(self):
+        restored = ParametricUnivariateSpline.from_bytes(self.spline.to_bytes())
+
+        for spline in (self.spline, restored):
+            # read directly, a missing attribute would rebuild all derived state
+            self.assertIn("_inverse_table_version", spline.__dict__)
+            self.assertIsNone(spline._inverse_table_version)
+        self.assertFalse(restored.spline_x.ppoly.c.flags.owndata)
+
+    def test_invalidate_after_in_place_edit(self):
+        self.spline.build_inverse_table()
+        table = self.spline.inverse_table
+        x = np.linspace(1905, 2010, 50)
+        y_ref = self.spline.eval(x)
+
+        self.spline.coeffs_x[5] += 2.0
+        self.assertIs(self.spline.inverse_table, table)
+
+        self.spline.invalidate()
+        y = self.spline.eval(x)
+
+        self.assertIsNot(self.spline.inverse_table, table)
+        self.assertFalse(np.allclose(y, y_ref))
+        np.testing.assert_allclose(y, self.spline.eval(x, method="brentq"), atol=1e-9)
+
+    def test_non_monotonic_curve(self):
+        spline = ParametricUnivariateSpline(([0, 0, 0.5, 1, 1], [0.0, 2.0, 1.0], [0.0, 1.0, 2.0], 1))
+
+        with self.assertRaises(ValueError):
+            spline.build_inverse_table()
+
+
+class TestParametricUnivariateSplineEvalCache(unittest.TestCase):
+
+    def setUp(self):
+        t = [0, 0, 0, 0, 0.1654, 0.2535, 0.34, 0.4281, 0.5124, 0.5974, 0.6847, 0.7759, 0.8547, 1, 1, 1, 1]
+        cx = [1900.49, 1906.88, 1916.68, 1929.82, 1939.97, 1949.98, 1959.93, 1969.84, 1980.03, 1989.97, 2002.16, 2010.82, 2016.44]
+        cy = [1.84, 2.14, 1.44, 2.58, 2.1, 2.2, 2.9, 2.95, 2.78, 3.41, 4.35, 3.9, 4.3]
+        self.spline = ParametricUnivariateSpline((t, cx, cy, 3))
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(self.spline.cache_info())
+        self.spline.cache_clear()
+
+    def test_cached_results(self):
+        self.spline.enable_cache(maxsize=8)
+        y_ref = self.spline.eval(1950.0)
+
+        self.assertEqual(self.spline.eval(1950.0), y_ref)
+        self.assertAlmostEqual(self.spline.eval(1950.0, method="newton"), y_ref, places=10)
+        info = self.spline.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 2, 2))
+
+        self.spline.cache_clear()
+        self.assertEqual(self.spline.cache_info().currsize, 0)
+
+    def test_arrays_are_not_cached(self):
+        self.spline.enable_cache()
+        self.spline.eval([1950.0, 1960.0])
+        self.assertEqual(self.spline.cache_info().currsize, 0)
+
+    def test_cleared_when_rebuilt(self):
+        self.spline.enable_cache()
+        self.spline.build_inverse_table()
+        y_ref = self.spline.eval(1950.0)
+
+        self.spline.coeffs_y = self.spline.coeffs_y + 1.0
+        self.assertAlmostEqual(self.spline.eval(1950.0), y_ref + 1.0, places=9)
+
+
+class TestParametricUnivariateSplineFitAccuracy(unittest.TestCase):
+
+    def setUp(self):
+        t = [0.0, 0.0, 0.0, 0.34, 0.61, 0.85, 1.0, 1.0, 1.0]
+        cx = [0.12, 2.67, 7.91, 12.55, 15.96, 17.48]
+        cy = [0.13, 0.44, 0.98, 1.41, 1.42, 1.28]
+        self.spline = ParametricUnivariateSpline((t, cx, cy, 2))
+
+        rng = np.random.default_rng(1)
+        x = np.linspace(0.5, 17.0, 1000)
+        self.points = np.column_stack([x, self.spline.eval(x) + rng.normal(0, 0.05, len(x))])
+        self.weights = rng.uniform(0.5, 1.5, len(x))
+
+    def test_errors(self):
+        residuals = self.points[:, 1] - self.spline.eval(self.points[:, 0])
+
+        self.assertAlmostEqual(self.spline.fit_accuracy(self.points, method="MSE"), np.mean(residuals**2))
+        self.assertAlmostEqual(self.spline.fit_accuracy(self.points, method="RMSE"), np.sqrt(np.mean(residuals**2)))
+        self.assertAlmostEqual(self.spline.fit_accuracy(self.points, method="MAE"), np.mean(np.abs(residuals)))
+        self.assertAlmostEqual(
+            self.spline.fit_accuracy(self.points, weights=self.weights, method="MAE"),
+            np.mean(self.weights*np.abs(residuals)))
+
+    def test_invalid_method(self):
+        with self.assertRaises(ValueError):
+            self.spline.fit_accuracy(self.points, method="R2")
+
+    def test_chunked_matches_full(self):
+        blocks = (self.points[i:i + 128] for i in range(0, len(self.points), 128))
+        weights = (self.weights[i:i + 128] for i in range(0, len(self.weights), 128))
+
+        for method in ["RMSE", "MSE", "MAE"]:
+            full = self.spline.fit_accuracy(self.points, method=method)
+            chunked = self.spline.fit_accuracy_chunked(np.array_split(self.points, 7), method=method)
+            self.assertAlmostEqual(chunked, full)
+
+        full = self.spline.fit_accuracy(self.points, weights=self.weights, method="RMSE")
+        chunked = self.spline.fit_accuracy_chunked(blocks, weights=weights, method="RMSE")
+        self.assertAlmostEqual(chunked, full)
+
+    def test_chunked_weights_must_match_blocks(self):
+        blocks = np.array_split(self.points, 4)
+        weights = np.array_split(self.weights, 4)
+
+        with self.assertRaises(ValueError):
+            self.spline.fit_accuracy_chunked(blocks, weights=weights[:3])
+        with self.assertRaises(ValueError):
+            self.spline.fit_accuracy_chunked(blocks[:3], weights=iter(weights))
+
+    def test_chunked_without_points(self):
+        with self.assertRaises(ValueError):
+            self.spline.fit_accuracy_chunked([])
+        with self.assertRaises(ValueError):
+            self.spline.fit_accuracy_chunked(iter([np.empty((0, 2))]), method="MAE")
+
+
+class TestParametricUnivariateSplineSerialization(unittest.TestCase):
+
+    def setUp(self):
+        t = [0.0, 0.0, 0.0, 0.34, 0.61, 0.85, 1.0, 1.0, 1.0]
+        cx = [0.12, 2.67, 7.91, 12.55, 15.96, 17.48]
+        cy = [0.13, 0.44, 0.98, 1.41, 1.42, 1.28]
+        self.spline = ParametricUnivariateSpline((t, cx, cy, 2), log_y=True)
+        self.x = np.linspace(-1.0, 19.0, 201)
+
+    def assertSplinesEqual(self, restored):
+        self.assertEqual(restored.k, self.spline.k)
+        self.assertEqual((restored.log_x, restored.log_y), (self.spline.log_x, self.spline.log_y))
+        np.testing.assert_array_equal(restored.knots, self.spline.knots)
+        np.testing.assert_array_equal(restored.coeffs_x, self.spline.coeffs_x)
+        np.testing.assert_array_equal(restored.coeffs_y, self.spline.coeffs_y)
+
+        np.testing.assert_array_equal(restored.eval(self.x, extrapolate=True),
+                                      self.spline.eval(self.x, extrapolate=True))
+        self.assertEqual(restored.eval(5.0), self.spline.eval(5.0))
+        np.testing.assert_array_equal(restored(np.linspace(0, 1, 11), nu=2),
+                                      self.spline(np.linspace(0, 1, 11), nu=2))
+
+    def test_bytes_roundtrip(self):
+        restored = ParametricUnivariateSpline.from_bytes(self.spline.to_bytes())
+        self.assertSplinesEqual(restored)
+
+    def test_save_load(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "curve.spl")
+            self.spline.save(path)
+
+            for mmap in (True, False):
+                restored = ParametricUnivariateSpline.load(path, mmap=mmap)
+                self.assertSplinesEqual(restored)
+                self.assertFalse(restored.spline_x.ppoly.c.flags.owndata)
+                del restored
+
+    def test_restored_spline_is_usable(self):
+        restored = ParametricUnivariateSpline.from_bytes(self.spline.to_bytes())
+
+        restored.build_inverse_table()
+        restored.enable_cache()
+        np.testing.assert_allclose(restored.eval(self.x[20:-20]), self.spline.eval(self.x[20:-20]), atol=1e-9)
+        self.assertEqual(restored.eval(5.0), restored.eval(5.0))
+        self.assertEqual(restored.cache_info().hits, 1)
+
+    def test_restored_coefficients_are_editable(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "curve.spl")
+            self.spline.save(path)
+            restored = ParametricUnivariateSpline.load(path)
+
+            restored.coeffs_y[1] += 0.1
+            restored.invalidate()
+            self.spline.coeffs_y[1] += 0.1
+            self.spline.invalidate()
+
+            np.testing.assert_array_equal(restored.eval(self.x, extrapolate=True),
+                                          self.spline.eval(self.x, extrapolate=True))
+            del restored
+
+
+class TestParametricUnivariateSplinePickle(unittest.TestCase):
+
+    def setUp(self):
+        t = [0.0, 0.0, 0.0, 0.34, 0.61, 0.85, 1.0, 1.0, 1.0]
+        cx = [0.12, 2.67, 7.91, 12.55, 15.96, 17.48]
+        cy = [0.13, 0.44, 0.98, 1.41, 1.42, 1.28]
+        self.spline = ParametricUnivariateSpline((t, cx, cy, 2), log_x=True)
+        self.x = np.linspace(1.0, 20.0, 101)
+
+    def test_roundtrip(self):
+        restored = pickle.loads(pickle.dumps(self.spline))
+
+        np.testing.assert_array_equal(restored.eval(self.x, extrapolate=True),
+                                      self.spline.eval(self.x, extrapolate=True))
+        self.assertEqual(restored.eval(5.0), self.spline.eval(5.0))
+        self.assertTrue(restored.log_x)
+
+    def test_state_is_compact_and_rebuilt_lazily(self):
+        state = self.spline.__getstate__()
+        self.assertNotIn("spline_x", state)
+        self.assertNotIn("knots_norm", state)
+
+        restored = pickle.loads(pickle.dumps(self.spline))
+        self.assertNotIn("spline_x", restored.__dict__)
+        restored.eval(5.0)
+        self.assertIn("spline_x", restored.__dict__)
+        np.testing.assert_array_equal(restored.knots_norm, self.spline.knots_norm)
+
+        with self.assertRaises(AttributeError):
+            restored.missing_attribute
+
+    def test_inverse_table_and_cache_settings(self):
+        self.spline.build_inverse_table(n=64)
+        self.spline.enable_cache(maxsize=16)
+        self.spline.eval(5.0)
+
+        restored = pickle.loads(pickle.dumps(self.spline))
+
+        self.assertIsNotNone(restored.inverse_table)
+        self.assertEqual(restored._inverse_table_params, (64, 1e-10))
+        self.assertEqual(restored.cache_info().maxsize, 16)
+        self.assertEqual(restored.cache_info().currsize, 0)
+        np.testing.assert_array_equal(restored.eval(self.x), self.spline.eval(self.x))
+
+    def test_process_pool(self):
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(self.spline.eval, [self.x[:50], self.x[50:]]))
+
+        np.testing.assert_array_equal(np.concatenate(results), self.spline.eval(self.x))
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -1,9 +1,10 @@
-import unittest, time
+import unittest, time, os, tempfile, pickle
 
 import numpy as np
 from scipy.interpolate import splev, bisplev
 
 from splinecloud_scipy import ParametricBivariateSpline
+from splinecloud_scipy.parametric_spline_surface import bspline_basis
 
 
 # =============================================================================
@@ -134,6 +135,31 @@ class TestConstruction(unittest.TestCase):
         self.assertTrue(np.all(self.surf._search_v >= v_min))
         self.assertTrue(np.all(self.surf._search_v <= v_max))
 
+    def test_dense_search_grid(self):
+        surf = ParametricBivariateSpline(self.tu, self.tv, self.cp, self.ku, self.kv, search_density=3)
+        self.assertEqual(surf._search_u.shape, (6,))
+        self.assertEqual(surf._search_x1.shape, (6, 6))
+        np.testing.assert_allclose(surf._search_u[1::3], [0.25, 0.75])
+
+        x1_vals = np.linspace(0.1, 0.9, 7)
+        x2_vals = np.linspace(0.1, 0.9, 5)
+        _, _, Y = surf.eval_grid(x1_vals, x2_vals)
+        _, _, Y_ref = self.surf.eval_grid(x1_vals, x2_vals)
+        np.testing.assert_allclose(Y, Y_ref, atol=1e-9)
+
+    def test_nearest_search_node_matches_brute_force(self):
+        surf = ParametricBivariateSpline(self.tu, self.tv, self.cp, self.ku, self.kv, search_density=4)
+        rng = np.random.default_rng(7)
+        x1, x2 = rng.uniform(-0.5, 1.5, 50), rng.uniform(-0.5, 1.5, 50)
+
+        u, v = surf._nearest_search_node(x1, x2)
+
+        dist2 = ((surf._search_x1.ravel()[None, :] - x1[:, None])**2 +
+                 (surf._search_x2.ravel()[None, :] - x2[:, None])**2)
+        best = np.argmin(dist2, axis=1)
+        np.testing.assert_allclose(dist2[np.arange(50), best],
+            dist2[np.arange(50), np.searchsorted(surf._search_u, u) * len(surf._search_v) + np.searchsorted(surf._search_v, v)])
+
     def test_asymmetric_degrees_construction(self):
         tu, tv, cp, ku, kv = get_asymmetric_surface_data()
         surf = ParametricBivariateSpline(tu, tv, cp, ku, kv)
@@ -346,6 +372,51 @@ class TestEvaluation(unittest.TestCase):
 # 4. GRID EVALUATION TESTS (eval_grid)
 # =============================================================================
 
+class TestEvalCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tu, self.tv, self.cp, self.ku, self.kv = get_simple_surface_data()
+        self.surf = ParametricBivariateSpline(self.tu, self.tv, self.cp, self.ku, self.kv)
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(self.surf.cache_info())
+        self.surf.eval_point(0.5, 0.5)
+        self.assertIsNone(self.surf.cache_info())
+
+    def test_eval_point_cached(self):
+        self.surf.enable_cache(maxsize=16)
+        y_ref = self.surf.eval_point(0.3, 0.6)
+
+        self.assertEqual(self.surf.eval_point(0.3, 0.6), y_ref)
+        self.assertEqual(self.surf.eval(0.3, 0.6), y_ref)
+        self.assertEqual(self.surf.cache_info().hits, 2)
+        self.assertEqual(self.surf.cache_info().misses, 1)
+
+    def test_flags_are_part_of_the_key(self):
+        self.surf.enable_cache()
+        self.assertIsNone(self.surf.eval_point(1.2, 0.5))
+        y = self.surf.eval_point(1.2, 0.5, extrapolate=True)
+        y_grad, (g1, g2) = self.surf.eval_point(1.2, 0.5, extrapolate=True, compute_gradients=True)
+
+        self.assertIsNotNone(y)
+        self.assertEqual(y_grad, y)
+        self.assertEqual(self.surf.cache_info().misses, 3)
+        self.assertEqual(self.surf.eval_point(1.2, 0.5, extrapolate=True, compute_gradients=True),
+                         (y_grad, (g1, g2)))
+
+    def test_lru_bound_and_clear(self):
+        self.surf.enable_cache(maxsize=4)
+        for x1 in np.linspace(0.1, 0.9, 10):
+            self.surf.eval_point(x1, 0.5)
+        self.assertEqual(self.surf.cache_info().currsize, 4)
+
+        self.surf.cache_clear()
+        self.assertEqual(self.surf.cache_info(), (0, 0, 4, 0))
+
+        self.surf.disable_cache()
+        self.assertIsNone(self.surf.cache_info())
+
+
 class TestGridEvaluation(unittest.TestCase):
 
     def setUp(self):
@@ -399,6 +470,99 @@ class TestGridEvaluation(unittest.TestCase):
         self.assertLess(duration, 30.0)
         self.assertEqual(X2.shape, (N, N))
 
+    def test_continuation_matches_default(self):
+        x1_vals = np.linspace(-0.2, 1.2, 41)
+        x2_vals = np.linspace(-0.1, 1.1, 23)
+        for flags in [dict(), dict(compute_gradients=True, extrapolate=True)]:
+            ref = self.surf.eval_grid(x1_vals, x2_vals, **flags)
+            new = self.surf.eval_grid(x1_vals, x2_vals, continuation=True, **flags)
+            for a, b in zip(ref[2:], new[2:]):
+                np.testing.assert_array_equal(np.isnan(a), np.isnan(b))
+                np.testing.assert_allclose(b, a, atol=1e-8)
+
+    def test_continuation_diagnostics(self):
+        x1_vals = np.linspace(0.05, 0.95, 30)
+        x2_vals = np.linspace(0.05, 0.95, 20)
+        cold, warm = {}, {}
+        self.surf.eval_grid(x1_vals, x2_vals, diagnostics=cold)
+        self.surf.eval_grid(x1_vals, x2_vals, continuation=True, diagnostics=warm)
+
+        self.assertEqual(warm['iterations'].shape, (30, 20))
+        self.assertEqual(warm['converged'], 600)
+        self.assertEqual(warm['total_iterations'], warm['iterations'].sum())
+        self.assertLess(warm['total_iterations'], cold['total_iterations'])
+        # warm-started nodes need a single Newton step plus the convergence check
+        self.assertEqual(np.median(warm['iterations']), 2)
+
+    def test_workers_match_serial(self):
+        x1_vals = np.linspace(-0.2, 1.2, 41)
+        x2_vals = np.linspace(-0.1, 1.1, 23)
+        for continuation in (False, True):
+            for flags in [dict(), dict(compute_gradients=True, extrapolate=True)]:
+                ref = self.surf.eval_grid(x1_vals, x2_vals, continuation=continuation, **flags)
+                new = self.surf.eval_grid(x1_vals, x2_vals, continuation=continuation,
+                                          workers=2, **flags)
+                self.assertEqual(len(new), len(ref))
+                for a, b in zip(ref, new):
+                    np.testing.assert_array_equal(b, a)
+
+    def test_invalid_workers(self):
+        x_vals = np.linspace(0.2, 0.8, 4)
+        for workers in (0, -2, 1.5, "2", True):
+            with self.assertRaises(ValueError):
+                self.surf.eval_grid(x_vals, x_vals, workers=workers)
+
+    def test_workers_diagnostics(self):
+        # tiles along the longer x2 axis
+        x1_vals = np.linspace(0.05, 0.95, 9)
+        x2_vals = np.linspace(0.05, 0.95, 30)
+        ref, new = {}, {}
+        self.surf.eval_grid(x1_vals, x2_vals, continuation=True, diagnostics=ref)
+        self.surf.eval_grid(x1_vals, x2_vals, continuation=True, diagnostics=new, workers=2)
+
+        self.assertEqual(set(new), set(ref))
+        np.testing.assert_array_equal(new['iterations'], ref['iterations'])
+        for key in ('total_iterations', 'mean_iterations', 'converged'):
+            self.assertEqual(new[key], ref[key])
+
+class TestScatteredEvaluation(unittest.TestCase):
+
+    def setUp(self):
+        tu, tv, cp, ku, kv = get_log_x1x2y_surface_data()
+        self.surf = ParametricBivariateSpline(tu, tv, cp, ku, kv, log_x1=True, log_x2=True, log_y=True)
+        rng = np.random.default_rng(5)
+        self.x1 = np.power(10, rng.uniform(0.8, 3.2, 40))
+        self.x2 = np.power(10, rng.uniform(-0.2, 2.2, 40))
+
+    def test_eval_points_vs_eval_point(self):
+        Y = self.surf.eval_points(self.x1, self.x2)
+        self.assertEqual(Y.shape, (40,))
+
+        for x1, x2, y in zip(self.x1, self.x2, Y):
+            y_ref = self.surf.eval_point(x1, x2)
+            if y_ref is None:
+                self.assertTrue(np.isnan(y))
+            else:
+                self.assertAlmostEqual(y, y_ref, places=8)
+
+    def test_eval_points_gradients_and_extrapolation(self):
+        Y, dYdX1, dYdX2 = self.surf.eval_points(
+            self.x1, self.x2, compute_gradients=True, extrapolate=True)
+        self.assertTrue(np.all(np.isfinite(Y)))
+
+        for i in range(0, 40, 5):
+            y_ref, (g1_ref, g2_ref) = self.surf.eval_point(
+                self.x1[i], self.x2[i], compute_gradients=True, extrapolate=True)
+            self.assertAlmostEqual(Y[i], y_ref, places=8)
+            self.assertAlmostEqual(dYdX1[i], g1_ref, places=8)
+            self.assertAlmostEqual(dYdX2[i], g2_ref, places=8)
+
+    def test_eval_points_broadcasting(self):
+        Y = self.surf.eval_points(self.x1[:6].reshape(2, 3), 20.0)
+        self.assertEqual(Y.shape, (2, 3))
+        np.testing.assert_allclose(Y.ravel(), self.surf.eval_points(self.x1[:6], np.full(6, 20.0)))
+
+
 # =============================================================================
 # 5. GRADIENT TESTS
 # =============================================================================
@@ -726,6 +890,64 @@ class TestExtrapolation(unittest.TestCase):
         self.assertIsNotNone(y_val)
         self.assertTrue(np.isfinite(y_val))
 
+    def test_batched_extrapolation_matches_pointwise(self):
+        x1 = np.array([1.1, -0.2, 0.5, 0.5, 1.3, -0.4, 2.5])
+        x2 = np.array([0.5, 0.3, -0.15, 1.2, 1.3, -0.3, 0.5])
+        for flags in [dict(), dict(limit_distance=True),
+                      dict(limit_consistency=True, consistency_threshold=0.2),
+                      dict(limit_distance=True, limit_consistency=True, limit_steepness=True)]:
+            y, (g1, g2) = self.surf._extrapolate_points(x1, x2, compute_gradients=True, **flags)
+            y_only = self.surf._extrapolate_points(x1, x2, **flags)
+
+            for i in range(len(x1)):
+                y_ref, (g1_ref, g2_ref) = self.surf._extrapolate_point(
+                    x1[i], x2[i], compute_gradients=True, **flags)
+                if y_ref is None:
+                    self.assertTrue(np.isnan(y[i]) and np.isnan(g1[i]) and np.isnan(y_only[i]))
+                else:
+                    self.assertAlmostEqual(y[i], y_ref, places=9)
+                    self.assertAlmostEqual(y_only[i], y_ref, places=9)
+                    self.assertAlmostEqual(g1[i], g1_ref, places=8)
+                    self.assertAlmostEqual(g2[i], g2_ref, places=8)
+
+    def test_batched_extrapolation_rejects_distant_points(self):
+        y = self.surf._extrapolate_points(np.array([1.05, 5.0]), np.array([0.5, 0.5]),
+                                          limit_distance=True)
+        self.assertTrue(np.isfinite(y[0]))
+        self.assertTrue(np.isnan(y[1]))
+
+    def test_boundary_polyline_is_cached(self):
+        self.assertIsNone(self.surf._boundary_tree)
+        self.surf.eval_point(1.1, 0.5, extrapolate=True)
+        tree = self.surf._boundary_tree
+        self.assertIsNotNone(tree)
+
+        self.surf.eval_point(-0.1, 0.5, extrapolate=True)
+        self.assertIs(self.surf._boundary_tree, tree)
+
+        # closed loop: every vertex lies on the parameter domain boundary
+        on_u = np.isin(self.surf._boundary_u, [0.0, 1.0])
+        on_v = np.isin(self.surf._boundary_v, [0.0, 1.0])
+        self.assertTrue((on_u | on_v).all())
+        self.assertEqual(len(np.unique(self.surf._boundary_edge)), 4)
+
+    def test_nearest_boundary_point_matches_dense_sampling(self):
+        t = np.linspace(0.0, 1.0, 4001)
+        u_dense = np.concatenate([np.zeros_like(t), np.ones_like(t), t, t])
+        v_dense = np.concatenate([t, t, np.zeros_like(t), np.ones_like(t)])
+        S_dense = self.surf.eval_uv(u_dense, v_dense)[0, 0]
+        x1_dense, x2_dense = S_dense[:, 0], S_dense[:, 1]
+
+        x1 = np.array([1.2, -0.3, 0.4, 0.7, 1.3])
+        x2 = np.array([0.3, 0.6, -0.2, 1.4, 1.2])
+        u, v, edge = self.surf._nearest_boundary_point(x1, x2)
+        S_b = self.surf.eval_uv(u, v)[0, 0]
+
+        dist = np.hypot(S_b[:, 0] - x1, S_b[:, 1] - x2)
+        dist_ref = np.hypot(x1_dense[:, None] - x1, x2_dense[:, None] - x2).min(axis=0)
+        np.testing.assert_allclose(dist, dist_ref, atol=1e-3)
+        self.assertEqual(edge.shape, x1.shape)
+
 # =============================================================================
 # 7. LOG-SCALE TESTS
 # =============================================================================
@@ -1150,5 +1372,192 @@ class TestLogX1X2YScale(unittest.TestCase):
             msg=f"y-boundary d2ydx22: interior={d2ydx22_int}, exterior={d2ydx22_ext}")
 
 
+# =============================================================================
+# 8. BATCHED EVALUATION TESTS (eval_uv)
+# =============================================================================
+
+class TestBatchedEvaluation(unittest.TestCase):
+
+    def setUp(self):
+        self.tu, self.tv, self.cp, self.ku, self.kv = get_asymmetric_surface_data()
+        self.surf = ParametricBivariateSpline(self.tu, self.tv, self.cp, self.ku, self.kv)
+        rng = np.random.default_rng(3)
+        self.u = np.concatenate([[0.0, 1.0, 0.5], rng.random(60)])
+        self.v = np.concatenate([[1.0, 0.0, 0.5], rng.random(60)])
+
+    def test_basis_partition_of_unity(self):
+        x = np.linspace(0.0, 1.0, 41)
+        for knots, k in [(self.tu, self.ku), (self.tv, self.kv)]:
+            span, ders = bspline_basis(knots, k, x, nu=2)
+            self.assertEqual(ders.shape, (3, len(x), k + 1))
+            np.testing.assert_allclose(ders[0].sum(axis=1), 1.0)
+            np.testing.assert_allclose(ders[1].sum(axis=1), 0.0, atol=1e-10)
+
+    def test_values_match_bisplev(self):
+        D = self.surf.eval_uv(self.u, self.v)
+        self.assertEqual(D.shape, (1, 1, len(self.u), 3))
+
+        for c, tck in enumerate([self.surf._tck_x1, self.surf._tck_x2, self.surf._tck_y]):
+            expected = [bisplev(ui, vi, tck) for ui, vi in zip(self.u, self.v)]
+            np.testing.assert_allclose(D[0, 0, :, c], expected, atol=1e-12)
+
+    def test_derivatives_match_bisplev(self):
+        D = self.surf.eval_uv(self.u, self.v, order=1)
+
+        for c, tck in enumerate([self.surf._tck_x1, self.surf._tck_x2, self.surf._tck_y]):
+            for du, dv in [(1, 0), (0, 1), (1, 1)]:
+                expected = [bisplev(ui, vi, tck, dx=du, dy=dv) for ui, vi in zip(self.u, self.v)]
+                np.testing.assert_allclose(D[du, dv, :, c], expected, atol=1e-10)
+
+    def test_chunked_evaluation(self):
+        D = self.surf.eval_uv(self.u, self.v, order=1)
+        D_chunked = self.surf.eval_uv(self.u, self.v, order=1, chunk_size=7)
+        np.testing.assert_allclose(D_chunked, D)
+
+    def test_second_derivatives_match_bisplev(self):
+        # ku = 3: d2/du2 is available from bisplev directly
+        _, _, d2S = self.surf.eval_uv_d2(self.u, self.v)
+
+        for c, tck in enumerate([self.surf._tck_x1, self.surf._tck_x2, self.surf._tck_y]):
+            expected = [bisplev(ui, vi, tck, dx=2, dy=0) for ui, vi in zip(self.u, self.v)]
+            np.testing.assert_allclose(d2S[0, :, c], expected, atol=1e-10)
+
+    def test_degree_two_second_derivative(self):
+        # kv = 2: d2/dv2 is piecewise constant, including at the domain edges
+        # where one-sided finite differences would be wrong
+        u = np.full(5, 0.4)
+        v = np.array([0.0, 0.2, 0.45, 0.55, 1.0])
+        _, dS, d2S = self.surf.eval_uv_d2(u, v)
+
+        eps = 1e-6
+        _, dS_p, _ = self.surf.eval_uv_d2(u, np.array([eps, 0.2 + eps, 0.45 + eps, 0.55 + eps, 1.0]))
+        _, dS_m, _ = self.surf.eval_uv_d2(u, np.array([0.0, 0.2 - eps, 0.45 - eps, 0.55 - eps, 1.0 - eps]))
+        steps = np.array([eps, 2*eps, 2*eps, 2*eps, eps])[:, None]
+        np.testing.assert_allclose(d2S[1], (dS_p[1] - dS_m[1]) / steps, atol=1e-5)
+
+        np.testing.assert_allclose(d2S[1, 0], d2S[1, 1])
+        np.testing.assert_allclose(d2S[1, 3], d2S[1, 4])
+
+    def test_eval_uv_d2_scalar_matches_array(self):
+        S, dS, d2S = self.surf.eval_uv_d2(self.u, self.v)
+
+        for i in [0, 1, 2, 10]:
+            S_i, dS_i, d2S_i = self.surf.eval_uv_d2(self.u[i], self.v[i])
+            self.assertEqual(S_i.shape, (3,))
+            np.testing.assert_allclose(S_i, S[i], atol=1e-12)
+            np.testing.assert_allclose(dS_i, dS[:, i], atol=1e-10)
+            np.testing.assert_allclose(d2S_i, d2S[:, i], atol=1e-10)
+
+    def test_linear_surface_has_zero_hessian(self):
+        tu = tv = np.array([0.0, 0.0, 0.5, 1.0, 1.0])
+        g = np.array([0.0, 0.5, 1.0])
+        cp = np.zeros((3, 3, 3))
+        cp[:, :, 0], cp[:, :, 2] = np.meshgrid(g, g, indexing='ij')
+        cp[:, :, 1] = cp[:, :, 0] + 2 * cp[:, :, 2]
+        surf = ParametricBivariateSpline(tu, tv, cp, 1, 1)
+
+        _, _, d2S = surf.eval_uv_d2(self.u, self.v)
+        np.testing.assert_array_equal(d2S[:2], 0.0)
+
+
+# =============================================================================
+# 9. SERIALIZATION TESTS
+# =============================================================================
+
+class TestSerialization(unittest.TestCase):
+
+    def setUp(self):
+        np.random.seed(3)
+        tu, tv, cp, ku, kv = get_log_x1x2y_surface_data()
+        self.surf = ParametricBivariateSpline(tu, tv, cp, ku, kv, log_x1=True, log_x2=True,
+                                              log_y=True, search_density=2)
+        self.x1 = np.logspace(0.7, 3.3, 13)
+        self.x2 = np.logspace(-0.3, 2.3, 11)
+
+    def assertSurfacesEqual(self, restored):
+        self.assertEqual((restored.ku, restored.kv), (self.surf.ku, self.surf.kv))
+        self.assertEqual(restored.search_density, 2)
+        np.testing.assert_array_equal(restored.w, self.surf.w)
+
+        for flags in (dict(), dict(extrapolate=True, compute_gradients=True)):
+            expected = self.surf.eval_grid(self.x1, self.x2, **flags)
+            result = restored.eval_grid(self.x1, self.x2, **flags)
+            np.testing.assert_array_equal(np.array(result), np.array(expected))
+
+        self.assertEqual(restored.eval_point(50.0, 3.0, extrapolate=True),
+                         self.surf.eval_point(50.0, 3.0, extrapolate=True))
+        np.testing.assert_array_equal(restored(0.3, 0.6), self.surf(0.3, 0.6))
+
+    def test_bytes_roundtrip(self):
+        restored = ParametricBivariateSpline.from_bytes(self.surf.to_bytes())
+        self.assertSurfacesEqual(restored)
+
+    def test_save_load(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "surface.spl")
+            self.surf.save(path)
+
+            for mmap in (True, False):
+                restored = ParametricBivariateSpline.load(path, mmap=mmap)
+                self.assertSurfacesEqual(restored)
+                self.assertFalse(restored._search_x1.flags.owndata)
+                # memory mapped arrays are read-only, copies read from the file are not
+                self.assertEqual(restored.w.flags.writeable, not mmap)
+                del restored
+
+    def test_kind_is_checked(self):
+        from splinecloud_scipy import ParametricUnivariateSpline
+
+        curve = ParametricUnivariateSpline(([0, 0, 1, 1], [0.0, 1.0], [0.0, 1.0], 1))
+        with self.assertRaises(ValueError):
+            ParametricBivariateSpline.from_bytes(curve.to_bytes())
+        with self.assertRaises(ValueError):
+            ParametricUnivariateSpline.from_bytes(self.surf.to_bytes())
+
+
+class TestPickle(unittest.TestCase):
+
+    def setUp(self):
+        np.random.seed(4)
+        self.surf = ParametricBivariateSpline(*get_asymmetric_surface_data(), search_density=2)
+        self.x1 = np.linspace(-0.2, 1.2, 9)
+        self.x2 = np.linspace(-0.1, 1.1, 7)
+
+    def test_roundtrip(self):
+        self.surf.eval_point(1.1, 0.5, extrapolate=True)   # builds the boundary polyline
+        restored = pickle.loads(pickle.dumps(self.surf))
+
+        for flags in (dict(), dict(extrapolate=True, compute_gradients=True)):
+            np.testing.assert_array_equal(
+                np.array(restored.eval_grid(self.x1, self.x2, **flags)),
+                np.array(self.surf.eval_grid(self.x1, self.x2, **flags)))
+        self.assertEqual(restored.eval_point(0.4, 0.6), self.surf.eval_point(0.4, 0.6))
+
+    def test_state_is_compact_and_rebuilt_lazily(self):
+        self.surf.enable_cache(maxsize=32)
+        state = self.surf.__getstate__()
+        self.assertNotIn("_search_tree", state)
+        self.assertNotIn("_tck_x1", state)
+
+        restored = pickle.loads(pickle.dumps(self.surf))
+        self.assertNotIn("_search_tree", restored.__dict__)
+        self.assertIsNone(restored._boundary_tree)
+        self.assertEqual(restored.cache_info().maxsize, 32)
+
+        restored.eval_point(0.4, 0.6)
+        self.assertIn("_search_tree", restored.__dict__)
+        np.testing.assert_array_equal(restored._search_x1, self.surf._search_x1)
+
+    def test_process_pool(self):
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(self.surf.eval_grid, [self.x1[:4], self.x1[4:]], [self.x2, self.x2]))
+
+        expected = self.surf.eval_grid(self.x1, self.x2)
+        for i in range(3):
+            np.testing.assert_array_equal(np.concatenate([r[i] for r in results]), expected[i])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,225 @@
+import unittest
+
+import numpy as np
+
+from splinecloud_scipy import ParametricUnivariateSpline, PPolyInvertible, IntervalIndex
+from splinecloud_scipy.piecewise_polynomial import real_roots, companion_roots
+
+
+def get_spline_cases():
+    return [
+        ([0.0, 0.0, 0.27, 0.31, 0.33, 0.45, 0.71, 1.0, 1.0],
+         [0.11, 1.23, 1.88, 2.39, 3.16, 4.32, 6.03],
+         [0.05, 0.13, 0.24, 0.31, 0.23, 0.15, 0.07], 1),
+        ([0.0, 0.0, 0.25, 0.5, 0.5, 0.75, 1.0, 1.0],
+         [0.11, 1.23, 1.88, 3.02, 4.14, 6.03],
+         [0.06, 0.13, 0.25, 0.24, 0.16, 0.07], 1),
+        ([0.0, 0.0, 0.0, 0.34, 0.61, 0.85, 1.0, 1.0, 1.0],
+         [0.12, 2.67, 7.91, 12.55, 15.96, 17.48],
+         [0.13, 0.44, 0.98, 1.41, 1.42, 1.28], 2),
+        ([0, 0, 0, 0, 0.31, 0.46, 1, 1, 1, 1],
+         [-2.96, -2.56, -1.95, -0.63, 0.29, 0.99],
+         [0.08, 0.12, 0.27, 0.88, 0.98, 0.99], 3),
+        ([0, 0, 0, 0, 0, 0.4, 1, 1, 1, 1, 1],
+         [0.1, 0.9, 2.2, 3.1, 4.8, 6.0],
+         [0.3, 0.5, 0.4, 0.7, 0.6, 0.2], 4),
+    ]
+
+
+def evalinv_pointwise(ppoly, xvalues, extrapolate=False):
+    tvalues = []
+    for xv in xvalues:
+        t = ppoly.evalinv(xv, extrapolate=extrapolate)
+        tvalues.append(np.nan if t is None else t)
+
+    return np.array(tvalues)
+
+
+class TestPPolyInvertibleEvalinvMany(unittest.TestCase):
+
+    def test_matches_evalinv(self):
+        for t, cx, cy, k in get_spline_cases():
+            spline = ParametricUnivariateSpline((t, cx, cy, k))
+            ppoly = spline.spline_x.ppoly
+            self.assertIsInstance(ppoly, PPolyInvertible)
+
+            x_start, x_end = ppoly.pintervals[0][0], ppoly.pintervals[-1][1]
+            x = np.concatenate([np.linspace(x_start, x_end, 501), ppoly.pintervals.ravel()])
+
+            t_ref = evalinv_pointwise(ppoly, x)
+            t_new = ppoly.evalinv_many(x)
+
+            np.testing.assert_array_equal(np.isnan(t_new), np.isnan(t_ref))
+            np.testing.assert_allclose(t_new, t_ref, atol=1e-10)
+
+    def test_extrapolate_matches_evalinv(self):
+        for t, cx, cy, k in get_spline_cases():
+            spline = ParametricUnivariateSpline((t, cx, cy, k))
+            ppoly = spline.spline_x.ppoly
+
+            x_start, x_end = ppoly.pintervals[0][0], ppoly.pintervals[-1][1]
+            x = np.linspace(x_start - (x_end - x_start), x_end + (x_end - x_start), 201)
+
+            t_ref = evalinv_pointwise(ppoly, x, extrapolate=True)
+            t_new = ppoly.evalinv_many(x, extrapolate=True)
+
+            np.testing.assert_array_equal(np.isnan(t_new), np.isnan(t_ref))
+            np.testing.assert_allclose(t_new, t_ref, atol=1e-10)
+
+    def test_extrapolate_non_monotonic(self):
+        # x(t) ends below its start, so points between x_end and x_start lie
+        # left of the first interval and right of the last one at once
+        spline = ParametricUnivariateSpline(([0, 0, 0, 1, 1, 1], [0.0, 3.0, -1.0], [0.0, 1.0, 2.0], 2))
+        ppoly = spline.spline_x.ppoly
+        x = np.array([-0.5, -0.9, -2.0, 0.5, 2.0])
+
+        t_ref = evalinv_pointwise(ppoly, x, extrapolate=True)
+        for method in ("analytic", "newton"):
+            t_new = ppoly.evalinv_many(x, extrapolate=True, method=method)
+            np.testing.assert_array_equal(np.isnan(t_new), np.isnan(t_ref))
+            np.testing.assert_allclose(t_new, t_ref, atol=1e-10)
+        self.assertTrue(np.isfinite(t_ref[:3]).all())
+
+        y_ref = [spline.eval(xv, extrapolate=True) for xv in x]
+        np.testing.assert_allclose(spline.eval(x, extrapolate=True), y_ref, atol=1e-10)
+
+    def test_out_of_range_without_extrapolation(self):
+        t, cx, cy, k = get_spline_cases()[2]
+        ppoly = ParametricUnivariateSpline((t, cx, cy, k)).spline_x.ppoly
+
+        t_new = ppoly.evalinv_many([-1.0, 100.0])
+        self.assertTrue(np.isnan(t_new).all())
+
+    def test_preserves_shape(self):
+        t, cx, cy, k = get_spline_cases()[3]
+        ppoly = ParametricUnivariateSpline((t, cx, cy, k)).spline_x.ppoly
+
+        x = np.linspace(-2.5, 0.5, 12).reshape(3, 4)
+        t_new = ppoly.evalinv_many(x)
+
+        self.assertEqual(t_new.shape, (3, 4))
+        np.testing.assert_allclose(ppoly(t_new.ravel()), x.ravel(), atol=1e-10)
+
+
+class TestPPolyInvertibleInversionMethods(unittest.TestCase):
+
+    def test_methods_agree(self):
+        for t, cx, cy, k in get_spline_cases():
+            ppoly = ParametricUnivariateSpline((t, cx, cy, k)).spline_x.ppoly
+
+            x_start, x_end = ppoly.pintervals[0][0], ppoly.pintervals[-1][1]
+            x = np.linspace(x_start - 0.5*(x_end - x_start), x_end + 0.5*(x_end - x_start), 301)
+
+            t_ref = ppoly.evalinv_many(x, extrapolate=True, method="brentq")
+            for method in ("newton", "analytic"):
+                t_new = ppoly.evalinv_many(x, extrapolate=True, method=method)
+                np.testing.assert_array_equal(np.isnan(t_new), np.isnan(t_ref))
+                np.testing.assert_allclose(t_new, t_ref, atol=1e-10)
+
+    def test_scalar_evalinv_method(self):
+        t, cx, cy, k = get_spline_cases()[3]
+        ppoly = ParametricUnivariateSpline((t, cx, cy, k)).spline_x.ppoly
+
+        for xv in [-2.5, -1.0, 0.5]:
+            t_ref = ppoly.evalinv(xv)
+            t_new = ppoly.evalinv(xv, method="analytic")
+            self.assertAlmostEqual(t_new, t_ref, places=10)
+
+        self.assertIsNone(ppoly.evalinv(10.0, method="analytic"))
+
+    def test_invalid_method(self):
+        t, cx, cy, k = get_spline_cases()[0]
+        ppoly = ParametricUnivariateSpline((t, cx, cy, k)).spline_x.ppoly
+
+        with self.assertRaises(ValueError):
+            ppoly.evalinv_many([1.0], method="secant")
+
+    def test_spline_eval_method(self):
+        t, cx, cy, k = get_spline_cases()[2]
+        spline = ParametricUnivariateSpline((t, cx, cy, k))
+
+        x = np.linspace(0.0, 18.0, 50)
+        y_ref = spline.eval(x, extrapolate=True, method="brentq")
+        y_new = spline.eval(x, extrapolate=True, method="analytic")
+
+        np.testing.assert_allclose(y_new, y_ref, atol=1e-10)
+
+
+class TestRealRoots(unittest.TestCase):
+
+    def test_cubic_three_real_roots(self):
+        coeffs = np.array([[1.0, -6.0, 11.0, -6.0]])  # (t-1)(t-2)(t-3)
+        roots = np.sort(real_roots(coeffs), axis=1)
+        np.testing.assert_allclose(roots, [[1.0, 2.0, 3.0]])
+
+    def test_cubic_single_real_root(self):
+        coeffs = np.array([[1.0, 0.0, 1.0, -2.0]])  # (t-1)(t^2+t+2)
+        roots = real_roots(coeffs)
+        np.testing.assert_allclose(roots[0, 0], 1.0)
+        self.assertTrue(np.isnan(roots[0, 1:]).all())
+
+    def test_quadratic_and_linear(self):
+        np.testing.assert_allclose(np.sort(real_roots(np.array([[2.0, -6.0, 4.0]]))), [[1.0, 2.0]])
+        self.assertTrue(np.isnan(real_roots(np.array([[1.0, 0.0, 1.0]]))).all())
+        np.testing.assert_allclose(real_roots(np.array([[2.0, -1.0]])), [[0.5]])
+
+    def test_matches_companion_roots(self):
+        rng = np.random.default_rng(0)
+        coeffs = rng.normal(size=(200, 4))
+        roots = np.sort(real_roots(coeffs), axis=1)
+        roots_ref = np.sort(companion_roots(coeffs), axis=1)
+        np.testing.assert_allclose(roots, roots_ref, atol=1e-8)
+
+
+def get_interval_linear(xvalue, intervals):
+    if xvalue < intervals[0][0]:
+        return 0
+    elif xvalue > intervals[-1][1]:
+        return len(intervals) - 1
+
+    for i, interval in enumerate(intervals):
+        if interval[0] <= xvalue < interval[1]:
+            return i
+
+    if xvalue == intervals[-1][1]:
+        return len(intervals) - 1
+
+
+class TestIntervalIndex(unittest.TestCase):
+
+    def test_lookup_matches_linear_scan(self):
+        cases = [
+            [[0.0, 1.0], [1.0, 2.5], [2.5, 2.5], [2.5, 4.0]],
+            [[0.0, 1.0], [1.5, 2.0], [2.0, 3.0]],  # gap
+            [[0.0, 2.0], [1.0, 3.0], [3.0, 4.0]],  # overlap
+        ]
+        x = np.concatenate([np.linspace(-1.0, 5.0, 241), [np.nan]])
+
+        for intervals in cases:
+            index = IntervalIndex(intervals)
+            expected = [get_interval_linear(xv, intervals) for xv in x]
+
+            self.assertEqual([index.lookup(xv) for xv in x], expected)
+            np.testing.assert_array_equal(
+                index.lookup_many(x), [-1 if n is None else n for n in expected])
+
+    def test_end_points(self):
+        index = IntervalIndex([[0.0, 1.0], [1.0, 2.0]])
+
+        self.assertEqual(index.lookup(0.0), 0)
+        self.assertEqual(index.lookup(1.0), 1)
+        self.assertEqual(index.lookup(2.0), 1)
+        self.assertEqual(index.lookup(-3.0), 0)
+        self.assertEqual(index.lookup(3.0), 1)
+        self.assertEqual(len(index), 2)
+
+    def test_ppoly_index(self):
+        t, cx, cy, k = get_spline_cases()[1]
+        ppoly = ParametricUnivariateSpline((t, cx, cy, k)).spline_x.ppoly
+
+        np.testing.assert_array_equal(ppoly.pinterval_index.intervals, ppoly.pintervals)
+        self.assertTrue(ppoly.pinterval_index.ordered)
+
+
+if __name__ == '__main__':
+    unittest.main()
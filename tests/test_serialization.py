@@ -0,0 +1,91 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from splinecloud_scipy import serialization
+
+
+class ContainerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.arrays = {
+            "a": np.arange(5.0),
+            "b": np.arange(12, dtype=np.int32).reshape(3, 4),
+            "c": np.asfortranarray(np.arange(6.0).reshape(2, 3)),
+            "empty": np.empty((0, 2)),
+        }
+        self.attrs = {"k": 3, "flag": True, "meta": {"labels": ["x", None]}}
+
+    def test_roundtrip(self):
+        data = serialization.pack("curve", "Curve", self.attrs, self.arrays)
+        class_name, attrs, arrays = serialization.unpack(data, "curve")
+
+        self.assertEqual(class_name, "Curve")
+        self.assertEqual(attrs, self.attrs)
+        self.assertEqual(sorted(arrays), sorted(self.arrays))
+        for name, array in self.arrays.items():
+            self.assertEqual(arrays[name].dtype, array.dtype)
+            np.testing.assert_array_equal(arrays[name], array)
+
+    def test_arrays_are_aligned_views(self):
+        data = serialization.pack("curve", "Curve", self.attrs, self.arrays)
+        _, _, arrays = serialization.unpack(data, "curve")
+
+        base = np.frombuffer(data, dtype=np.uint8).ctypes.data
+        for array in arrays.values():
+            self.assertFalse(array.flags.owndata)
+            self.assertFalse(array.flags.writeable)
+            self.assertEqual((array.ctypes.data - base) % serialization.ALIGNMENT, 0)
+
+    def test_memory_mapped_file(self):
+        data = serialization.pack("curve", "Curve", self.attrs, self.arrays)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "curve.spl")
+            serialization.save(path, data)
+
+            buffer = serialization.load(path)
+            self.assertIsInstance(buffer, np.memmap)
+            _, _, arrays = serialization.unpack(buffer, "curve")
+            np.testing.assert_array_equal(arrays["b"], self.arrays["b"])
+            del buffer, arrays
+
+    def test_concurrent_saves(self):
+        payloads = [bytes([i]) * 100000 for i in range(8)]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "curve.spl")
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(serialization.save, [path] * 8 * 4, payloads * 4))
+
+            with open(path, "rb") as f:
+                self.assertIn(f.read(), payloads)
+            self.assertEqual(os.listdir(tmpdir), ["curve.spl"])
+
+    def test_failed_save_removes_temp_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "curve.spl")
+            with self.assertRaises(TypeError):
+                serialization.save(path, object())
+
+            self.assertEqual(os.listdir(tmpdir), [])
+
+    def test_invalid_data(self):
+        data = serialization.pack("curve", "Curve", self.attrs, self.arrays)
+
+        with self.assertRaises(ValueError):
+            serialization.unpack(b"not a spline", "curve")
+        with self.assertRaises(ValueError):
+            serialization.unpack(data[:4], "curve")
+        with self.assertRaises(ValueError):
+            serialization.unpack(data, "surface")
+
+        header_len = int.from_bytes(data[8:12], "little")
+        header = data[12:12 + header_len].replace(b'"version": 1', b'"version": 99')
+        with self.assertRaises(ValueError):
+            serialization.unpack(data[:12] + header + data[12 + header_len:], "curve")
+
+
+if __name__ == '__main__':
+    unittest.main()
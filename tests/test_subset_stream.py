@@ -0,0 +1,87 @@
+import json
+import unittest
+
+import numpy as np
+
+from splinecloud_scipy import SubsetTable
+from splinecloud_scipy.subset_stream import read_subset_table
+
+
+def get_chunks(payload, size):
+    body = json.dumps(payload).encode('utf-8')
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+class ReadSubsetTableTests(unittest.TestCase):
+
+    def assertTablesEqual(self, table, expected):
+        self.assertEqual(table.columns, expected.columns)
+        self.assertEqual(sorted(table.numeric), sorted(expected.numeric))
+        for name in expected.columns:
+            self.assertEqual(table[name].dtype, expected[name].dtype)
+            self.assertEqual(table[name].tolist(), expected[name].tolist())
+
+    def test_matches_from_json(self):
+        rng = np.random.default_rng(0)
+        payload = {
+            'uid': 'sbt_1234567890ab',
+            'meta': {'tags': ["a", {"b": None}], 'n': 3},
+            'table': {
+                'x': {str(i): v for i, v in enumerate(rng.normal(size=300).tolist())},
+                'y': (rng.normal(size=300) * 1e-200).tolist(),
+                'n': list(range(300)),
+                'label': ["é \"{}\", ]".format(i) for i in range(300)],
+                'mixed': [1.5, None, "n/a"] * 100,
+            },
+            'name': "subset",
+        }
+        expected = SubsetTable.from_json(payload['table'])
+
+        # chunk boundaries fall inside numbers, strings and multi-byte characters
+        for size in (1, 2, 7, 64, 4096):
+            self.assertTablesEqual(read_subset_table(get_chunks(payload, size)), expected)
+
+    def test_numeric_strings_and_nulls(self):
+        table = read_subset_table(get_chunks({'table': {'x': [1, "2.5", None, True]}}, 3))
+
+        self.assertTrue(table.is_numeric)
+        np.testing.assert_array_equal(table['x'], [1.0, 2.5, np.nan, 1.0])
+
+    def test_non_finite_values(self):
+        # NaN and Infinity tokens are decoded as by json.loads
+        body = b'{"table": {"x": [1.0, NaN, Infinity, -Infinity, 2], "y": {"0": NaN, "1": -Infinity, "2": 0, "3": Infinity, "4": NaN}, "label": ["a", NaN, "b", -Infinity, "c"]}}'
+        expected = SubsetTable.from_json(json.loads(body)['table'])
+
+        for size in (1, 3, 4096):
+            table = read_subset_table([body[i:i + size] for i in range(0, len(body), size)])
+            self.assertEqual(table.columns, expected.columns)
+            self.assertEqual(sorted(table.numeric), ['x', 'y'])
+            for name in ('x', 'y'):
+                np.testing.assert_array_equal(table[name], expected[name])
+            self.assertEqual(table['label'][[0, 2, 4]].tolist(), ['a', 'b', 'c'])
+            self.assertTrue(np.isnan(table['label'][1]))
+            self.assertEqual(table['label'][3], -np.inf)
+
+    def test_whitespace(self):
+        body = b'{ "table" : {\n  "x" : [ 1 ,\t2 , 3e2 ] ,\n  "y" : { "0" : -1 , "1" : 0.5 , "2" : 7 }\n } }'
+        table = read_subset_table([body[i:i + 5] for i in range(0, len(body), 5)])
+
+        self.assertEqual(table.to_array().tolist(), [[1.0, -1.0], [2.0, 0.5], [300.0, 7.0]])
+
+    def test_empty_table(self):
+        self.assertEqual(len(read_subset_table([b'{"table": {}}'])), 0)
+        self.assertEqual(read_subset_table([b'{"table": {"x": []}}'])['x'].shape, (0,))
+
+    def test_invalid_payloads(self):
+        with self.assertRaises(KeyError):
+            read_subset_table([b'{"uid": "x"}'])
+        with self.assertRaises(ValueError):
+            read_subset_table([b'{"table": {"x": [1, 2], "y": [1]}}'])
+        with self.assertRaises(ValueError):
+            read_subset_table([b'{"table": {"x": [1, 2'])
+        with self.assertRaises(ValueError):
+            read_subset_table([b'{"table": {"x": 5}}'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+
+import numpy as np
+
+from splinecloud_scipy import SubsetTable
+
+
+class SubsetTableTests(unittest.TestCase):
+
+    def test_numeric_columns(self):
+        table = SubsetTable.from_json({
+            'x': {'0': 1, '1': 2, '2': 3.5},
+            'y': [4.0, 5, "6"],
+        })
+
+        self.assertEqual(table.columns, ['x', 'y'])
+        self.assertTrue(table.is_numeric)
+        self.assertEqual(len(table), 3)
+        self.assertEqual(table['x'].dtype, np.float64)
+        self.assertEqual(table['y'].tolist(), [4.0, 5.0, 6.0])
+
+        array = table.to_array()
+        self.assertEqual(array.dtype, np.float64)
+        self.assertEqual(array.tolist(), [[1.0, 4.0], [2.0, 5.0], [3.5, 6.0]])
+
+    def test_text_columns_kept_separately(self):
+        table = SubsetTable.from_json({
+            'name': ["a", "b"],
+            'x': [1.0, 2.0],
+            'mixed': [1.0, "n/a"],
+        })
+
+        self.assertEqual(sorted(table.numeric), ['x'])
+        self.assertEqual(sorted(table.text), ['mixed', 'name'])
+        self.assertEqual(table['x'].dtype, np.float64)
+        self.assertEqual(table['mixed'].tolist(), [1.0, "n/a"])
+
+        array = table.to_array()
+        self.assertEqual(array.dtype, object)
+        self.assertEqual(array.tolist(), [["a", 1.0, 1.0], ["b", 2.0, "n/a"]])
+
+    def test_to_records(self):
+        table = SubsetTable.from_json({'name': ["a", "b"], 'x': [1.0, 2.0]})
+        records = table.to_records()
+
+        self.assertEqual(records.dtype.names, ('name', 'x'))
+        self.assertEqual(records.dtype['x'], np.float64)
+        self.assertEqual(records['name'].tolist(), ["a", "b"])
+        self.assertEqual(records[1]['x'], 2.0)
+
+    def test_astuple(self):
+        columns, array = SubsetTable.from_json({'x': [1.0], 'y': [2.0]}).astuple()
+
+        self.assertEqual(columns, ['x', 'y'])
+        self.assertEqual(array.tolist(), [[1.0, 2.0]])
+
+    def test_empty_and_ragged(self):
+        table = SubsetTable.from_json({})
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.to_array().shape, (0, 0))
+
+        with self.assertRaises(ValueError):
+            SubsetTable.from_json({'x': [1.0, 2.0], 'y': [1.0]})
+
+
+if __name__ == '__main__':
+    unittest.main()